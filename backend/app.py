@@ -80,6 +80,38 @@ def check_migrations_and_connections():
         conn.close()
 
 
+def check_event_manager(mode):
+    from src.core.config import get_async_event_manager_class
+
+    # Fail before the server starts rather than in the lifespan startup
+    if mode == "asgi":
+        get_async_event_manager_class()
+
+
+def start_event_handlers():
+    """
+    Start the event handlers in the serving process.
+
+    With the reloader the server runs in a child process, in-process event
+    managers only reach handlers started next to the server.
+    """
+    from src.core.config import get_event_manager
+    from src.data.handlers import EventHandler
+
+    event_handler = EventHandler(manager=get_event_manager())
+    event_handler.start_handlers()
+
+
+def sync_assets():
+    from django.core.management import call_command
+
+    logger.info("Syncing assets with the bucket.")
+    try:
+        call_command("sync_assets")
+    except Exception as e:
+        logger.error("Error while syncing assets: %s", e)
+
+
 def start_server(mode, addr, port, use_reloader, threading, protocol):
     if use_reloader:
         if mode == "wsgi":
@@ -97,6 +129,8 @@ def start_server(mode, addr, port, use_reloader, threading, protocol):
 
 def run_wsgi_server(addr, port, threading, protocol):
     try:
+        # In ASGI mode handlers run as coroutines started by the server lifespan
+        start_event_handlers()
         handler = get_wsgi_handler()
         run(
             addr,
@@ -176,9 +210,6 @@ def parse_arguments():
 
 
 def run_auto():
-    from src.core.config import get_storage
-    from src.data.handlers import EventHandler, ImageFileHandler, TemplateHandler
-    from src.data.managers import EventManager
     from src.users.repositories import UserRepository
     from src.users.schemas import SuperUserCreateSchema
     from src.users.services import UserService
@@ -206,16 +237,7 @@ def run_auto():
         logger.info(
             "Superuser already exists",
         )
-    image_handler = ImageFileHandler(storage=get_storage())
-    image_handler.upload_image(
-        filename="register.png",
-    )
-
-    template_handler = TemplateHandler(storage=get_storage())
-    template_handler.upload_template("register-mail.html")
-
-    event_handler = EventHandler(manager=EventManager())
-    event_handler.start_handlers()
+    sync_assets()
 
 
 def register():
@@ -229,6 +251,7 @@ def register():
 
     if os.getenv("RUN_MAIN") != "true":
         check_settings()
+        check_event_manager(mode)
         check_migrations_and_connections()
         run_auto()
 
@@ -8,7 +8,7 @@ from ninja_extra import NinjaExtraAPI, api_controller, permissions, route
 from ninja_extra.exceptions import APIException
 
 from src.auth.controllers import AuthController
-from src.common.controllers import CommonController
+from src.common.controllers import CommonController, MetricsController
 from src.common.responses import ORJSONResponse
 from src.core.adds import ApiExtra
 from src.core.interceptors import AuthBearer
@@ -36,6 +36,7 @@ api.register_controllers(
     *[
         APIController,
         CommonController,
+        MetricsController,
         UsersController,
         AuthController,
         FileController,
@@ -8,7 +8,12 @@ from src.auth.throttles import RegisterMailThrottle, RegisterThrottle
 from src.common import permissions as common_permissions
 from src.common import schemas as common_schemas
 from src.common.responses import ORJSONResponse
-from src.core.config import get_phone_handler, get_storage
+from src.core.config import (
+    get_cache_storage,
+    get_event_manager,
+    get_phone_handler,
+    get_storage,
+)
 from src.core.interceptors import AuthBearer
 from src.data.handlers import (
     AvatarFileHandler,
@@ -17,8 +22,7 @@ from src.data.handlers import (
     ImageFileHandler,
     RegistrationEmailHandler,
 )
-from src.data.managers import EventManager, MailManager
-from src.data.storages import RedisStorage
+from src.data.managers import MailManager
 from src.users.repositories import ProfileRepository, UserRepository
 from src.users.services import ProfileService, UserService
 
@@ -32,8 +36,8 @@ from src.users.services import ProfileService, UserService
 class AuthController:
     user_repository = UserRepository()
     profile_repository = ProfileRepository()
-    cache_handler = CacheHandler(pool_storage=RedisStorage())
-    event_handler = EventHandler(manager=EventManager())
+    cache_handler = CacheHandler(pool_storage=get_cache_storage(), namespace="auth")
+    event_handler = EventHandler(manager=get_event_manager())
     image_handler = ImageFileHandler(storage=get_storage())
 
     service = AuthService(
@@ -3,6 +3,7 @@ from datetime import timedelta
 from logging import getLogger
 from typing import TYPE_CHECKING, Optional, cast
 
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
 from django.db import transaction
 from ninja_extra.exceptions import APIException
@@ -121,7 +122,7 @@ class AuthService:
             add_path = "/auth/register/mail/" + token
             register_url = get_backend_url(add_path=add_path)
             logger.info("Register token: %s created", token)
-            image = self.image.get_image("register.webp")
+            image = self.image.get_image("register.png")
             transaction.on_commit(
                 lambda: send_registration_email_task.apply_async(
                     kwargs={
@@ -174,18 +175,16 @@ class AuthService:
                 birth_date=register_schema.birth_date,
             )
 
-            self.event.publish(
-                event_name="user_created",
-                event_data={
-                    "user_id": user_id,
-                    "profile_create_schema": profile_create_schema.model_dump(),
-                },
-            )
-            logger.info("Publishing user_created event for user ID: %s", user_id)
+            logger.info("Requesting user_created event for user ID: %s", user_id)
 
-            # Wait for profile creation to complete
-            event_data = self.event.receive(
-                "profile_created", timeout=2, with_subscription=True
+            # Wait for the profile_created reply correlated with this request
+            event_data = self.event.request(
+                event_name="user_created",
+                event_data=users_schemas.UserCreatedEventSchema(
+                    user_id=user_id,
+                    profile_create_schema=profile_create_schema,
+                ),
+                timeout=settings.EVENT_REQUEST_TIMEOUT,
             )
             if event_data and event_data.get("is_created"):
                 profile_data = event_data.get("profile_data")
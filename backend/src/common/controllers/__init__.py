@@ -1,5 +1,7 @@
 from src.common.controllers.common_controller import CommonController
+from src.common.controllers.metrics_controller import MetricsController
 
 __all__ = [
     "CommonController",
+    "MetricsController",
 ]
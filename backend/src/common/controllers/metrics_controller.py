@@ -0,0 +1,14 @@
+from django.http import HttpResponse
+from ninja.constants import NOT_SET
+from ninja_extra import api_controller, http_get
+
+from src.common.permissions import IsStaffOrMetricsToken
+from src.data.metrics import export_metrics
+
+
+@api_controller(auth=NOT_SET, permissions=[IsStaffOrMetricsToken], tags=["metrics"])
+class MetricsController:
+    @http_get("/metrics", include_in_schema=False)
+    def metrics(self):
+        content, content_type = export_metrics()
+        return HttpResponse(content, content_type=content_type)
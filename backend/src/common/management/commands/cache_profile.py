@@ -0,0 +1,154 @@
+from collections import Counter, defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from redis.exceptions import RedisError, ResponseError
+
+from src.data.clients import RedisClient
+
+TTL_BUCKETS = (
+    (60, "< 1 min"),
+    (60 * 60, "< 1 hour"),
+    (60 * 60 * 24, "< 1 day"),
+    (60 * 60 * 24 * 7, "< 1 week"),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Sample the Redis key space with SCAN and report the biggest key prefixes, "
+        "the TTL distribution and keys without expiry"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--match", default="*", help="SCAN MATCH pattern")
+        parser.add_argument(
+            "--sample",
+            type=int,
+            default=10_000,
+            help="Maximum number of keys to inspect",
+        )
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=2,
+            help="Number of ':' separated segments grouped as a prefix",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Number of prefixes to report",
+        )
+        parser.add_argument(
+            "--batch",
+            type=int,
+            default=500,
+            help="Keys per SCAN and pipeline round trip",
+        )
+
+    def handle(self, *args, **options):
+        redis = RedisClient(decode_responses=False).redis
+        sizes: Counter = Counter()
+        counts: Counter = Counter()
+        persistent: Counter = Counter()
+        ttls: Counter = Counter()
+        sampled = 0
+
+        try:
+            total = redis.dbsize()
+            batch: list[bytes] = []
+            for key in redis.scan_iter(match=options["match"], count=options["batch"]):
+                batch.append(key)
+                if len(batch) >= options["batch"]:
+                    sampled += self._inspect(redis, batch, options, sizes, counts, persistent, ttls)
+                    batch = []
+                if sampled + len(batch) >= options["sample"]:
+                    break
+            if batch:
+                sampled += self._inspect(redis, batch, options, sizes, counts, persistent, ttls)
+        except RedisError as error:
+            raise CommandError(f"Error while sampling Redis keys: {error}")
+
+        if not sampled:
+            self.stdout.write("No keys matched")
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sampled {sampled} of {total} keys, "
+                f"{sum(sizes.values()) / 1024:.1f} KiB in the sample"
+            )
+        )
+
+        self.stdout.write("\nBiggest prefixes")
+        for prefix, size in sizes.most_common(options["top"]):
+            self.stdout.write(
+                f"  {prefix:<50} {counts[prefix]:>8} keys "
+                f"{size / 1024:>10.1f} KiB "
+                f"{size / counts[prefix]:>8.0f} B/key "
+                f"{persistent[prefix]:>8} without expiry"
+            )
+
+        self.stdout.write("\nTTL distribution")
+        for _, label in (*TTL_BUCKETS, (None, ">= 1 week"), (None, "no expiry")):
+            if ttls[label]:
+                self.stdout.write(
+                    f"  {label:<12} {ttls[label]:>8} keys "
+                    f"{ttls[label] / sampled:>7.1%}"
+                )
+
+        if persistent:
+            self.stdout.write(self.style.WARNING("\nPrefixes with keys without expiry"))
+            for prefix, count in persistent.most_common(options["top"]):
+                self.stdout.write(f"  {prefix:<50} {count:>8} keys")
+
+    @staticmethod
+    def _prefix(key: bytes, depth: int) -> str:
+        segments = key.decode(errors="replace").split(":")
+        if len(segments) <= depth:
+            # Keep the last segment out of the prefix, it is usually an id
+            segments = segments[:-1] or segments
+        return ":".join(segments[:depth]) + (":*" if len(segments) > 1 else "")
+
+    @staticmethod
+    def _ttl_label(ttl: int) -> str:
+        if ttl < 0:
+            return "no expiry"
+        for limit, label in TTL_BUCKETS:
+            if ttl < limit:
+                return label
+        return ">= 1 week"
+
+    def _inspect(
+        self,
+        redis,
+        keys: list[bytes],
+        options: dict,
+        sizes: Counter,
+        counts: Counter,
+        persistent: Counter,
+        ttls: Counter,
+    ) -> int:
+        with redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.memory_usage(key)
+                pipe.ttl(key)
+            results = pipe.execute(raise_on_error=False)
+
+        inspected = 0
+        by_prefix: dict[str, list[int]] = defaultdict(list)
+        for key, size, ttl in zip(keys, results[::2], results[1::2]):
+            if isinstance(ttl, ResponseError) or ttl == -2:
+                # Expired between SCAN and TTL
+                continue
+            prefix = self._prefix(key, options["depth"])
+            by_prefix[prefix].append(size if isinstance(size, int) else 0)
+            ttls[self._ttl_label(ttl)] += 1
+            if ttl == -1:
+                persistent[prefix] += 1
+            inspected += 1
+
+        for prefix, prefix_sizes in by_prefix.items():
+            sizes[prefix] += sum(prefix_sizes)
+            counts[prefix] += len(prefix_sizes)
+        return inspected
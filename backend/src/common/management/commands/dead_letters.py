@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.core.config import get_event_manager
+from src.data.managers import DeadLetterManager
+
+
+class Command(BaseCommand):
+    help = "List, replay or purge events from the dead-letter stream"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "action",
+            choices=["list", "replay", "purge"],
+            help="Action to run on dead letters",
+        )
+        parser.add_argument("--event", help="Only dead letters of this event")
+        parser.add_argument(
+            "--id",
+            dest="ids",
+            action="append",
+            help="Dead letter id, can be repeated",
+        )
+        parser.add_argument(
+            "--count",
+            type=int,
+            help="Maximum number of dead letters to list or replay",
+        )
+
+    def handle(self, *args, **options):
+        dead_letters = DeadLetterManager()
+        action = options["action"]
+
+        try:
+            if action == "list":
+                self._list(dead_letters, options)
+            elif action == "replay":
+                replayed = dead_letters.replay(
+                    manager=get_event_manager(),
+                    event_name=options["event"],
+                    ids=options["ids"],
+                    count=options["count"],
+                )
+                self.stdout.write(self.style.SUCCESS(f"Replayed {replayed} events"))
+            else:
+                purged = dead_letters.purge(
+                    event_name=options["event"],
+                    ids=options["ids"],
+                )
+                self.stdout.write(
+                    self.style.SUCCESS(f"Purged {purged} dead letters")
+                )
+        except Exception as error:
+            raise CommandError(f"Error while processing dead letters: {error}")
+
+    def _list(self, dead_letters: DeadLetterManager, options: dict) -> None:
+        listed = 0
+        for dead_letter in dead_letters.iter(
+            event_name=options["event"],
+            count=options["count"],
+        ):
+            listed += 1
+            failed_at = datetime.fromtimestamp(dead_letter.failed_at)
+            self.stdout.write(
+                f"{dead_letter.id} {dead_letter.envelope.type} "
+                f"{dead_letter.handler} attempts={dead_letter.attempts} "
+                f"failed_at={failed_at:%Y-%m-%d %H:%M:%S}\n"
+                f"    {dead_letter.error}\n"
+                f"    {dead_letter.envelope.payload}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"{listed} of {dead_letters.count()} dead letters")
+        )
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from src.core.config import get_storage
+from src.data.handlers import MediaUrlResolver
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Upload the media, templates and static files changed since the last sync, "
+        "compared by sha256 against a manifest kept in the bucket"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.SYNC_ASSETS_WORKERS,
+            help="Files hashed and uploaded at once",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Upload every file, ignoring the manifest",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the changed files without uploading them",
+        )
+
+    def handle(self, *args, **options):
+        storage = get_storage()
+        files = self._local_files()
+        manifest_key = settings.SYNC_ASSETS_MANIFEST
+
+        try:
+            data = None if options["force"] else storage.get_object_data(manifest_key)
+            manifest: dict[str, str] = json.loads(data) if data else {}
+        except Exception as error:
+            raise CommandError(f"Error while reading the asset manifest: {error}")
+
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            digests = dict(zip(files, executor.map(self._hash, files.values())))
+            unreadable = [key for key, digest in digests.items() if digest is None]
+            hashes = {key: digest[0] for key, digest in digests.items() if digest}
+            changed = [key for key, digest in hashes.items() if manifest.get(key) != digest]
+            if options["dry_run"]:
+                for key in changed:
+                    self.stdout.write(f"  {key}")
+                self.stdout.write(f"{len(changed)} of {len(files)} files changed")
+                return
+
+            uploaded = dict(
+                zip(
+                    changed,
+                    executor.map(
+                        lambda key: self._upload(
+                            storage, key, files[key], fingerprint=digests[key][1]
+                        ),
+                        changed,
+                    ),
+                )
+            )
+
+        failed_uploads = [key for key, ok in uploaded.items() if not ok]
+        failed = [*unreadable, *failed_uploads]
+
+        indexed = [
+            key
+            for key, ok in uploaded.items()
+            if ok and key.split("/", 1)[0] in settings.MEDIA_INDEX_FOLDERS
+        ]
+        resolver = MediaUrlResolver()
+        for key in indexed:
+            resolver.mark(key, exists=True)
+
+        # Failed files keep their previous hash, they are retried by the next sync
+        new_manifest = {
+            **{key: manifest[key] for key in failed if key in manifest},
+            **{key: hashes[key] for key in hashes if key not in failed},
+        }
+        if new_manifest != manifest and not storage.upload_stream(
+            full_object_key=manifest_key,
+            data=json.dumps(new_manifest, indent=2, sort_keys=True).encode(),
+            content_type="application/json",
+        ):
+            raise CommandError("Error while uploading the asset manifest")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synced {len(changed) - len(failed_uploads)} of {len(files)} files, "
+                f"{len(hashes) - len(changed)} unchanged"
+            )
+        )
+        if failed:
+            self.stdout.write(self.style.ERROR("Failed"))
+            for key in failed:
+                self.stdout.write(f"  {key}")
+
+    @staticmethod
+    def _local_files() -> dict[str, Path]:
+        """Return the local files by object key, skipping hidden ones."""
+        directories = [
+            *((prefix, Path(path)) for prefix, path in settings.SYNC_ASSETS_DIRS.items()),
+            *((settings.STATIC_PATH, Path(path)) for path in settings.STATICFILES_DIRS),
+        ]
+
+        files: dict[str, Path] = {}
+        for prefix, directory in directories:
+            for root, dirs, filenames in os.walk(directory):
+                dirs[:] = [name for name in dirs if not name.startswith(".")]
+                for filename in filenames:
+                    if filename.startswith("."):
+                        continue
+                    path = Path(root, filename)
+                    files[f"{prefix}/{path.relative_to(directory).as_posix()}"] = path
+        return files
+
+    @staticmethod
+    def _fingerprint(stat: os.stat_result) -> str:
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    @classmethod
+    def _hash(cls, path: Path) -> Optional[tuple[str, str]]:
+        """
+        Return the sha256 of a file with the size and mtime it was hashed at,
+        ``None`` when it cannot be read.
+        """
+        try:
+            with open(path, "rb") as file:
+                fingerprint = cls._fingerprint(os.fstat(file.fileno()))
+                return hashlib.file_digest(file, "sha256").hexdigest(), fingerprint
+        except OSError as error:
+            logger.error("Error while hashing %s: %s", path, error)
+            return None
+
+    @classmethod
+    def _upload(cls, storage, key: str, path: Path, fingerprint: str) -> bool:
+        """
+        Upload a file, failing when it cannot be read or changed since it was
+        hashed, so the manifest never records a hash of other bytes.
+        """
+        try:
+            with open(path, "rb") as file:
+                stat = os.fstat(file.fileno())
+                if cls._fingerprint(stat) != fingerprint:
+                    logger.error("%s changed since it was hashed", path)
+                    return False
+                uploaded = storage.upload_stream(
+                    full_object_key=key,
+                    data=file,
+                    length=stat.st_size,
+                    content_type=mimetypes.guess_type(path.name)[0],
+                    fingerprint=fingerprint,
+                )
+            if uploaded and cls._fingerprint(os.stat(path)) != fingerprint:
+                logger.error("%s changed while it was uploaded", path)
+                return False
+            return uploaded
+        except OSError as error:
+            logger.error("Error while uploading %s: %s", path, error)
+            return False
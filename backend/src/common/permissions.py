@@ -1,3 +1,6 @@
+import hmac
+
+from django.conf import settings
 from ninja_extra.exceptions import APIException
 from ninja_extra.permissions.common import BasePermission
 
@@ -16,3 +19,16 @@ class LoggedOutOnly(BasePermission):
             raise APIException("Already logged in")
 
         return True
+
+
+class IsStaffOrMetricsToken(BasePermission):
+    def has_permission(self, request, *args, **kwargs):
+        if request.user.is_authenticated and request.user.is_staff:
+            return True
+
+        token = settings.METRICS_TOKEN
+        scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+        if token and scheme.lower() == "bearer":
+            return hmac.compare_digest(credentials.encode(), token.encode())
+
+        return False
@@ -7,6 +7,7 @@ For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 """
 
+import logging
 import os
 
 from django.core.asgi import get_asgi_application
@@ -16,5 +17,53 @@ os.environ.setdefault(
     os.getenv("DJANGO_SETTINGS_MODULE", "src.core.settings.dev"),
 )
 
+logger = logging.getLogger(__name__)
 
-application = get_asgi_application()
+
+class LifespanApplication:
+    """
+    Wraps the Django ASGI application with lifespan events.
+
+    Django does not handle the ``lifespan`` scope, so startup and shutdown
+    are handled here to run the event handlers as coroutines on the server
+    event loop.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.event_handler = None
+
+    async def startup(self) -> None:
+        from src.core.config import get_async_event_manager
+        from src.data.handlers import AsyncEventHandler
+
+        self.event_handler = AsyncEventHandler(manager=get_async_event_manager())
+        await self.event_handler.start_handlers()
+
+    async def shutdown(self) -> None:
+        if self.event_handler:
+            await self.event_handler.stop_handlers()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "lifespan":
+            return await self.app(scope, receive, send)
+
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as error:
+                    logger.exception("ASGI startup failed: %s", error)
+                    await send(
+                        {"type": "lifespan.startup.failed", "message": str(error)}
+                    )
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+application = LifespanApplication(get_asgi_application())
@@ -5,7 +5,13 @@ from typing import TYPE_CHECKING, Optional
 from django.conf import settings
 
 if TYPE_CHECKING:
-    from src.data.interfaces import ICacheHandler, IPhoneHandler
+    from src.data.interfaces import (
+        IAsyncEventManager,
+        ICacheHandler,
+        ICacheStorage,
+        IEventManager,
+        IPhoneHandler,
+    )
     from src.users.interfaces import IProfileRepository
 
 os.environ.setdefault(
@@ -43,6 +49,51 @@ def get_storage():
     return storage
 
 
+def get_cache_storage() -> "ICacheStorage":
+    from django.utils.module_loading import import_string
+
+    storage_class = import_string(settings.CACHE_STORAGE)
+    return storage_class()
+
+
+def get_shared_cache_storage() -> "ICacheStorage":
+    from django.utils.module_loading import import_string
+
+    storage_class = import_string(settings.CACHE_SHARED_STORAGE)
+    return storage_class()
+
+
+def get_repository_cache_storage() -> "ICacheStorage":
+    from django.utils.module_loading import import_string
+
+    storage_class = import_string(settings.CACHE_REPOSITORY_STORAGE)
+    return storage_class()
+
+
+def get_event_manager() -> "IEventManager":
+    from django.utils.module_loading import import_string
+
+    manager_class = import_string(settings.EVENT_MANAGER)
+    return manager_class()
+
+
+def get_async_event_manager_class() -> type["IAsyncEventManager"]:
+    from django.core.exceptions import ImproperlyConfigured
+    from django.utils.module_loading import import_string
+
+    manager_path = settings.EVENT_ASYNC_MANAGERS.get(settings.EVENT_MANAGER)
+    if manager_path is None:
+        raise ImproperlyConfigured(
+            f"EVENT_MANAGER {settings.EVENT_MANAGER} has no asyncio counterpart "
+            "in EVENT_ASYNC_MANAGERS, it cannot be used in ASGI mode"
+        )
+    return import_string(manager_path)
+
+
+def get_async_event_manager() -> "IAsyncEventManager":
+    return get_async_event_manager_class()()
+
+
 def get_phone_handler(
     cache: Optional["ICacheHandler"] = None,
     repository: Optional["IProfileRepository"] = None,
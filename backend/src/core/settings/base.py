@@ -41,6 +41,141 @@ WORKING_HANDLERS = [
     "src.users.controllers.UsersController.profile_service.handle_user_created",
 ]
 
+# "src.data.managers.EventManager" - fire-and-forget Redis PUBLISH/SUBSCRIBE
+# "src.data.managers.StreamEventManager" - durable Redis Streams consumer groups
+# "src.data.managers.InProcessEventManager" - single process, no Redis round trips,
+#   WSGI only, events published by Celery workers never reach the handlers
+EVENT_MANAGER = "src.data.managers.EventManager"
+# Asyncio counterparts of the event managers, used by the ASGI event handlers.
+# Managers without one cannot run in ASGI mode.
+EVENT_ASYNC_MANAGERS = {
+    "src.data.managers.EventManager": "src.data.managers.AsyncEventManager",
+}
+EVENT_STREAM_GROUP = "olivin"
+EVENT_STREAM_MAXLEN = 10_000
+EVENT_STREAM_CLAIM_IDLE = 60_000
+# Per-process reply streams "stream:replies.*" are trimmed to the max length,
+# expire once unused for the TTL in seconds and are deleted at exit
+EVENT_REPLY_STREAM_MAXLEN = 1_000
+EVENT_REPLY_STREAM_TTL = 60 * 60
+# "src.data.codecs.OrjsonCodec" - JSON envelopes
+# "src.data.codecs.MsgpackCodec" - binary envelopes, requires msgpack
+EVENT_CODEC = "src.data.codecs.OrjsonCodec"
+# Seconds between refreshes of events:subscribers:* diagnostic keys
+EVENT_SUBSCRIPTION_HEARTBEAT = 30
+
+# Worker threads per event type, events without an entry use the default
+EVENT_HANDLER_WORKERS = {
+    "user_created": 4,
+}
+EVENT_HANDLER_DEFAULT_WORKERS = 1
+EVENT_HANDLER_QUEUE_SIZE = 100
+# "block" - receiver waits for a free slot (backpressure)
+# "drop_newest" / "drop_oldest" - discard an event when the queue is full
+EVENT_HANDLER_OVERFLOW = "block"
+EVENT_HANDLER_POLL_TIMEOUT = 1.0
+EVENT_HANDLER_DRAIN_TIMEOUT = 10.0
+
+# Retries per event type before an event is moved to the dead-letter stream
+EVENT_HANDLER_RETRIES = {
+    # Request/reply events, the requester does not wait for retries
+    "user_created": 0,
+}
+EVENT_HANDLER_DEFAULT_RETRIES = 3
+EVENT_HANDLER_RETRY_BACKOFF = 0.5
+EVENT_HANDLER_RETRY_BACKOFF_MAX = 10.0
+EVENT_DEAD_LETTER_STREAM = "stream:dead_letters"
+EVENT_DEAD_LETTER_MAXLEN = 100_000
+
+# Seconds a requester waits for the reply, and handlers wait for Celery task
+# results. Keep the task timeout below the request timeout, so the handler
+# replies before the requester gives up.
+EVENT_REQUEST_TIMEOUT = 3
+EVENT_TASK_TIMEOUT = 2
+
+# CACHE
+# "src.data.storages.RedisStorage" - shared by every process and node
+# "src.data.storages.ShardedRedisStorage" - spread over REDIS_NODES
+# "src.data.storages.InMemoryStorage" - single process, no Redis round trips
+CACHE_STORAGE = "src.data.storages.RedisStorage"
+# State every process must see: the media index, signed media URLs and
+# resumable uploads. Disabled when set to a per-process storage.
+CACHE_SHARED_STORAGE = "src.data.storages.RedisStorage"
+# InMemoryStorage budget and seconds between sweeps of expired keys
+CACHE_MEMORY_MAX_ENTRIES = 100_000
+CACHE_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+CACHE_MEMORY_SWEEP_INTERVAL = 60
+# CacheHandler keys are "<prefix>:<namespace>:<key>", tag sets "<prefix>-tags:<tag>"
+CACHE_KEY_PREFIX = "cache"
+# Keys unlinked per SCAN/SSCAN batch when clearing a namespace or a tag
+CACHE_SCAN_BATCH = 500
+# Compression of cached values above the threshold in bytes:
+# "zlib", "lz4" (requires lz4), "zstd" (requires zstandard) or None
+CACHE_COMPRESSION = "zlib"
+CACHE_COMPRESSION_THRESHOLD = 1024
+# Namespaces served from an in-process LRU first, with the local TTL in seconds
+CACHE_LOCAL_NAMESPACES = {
+    "auth": 300,
+}
+CACHE_LOCAL_MAX_ENTRIES = 10_000
+CACHE_LOCAL_MAX_BYTES = 16 * 1024 * 1024
+CACHE_INVALIDATION_CHANNEL = "cache:invalidate"
+# CacheHandler.get_or_set, seconds a loader may hold the per-key lock, extra
+# lifetime of entries served stale while refreshing and the XFetch beta
+# (above 1 favours earlier refreshes)
+CACHE_LOCK_TIMEOUT = 10
+CACHE_STALE_TTL = 60
+CACHE_XFETCH_BETA = 1.0
+# Repository read-through cache, bump the version to drop every snapshot.
+# Rows are invalidated by whichever process saves them, Celery workers
+# included, so the storage must be shared, the cache is disabled otherwise.
+CACHE_REPOSITORY_STORAGE = CACHE_SHARED_STORAGE
+CACHE_REPOSITORY_VERSION = 1
+CACHE_REPOSITORY_TTL = 300
+CACHE_REPOSITORY_NEGATIVE_TTL = 30
+
+# MEDIA INDEX
+# Media URLs are built from BUCKET_URL, existence is read from an index of the
+# object keys in the "media" cache namespace. Uploads and deletes update it,
+# the reconcile task refreshes it from a bucket listing of the folders. Entries
+# not refreshed for MEDIA_INDEX_TTL seconds expire.
+MEDIA_INDEX_FOLDERS = ["avatars", "products", "media"]
+MEDIA_INDEX_RECONCILE_INTERVAL = 60 * 60
+MEDIA_INDEX_TTL = 3 * MEDIA_INDEX_RECONCILE_INTERVAL
+# Signed media URLs are valid for MEDIA_SIGNED_URL_EXPIRE seconds (at most 7
+# days on S3 and MinIO) and served from the cache while they stay valid for at
+# least MEDIA_SIGNED_URL_MARGIN more seconds
+MEDIA_SIGNED_URL_EXPIRE = 60 * 60 * 24 * 7
+MEDIA_SIGNED_URL_MARGIN = 60 * 60 * 24
+
+# MULTIPART UPLOADS
+# Objects above MULTIPART_THRESHOLD bytes are uploaded in parts of at least
+# MULTIPART_PART_SIZE bytes (5 MiB minimum), MULTIPART_WORKERS at once. Upload
+# ids of resumable uploads are kept for MULTIPART_STATE_TTL seconds, buckets
+# created by the clients abort incomplete uploads after the same delay in days.
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_WORKERS = 4
+MULTIPART_PART_RETRIES = 3
+MULTIPART_STATE_TTL = 60 * 60 * 24
+
+# ASSETS
+# Local directories synced to bucket prefixes by the sync_assets command, the
+# static directories are synced to STATIC_PATH. The manifest object holds the
+# sha256 of every synced file.
+SYNC_ASSETS_DIRS = {
+    "media": BASE_DIR / "media",
+    "templates": BASE_DIR / "templates",
+}
+SYNC_ASSETS_MANIFEST = "manifests/assets.json"
+SYNC_ASSETS_WORKERS = 8
+
+# METRICS
+# /metrics is served to staff users and to requests with the bearer token,
+# disabled for tokens when None. Run every process with the same wiped
+# PROMETHEUS_MULTIPROC_DIR, otherwise only the serving process is exported.
+METRICS_TOKEN = None
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
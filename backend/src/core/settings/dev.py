@@ -26,6 +26,8 @@ DJANGO_ALLOW_ASYNC_UNSAFE = True
 DJANGO_HOST = os.getenv("DJANGO_HOST", "localhost")
 DJANGO_PORT = os.getenv("DJANGO_PORT", "8000")
 
+METRICS_TOKEN = os.getenv("METRICS_TOKEN") or None
+
 # DATABASE
 DATABASES = {
     "default": {
@@ -59,6 +61,15 @@ REDIS_DB = os.getenv("REDIS_DB", 0)
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "some_redis_password")
 REDIS_EXPIRE = os.getenv("REDIS_EXPIRE", 60 * 60 * 24)
 REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+# Shared connection pools, see src.data.clients.RedisPoolRegistry
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+REDIS_POOL_TIMEOUT = int(os.getenv("REDIS_POOL_TIMEOUT", 5))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))
+REDIS_SOCKET_KEEPALIVE = True
+# Cache nodes of ShardedRedisStorage as "host:port/db", comma separated,
+# events and Celery keep using REDIS_HOST
+REDIS_NODES = [node for node in os.getenv("REDIS_NODES", "").split(",") if node]
+REDIS_RING_REPLICAS = int(os.getenv("REDIS_RING_REPLICAS", 160))
 
 # LOGGING
 # ------------------------------------------------------------------------------
@@ -125,6 +136,10 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": 30.0,
         "args": (10, 2),
     },
+    "reconcile-media-index": {
+        "task": "src.data.tasks.reconcile_media_index",
+        "schedule": float(MEDIA_INDEX_RECONCILE_INTERVAL),
+    },
 }
 CELERY_SETTINGS = "django.conf:settings"
 
@@ -155,8 +170,9 @@ if DEBUG_ON:
     AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY", "")
     AWS_SECRET_KEY = os.getenv("AWS_SECRET_KEY", "")
     AWS_REGION_NAME = os.getenv("AWS_REGION_NAME", "")
-    STATIC_URL = f"https://{BUCKET_NAME}.s3.amazonaws.com/{STATIC_PATH}/"
-    MEDIA_URL = f"https://{BUCKET_NAME}.s3.amazonaws.com/{MEDIA_PATH}/"
+    BUCKET_URL = f"https://{BUCKET_NAME}.s3.amazonaws.com/"
+    STATIC_URL = f"{BUCKET_URL}{STATIC_PATH}/"
+    MEDIA_URL = f"{BUCKET_URL}{MEDIA_PATH}/"
 
 if not DEBUG_ON:
     MINIO_ROOT_USER = os.getenv("MINIO_ROOT_USER", "minioadmin")
@@ -168,8 +184,9 @@ if not DEBUG_ON:
         if MINIO_HOST == "localhost" and MINIO_PORT == "9000"
         else f"http://{MINIO_HOST}:{MINIO_PORT}/"
     )
-    STATIC_URL = f"{MINIO_URL}{BUCKET_NAME}/{STATIC_PATH}/"
-    MEDIA_URL = f"{MINIO_URL}{BUCKET_NAME}/{MEDIA_PATH}/"
+    BUCKET_URL = f"{MINIO_URL}{BUCKET_NAME}/"
+    STATIC_URL = f"{BUCKET_URL}{STATIC_PATH}/"
+    MEDIA_URL = f"{BUCKET_URL}{MEDIA_PATH}/"
 
 STATICFILES_STORAGE = "src.core.storage.get_storage"
 static_dir = os.path.join(BASE_DIR, "static")
@@ -3,12 +3,17 @@ from src.data.clients.celery_client import CeleryClient
 from src.data.clients.mail_client import MailClient
 from src.data.clients.minio_client import MinioClient
 from src.data.clients.redis_client import RedisClient
+from src.data.clients.redis_pool import RedisPoolRegistry
+from src.data.clients.sharded_redis_client import HashRing, ShardedRedisClient
 from src.data.clients.vonage_client import VonageClient
 
 __all__ = [
     "VonageClient",
     "MailClient",
     "RedisClient",
+    "RedisPoolRegistry",
+    "ShardedRedisClient",
+    "HashRing",
     "CeleryClient",
     "MinioClient",
     "AmazonClient",
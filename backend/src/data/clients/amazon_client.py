@@ -56,6 +56,26 @@ class AmazonClient(IClient):
                     "LocationConstraint": settings.AWS_REGION_NAME,
                 },
             )
+            self._set_lifecycle()
+
+    def _set_lifecycle(self) -> None:
+        from src.data.storages.multipart import ABORT_RULE_ID, get_abort_days
+
+        self.amazon_s3.put_bucket_lifecycle_configuration(
+            Bucket=self.bucket_name,
+            LifecycleConfiguration={
+                "Rules": [
+                    {
+                        "ID": ABORT_RULE_ID,
+                        "Status": "Enabled",
+                        "Filter": {"Prefix": ""},
+                        "AbortIncompleteMultipartUpload": {
+                            "DaysAfterInitiation": get_abort_days(),
+                        },
+                    }
+                ]
+            },
+        )
 
     def connect(
         self,
@@ -4,6 +4,8 @@ from typing import Optional
 
 from django.conf import settings
 from minio import Minio, S3Error
+from minio.commonconfig import ENABLED, Filter
+from minio.lifecycleconfig import AbortIncompleteMultipartUpload, LifecycleConfig, Rule
 
 from src.data.interfaces.client.abstract_client import IClient
 
@@ -55,6 +57,28 @@ class MinioClient(IClient):
     def _load_basic_buckets(self) -> None:
         if not self.minio.bucket_exists(bucket_name=self.bucket_name):
             self.minio.make_bucket(bucket_name=self.bucket_name)
+            self._set_lifecycle()
+
+    def _set_lifecycle(self) -> None:
+        from src.data.storages.multipart import ABORT_RULE_ID, get_abort_days
+
+        self.minio.set_bucket_lifecycle(
+            bucket_name=self.bucket_name,
+            config=LifecycleConfig(
+                [
+                    Rule(
+                        ENABLED,
+                        rule_filter=Filter(prefix=""),
+                        rule_id=ABORT_RULE_ID,
+                        abort_incomplete_multipart_upload=(
+                            AbortIncompleteMultipartUpload(
+                                days_after_initiation=get_abort_days()
+                            )
+                        ),
+                    )
+                ]
+            ),
+        )
 
     def connect(
         self,
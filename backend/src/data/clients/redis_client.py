@@ -4,6 +4,7 @@ from typing import Optional
 from django.conf import settings
 from redis import Redis
 
+from src.data.clients.redis_pool import RedisPoolRegistry
 from src.data.interfaces import IClient
 
 os.environ.setdefault(
@@ -32,16 +33,19 @@ class RedisClient(IClient):
 
     def connect(self, **kwargs) -> Redis:
         self.redis = Redis(
-            host=self.host,
-            port=self.port,
-            password=self.password,
-            db=self.db,
-            decode_responses=self.decode_responses,
+            connection_pool=RedisPoolRegistry.get_pool(
+                host=self.host,
+                port=self.port,
+                password=self.password,
+                db=self.db,
+                decode_responses=self.decode_responses,
+            ),
             **kwargs,
         )
 
         return self.redis
 
     def disconnect(self, *args, **kwargs) -> None:
+        # The shared pool stays open for the other clients of the process
         if self.redis:
             self.redis.close()
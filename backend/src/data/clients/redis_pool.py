@@ -0,0 +1,123 @@
+import asyncio
+import os
+import threading
+from typing import Optional
+
+from django.conf import settings
+from redis import BlockingConnectionPool
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool
+
+
+class RedisPoolRegistry:
+    """
+    Process-wide registry of Redis connection pools.
+
+    Clients connecting to the same host, port, database and decode mode share
+    one blocking pool, so a process keeps a bounded number of sockets and
+    hot paths reuse warm connections. The registry is emptied in forked
+    children, Celery prefork workers never reuse the parent's sockets.
+
+    Methods:
+        get_pool(host, port, password, db, decode_responses)
+        get_async_pool(host, port, password, db, decode_responses)
+        reset()
+
+    Usage:
+        pool = RedisPoolRegistry.get_pool(host="localhost", port=6379, db=0)
+        redis = Redis(connection_pool=pool)
+    """
+
+    _pools: dict[tuple, BlockingConnectionPool] = {}
+    _async_pools: dict[tuple, AsyncBlockingConnectionPool] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _pool_kwargs() -> dict:
+        return {
+            "max_connections": settings.REDIS_MAX_CONNECTIONS,
+            "timeout": settings.REDIS_POOL_TIMEOUT,
+            "health_check_interval": settings.REDIS_HEALTH_CHECK_INTERVAL,
+            "socket_keepalive": settings.REDIS_SOCKET_KEEPALIVE,
+        }
+
+    @staticmethod
+    def _key(
+        host: str,
+        port: int | str,
+        db: int | str,
+        decode_responses: bool,
+    ) -> tuple:
+        return os.getpid(), host, int(port), int(db), decode_responses
+
+    @classmethod
+    def get_pool(
+        cls,
+        host: Optional[str] = None,
+        port: Optional[int | str] = None,
+        password: Optional[str] = None,
+        db: Optional[int | str] = None,
+        decode_responses: bool = True,
+    ) -> BlockingConnectionPool:
+        host = host or settings.REDIS_HOST
+        port = port or settings.REDIS_PORT
+        db = db if db is not None else settings.REDIS_DB
+        key = cls._key(host, port, db, decode_responses)
+        pool = cls._pools.get(key)
+        if pool is not None:
+            return pool
+
+        with cls._lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = BlockingConnectionPool(
+                    host=host,
+                    port=int(port),
+                    password=password or settings.REDIS_PASSWORD,
+                    db=int(db),
+                    decode_responses=decode_responses,
+                    **cls._pool_kwargs(),
+                )
+                cls._pools[key] = pool
+            return pool
+
+    @classmethod
+    def get_async_pool(
+        cls,
+        host: Optional[str] = None,
+        port: Optional[int | str] = None,
+        password: Optional[str] = None,
+        db: Optional[int | str] = None,
+        decode_responses: bool = True,
+    ) -> AsyncBlockingConnectionPool:
+        """Return the pool for the running event loop, async sockets are loop bound."""
+        host = host or settings.REDIS_HOST
+        port = port or settings.REDIS_PORT
+        db = db if db is not None else settings.REDIS_DB
+        key = (
+            *cls._key(host, port, db, decode_responses),
+            id(asyncio.get_running_loop()),
+        )
+        with cls._lock:
+            pool = cls._async_pools.get(key)
+            if pool is None:
+                pool = AsyncBlockingConnectionPool(
+                    host=host,
+                    port=int(port),
+                    password=password or settings.REDIS_PASSWORD,
+                    db=int(db),
+                    decode_responses=decode_responses,
+                    **cls._pool_kwargs(),
+                )
+                cls._async_pools[key] = pool
+            return pool
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget pools inherited from the parent process without closing them."""
+        cls._pools = {}
+        cls._async_pools = {}
+        cls._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=RedisPoolRegistry.reset)
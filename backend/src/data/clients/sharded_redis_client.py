@@ -0,0 +1,184 @@
+import bisect
+import hashlib
+import threading
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from redis import Redis
+
+from src.data.clients.redis_pool import RedisPoolRegistry
+from src.data.interfaces import IClient
+
+
+class HashRing:
+    """
+    Consistent hash ring with virtual nodes.
+
+    Every node is placed on the ring ``replicas`` times, a key belongs to
+    the first node point after its hash. Adding or removing a node only
+    moves the keys of that node. Keys sharing a ``{hash tag}`` always land
+    on the same node, as in Redis Cluster.
+
+    Attributes:
+        replicas (int): Virtual nodes per node.
+        nodes (list[str]): Node names on the ring.
+
+    Methods:
+        add_node(node: str)
+        remove_node(node: str)
+        get_node(key: Any)
+
+    Usage:
+        ring = HashRing(["redis-1:6379/0", "redis-2:6379/0"])
+        ring.get_node("cache:auth:{user:1}:token")
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 160):
+        self.replicas = replicas
+        self.nodes: list[str] = []
+        self._points: list[int] = []
+        self._owners: list[str] = []
+        for node in nodes:
+            self.add_node(node)
+
+    @staticmethod
+    def _hash(value: bytes) -> int:
+        return int.from_bytes(hashlib.md5(value).digest()[:8], "big")
+
+    @staticmethod
+    def hash_tag(key: Any) -> bytes:
+        """Return the part of the key that is hashed, the hash tag if present."""
+        key = key if isinstance(key, bytes) else str(key).encode()
+        start = key.find(b"{")
+        if start != -1:
+            end = key.find(b"}", start + 1)
+            if end > start + 1:
+                return key[start + 1 : end]
+        return key
+
+    def add_node(self, node: str) -> None:
+        if node in self.nodes:
+            return
+        self.nodes.append(node)
+        for replica in range(self.replicas):
+            point = self._hash(f"{node}#{replica}".encode())
+            index = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, node)
+
+    def remove_node(self, node: str) -> None:
+        if node not in self.nodes:
+            return
+        self.nodes.remove(node)
+        kept = [
+            (point, owner)
+            for point, owner in zip(self._points, self._owners)
+            if owner != node
+        ]
+        self._points = [point for point, _ in kept]
+        self._owners = [owner for _, owner in kept]
+
+    def get_node(self, key: Any) -> str:
+        if not self._points:
+            raise ValueError("Hash ring has no nodes")
+        index = bisect.bisect(self._points, self._hash(self.hash_tag(key)))
+        return self._owners[index % len(self._owners)]
+
+
+class ShardedRedisClient(IClient):
+    """
+    Redis client spreading keys over several nodes.
+
+    Nodes are ``host:port/db`` strings, ``REDIS_NODES`` by default, each
+    with its own shared pool from ``RedisPoolRegistry``. Keys are routed
+    with a ``HashRing``. Multi-key operations are grouped per node by the
+    callers, see ``ShardedRedisStorage``. ``redis`` is the first node, used
+    for what cannot be sharded, like PubSub.
+
+    Attributes:
+        nodes (dict[str, Redis]): Redis instance per node.
+        ring (HashRing): Key to node mapping.
+        redis (Redis): Instance of the first node.
+
+    Methods:
+        get_client(key: Any)
+        group(keys: Iterable[Any])
+        add_node(node: str)
+        remove_node(node: str)
+
+    Usage:
+        client = ShardedRedisClient(nodes=["redis-1:6379/0", "redis-2:6379/0"])
+        client.get_client("key").get("key")
+    """
+
+    redis: Optional[Redis] = None
+
+    def __init__(
+        self,
+        nodes: Optional[list[str]] = None,
+        password: str = settings.REDIS_PASSWORD,
+        decode_responses: bool = True,
+        replicas: int = settings.REDIS_RING_REPLICAS,
+    ):
+        self.password = password
+        self.decode_responses = decode_responses
+        self.nodes: dict[str, Redis] = {}
+        self.ring = HashRing(replicas=replicas)
+        self._lock = threading.Lock()
+        for node in (
+            nodes
+            or settings.REDIS_NODES
+            or [f"{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"]
+        ):
+            self.add_node(node)
+
+    @staticmethod
+    def parse_node(node: str) -> tuple[str, int, int]:
+        address, _, db = node.partition("/")
+        host, _, port = address.rpartition(":")
+        return host, int(port or 6379), int(db or 0)
+
+    def connect(self, node: str, **kwargs) -> Redis:
+        host, port, db = self.parse_node(node)
+        return Redis(
+            connection_pool=RedisPoolRegistry.get_pool(
+                host=host,
+                port=port,
+                password=self.password,
+                db=db,
+                decode_responses=self.decode_responses,
+            ),
+            **kwargs,
+        )
+
+    def disconnect(self, *args, **kwargs) -> None:
+        # The shared pools stay open for the other clients of the process
+        for redis in self.nodes.values():
+            redis.close()
+
+    def add_node(self, node: str) -> None:
+        with self._lock:
+            if node in self.nodes:
+                return
+            self.nodes[node] = self.connect(node)
+            self.ring.add_node(node)
+            self.redis = self.nodes[self.ring.nodes[0]]
+
+    def remove_node(self, node: str) -> None:
+        with self._lock:
+            if node not in self.nodes or len(self.nodes) == 1:
+                return
+            self.ring.remove_node(node)
+            self.nodes.pop(node)
+            self.redis = self.nodes[self.ring.nodes[0]]
+
+    def get_client(self, key: Any) -> Redis:
+        return self.nodes[self.ring.get_node(key)]
+
+    def group(self, keys: Iterable[Any]) -> dict[str, list[Any]]:
+        """Group keys by the node they live on, keeping their order."""
+        groups: dict[str, list[Any]] = defaultdict(list)
+        for key in keys:
+            groups[self.ring.get_node(key)].append(key)
+        return groups
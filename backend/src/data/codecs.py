@@ -0,0 +1,182 @@
+import datetime
+import decimal
+import logging
+import uuid
+import zlib
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import orjson
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from pydantic import BaseModel
+
+from src.data.interfaces import ICodec
+
+logger = logging.getLogger(__name__)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type {type(value).__name__} is not serializable")
+
+
+class OrjsonCodec(ICodec):
+    """
+    JSON codec backed by orjson.
+
+    Dates, UUIDs and dataclasses are serialized natively, pydantic models
+    are dumped to python objects first, so a payload is only serialized once.
+    """
+
+    content_type = "application/json"
+
+    def encode(self, data: Any) -> bytes:
+        return orjson.dumps(
+            data,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+    def decode(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(ICodec):
+    """
+    Binary codec backed by msgpack.
+
+    Requires the optional ``msgpack`` package, messages are smaller than JSON
+    but not human readable in ``redis-cli``.
+    """
+
+    content_type = "application/msgpack"
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError as error:
+            raise ImproperlyConfigured(
+                "MsgpackCodec requires the 'msgpack' package"
+            ) from error
+        self._msgpack = msgpack
+
+    def encode(self, data: Any) -> bytes:
+        return self._msgpack.packb(data, default=_default, use_bin_type=True)
+
+    def decode(self, data: bytes | str) -> Any:
+        if isinstance(data, str):
+            data = data.encode()
+        return self._msgpack.unpackb(data, raw=False)
+
+
+class CacheCodec(ICodec):
+    """
+    Codec of cached values.
+
+    Values are serialized with orjson and prefixed with a marker byte, those
+    larger than ``threshold`` bytes are compressed first. Entries written
+    before the marker existed are plain JSON text and still decode. Entries
+    with an unknown marker, or compressed with a package not installed in
+    this process, decode to ``None`` and are treated as cache misses.
+
+    Attributes:
+        compression (Optional[str]): "zlib", "lz4" (requires lz4), "zstd"
+            (requires zstandard) or None.
+        threshold (int): Minimum size in bytes of a compressed value.
+
+    Usage:
+        codec = CacheCodec(compression="zlib", threshold=1024)
+        codec.decode(codec.encode({"key": "value"}))
+    """
+
+    content_type = "application/json"
+
+    RAW = b"\x00"
+    ZLIB = b"\x01"
+    LZ4 = b"\x02"
+    ZSTD = b"\x03"
+
+    def __init__(self, compression: Optional[str] = "zlib", threshold: int = 1024):
+        self.threshold = threshold
+        self._compressors: dict[bytes, tuple[Callable, Callable]] = {
+            self.ZLIB: (zlib.compress, zlib.decompress),
+        }
+        try:
+            import lz4.frame
+
+            self._compressors[self.LZ4] = (lz4.frame.compress, lz4.frame.decompress)
+        except ImportError:
+            pass
+        try:
+            import zstandard
+
+            self._compressors[self.ZSTD] = (
+                zstandard.ZstdCompressor().compress,
+                zstandard.ZstdDecompressor().decompress,
+            )
+        except ImportError:
+            pass
+
+        markers = {"zlib": self.ZLIB, "lz4": self.LZ4, "zstd": self.ZSTD}
+        if compression is not None and compression not in markers:
+            raise ImproperlyConfigured(f"Unknown cache compression {compression!r}")
+        self.marker = markers.get(compression)
+        if self.marker is not None and self.marker not in self._compressors:
+            package = "lz4" if compression == "lz4" else "zstandard"
+            raise ImproperlyConfigured(
+                f"Cache compression {compression!r} requires the {package!r} package"
+            )
+
+    def encode(self, data: Any) -> bytes:
+        payload = orjson.dumps(
+            data,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+        if self.marker is not None and len(payload) > self.threshold:
+            compressed = self._compressors[self.marker][0](payload)
+            if len(compressed) < len(payload):
+                return self.marker + compressed
+        return self.RAW + payload
+
+    def decode(self, data: bytes | str) -> Any:
+        if isinstance(data, str):
+            data = data.encode()
+        marker, payload = data[:1], data[1:]
+        if marker == self.RAW:
+            return orjson.loads(payload)
+        compressor = self._compressors.get(marker)
+        if compressor is not None:
+            return orjson.loads(compressor[1](payload))
+        # JSON text never starts with a control byte other than whitespace
+        if marker and marker[0] < 0x20 and marker not in b"\t\n\r":
+            logger.warning(
+                "Cache entry with unknown or unavailable compression marker %r, "
+                "treated as a miss",
+                marker,
+            )
+            return None
+        # Legacy entry, plain JSON text
+        return orjson.loads(data)
+
+
+@lru_cache(maxsize=None)
+def get_event_codec() -> ICodec:
+    return import_string(settings.EVENT_CODEC)()
+
+
+@lru_cache(maxsize=None)
+def get_cache_codec() -> CacheCodec:
+    return CacheCodec(
+        compression=settings.CACHE_COMPRESSION,
+        threshold=settings.CACHE_COMPRESSION_THRESHOLD,
+    )
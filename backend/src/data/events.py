@@ -0,0 +1,139 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, ClassVar, Optional
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from src.data.codecs import get_event_codec
+
+logger = logging.getLogger(__name__)
+
+
+class EventSchema(BaseModel):
+    """
+    Base schema for event payloads.
+
+    Unknown fields are ignored, so consumers keep working when producers add
+    fields. When a payload changes incompatibly bump ``__event_version__``
+    and convert older payloads in ``upgrade``.
+
+    Usage:
+        class UserCreatedEventSchema(EventSchema):
+            __event_version__ = 2
+
+            user_id: str
+            email: str
+
+            @classmethod
+            def upgrade(cls, payload: dict, version: int) -> dict:
+                if version < 2:
+                    payload = {**payload, "email": ""}
+                return payload
+    """
+
+    __event_version__: ClassVar[int] = 1
+
+    model_config = ConfigDict(extra="ignore")
+
+    @classmethod
+    def upgrade(cls, payload: dict, version: int) -> dict:
+        return payload
+
+
+@dataclass(slots=True)
+class EventEnvelope:
+    """
+    Message wrapper sent over the event bus.
+
+    Attributes:
+        type (str): Event type, the channel name for published events.
+        payload (Any): Event data.
+        version (int): Payload schema version.
+        timestamp (float): Unix time the event was published at.
+        correlation_id (Optional[str]): Id shared by a request and its reply.
+        reply_to (Optional[str]): Channel the reply should be published to.
+        delivery_id (Optional[str]): Transport id of the delivery, like a
+            stream entry id, used to acknowledge it. Never encoded.
+    """
+
+    type: str
+    payload: Any = None
+    version: int = 1
+    timestamp: float = field(default_factory=time.time)
+    correlation_id: Optional[str] = None
+    reply_to: Optional[str] = None
+    delivery_id: Optional[str] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def create(
+        cls,
+        event_name: str,
+        event_data: Any,
+        **kwargs,
+    ) -> "EventEnvelope":
+        if isinstance(event_data, EventEnvelope):
+            return event_data
+        version = (
+            event_data.__event_version__ if isinstance(event_data, EventSchema) else 1
+        )
+        return cls(type=event_name, payload=event_data, version=version, **kwargs)
+
+    def to_dict(self) -> dict:
+        data = {
+            "type": self.type,
+            "version": self.version,
+            "timestamp": self.timestamp,
+            "payload": self.payload,
+        }
+        if self.correlation_id:
+            data["correlation_id"] = self.correlation_id
+        if self.reply_to:
+            data["reply_to"] = self.reply_to
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Any, event_name: str) -> "EventEnvelope":
+        if not isinstance(data, dict) or "payload" not in data or "type" not in data:
+            # Messages published before envelopes were introduced
+            return cls(type=event_name, payload=data)
+        return cls(
+            type=data["type"],
+            payload=data["payload"],
+            version=data.get("version", 1),
+            timestamp=data.get("timestamp") or time.time(),
+            correlation_id=data.get("correlation_id"),
+            reply_to=data.get("reply_to"),
+        )
+
+    def encode(self) -> bytes:
+        return get_event_codec().encode(self.to_dict())
+
+    @classmethod
+    def decode(cls, data: bytes | str, event_name: str) -> "EventEnvelope":
+        return cls.from_dict(get_event_codec().decode(data), event_name=event_name)
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(payload_type: Any) -> TypeAdapter:
+    return TypeAdapter(payload_type)
+
+
+def load_payload(envelope: EventEnvelope, payload_type: Any = None) -> Any:
+    """Validate the envelope payload into ``payload_type``, upgrading old versions."""
+    if payload_type is None or payload_type is Any:
+        return envelope.payload
+
+    payload = envelope.payload
+    if isinstance(payload_type, type) and issubclass(payload_type, EventSchema):
+        if envelope.version < payload_type.__event_version__:
+            payload = payload_type.upgrade(payload, envelope.version)
+        elif envelope.version > payload_type.__event_version__:
+            logger.warning(
+                "Event %s has version %s newer than supported %s",
+                envelope.type,
+                envelope.version,
+                payload_type.__event_version__,
+            )
+    return get_type_adapter(payload_type).validate_python(payload)
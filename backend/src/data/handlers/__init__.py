@@ -1,3 +1,4 @@
+from src.data.handlers.async_event_handler import AsyncEventHandler
 from src.data.handlers.event_handler import EventHandler
 from src.data.handlers.file_handler import (
     AvatarFileHandler,
@@ -5,20 +6,26 @@ from src.data.handlers.file_handler import (
     MediaFileHandler,
     ProductFileHandler,
 )
+from src.data.handlers.handler_registry import HandlerSpec, get_handler_registry
 from src.data.handlers.mail_handler import RegistrationEmailHandler
+from src.data.handlers.media_resolver import MediaUrlResolver
 from src.data.handlers.phone_handler import FakePhoneHandler, VonagePhoneHandler
 from src.data.handlers.redis_handler import CacheHandler
+from src.data.handlers.repository_cache import RepositoryCache
 from src.data.handlers.template_handler import TemplateHandler
 
 __all__ = [
     "VonagePhoneHandler",
     "FakePhoneHandler",
     "EventHandler",
+    "AsyncEventHandler",
     "CacheHandler",
+    "RepositoryCache",
     "AvatarFileHandler",
     "ProductFileHandler",
     "RegistrationEmailHandler",
     "TemplateHandler",
     "MediaFileHandler",
     "ImageFileHandler",
+    "MediaUrlResolver",
 ]
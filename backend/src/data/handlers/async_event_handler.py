@@ -0,0 +1,261 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydantic import ValidationError
+
+from src.data.events import EventEnvelope, load_payload
+from src.data.handlers.handler_registry import get_handler_registry
+from src.data.interfaces import IAsyncEventHandler
+from src.data.managers.dead_letter_manager import DeadLetterManager
+from src.data.metrics import (
+    HANDLER_DURATION,
+    HANDLER_IN_FLIGHT,
+    HANDLER_RETRIES,
+    observe_receive_timeout,
+    observe_request_timeout,
+)
+
+if TYPE_CHECKING:
+    from src.data.handlers.handler_registry import HandlerSpec
+    from src.data.interfaces import IAsyncEventManager
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEventHandler(IAsyncEventHandler):
+    """
+    Event handler running on the asyncio event loop.
+
+    Handler loops and pending requests are coroutines, so waiting for events
+    and replies does not hold OS threads. Coroutine handlers are awaited
+    directly, synchronous handlers run in the default executor while they
+    process a single event. Every event type runs ``EVENT_HANDLER_WORKERS``
+    handler loops, which caps the events in flight per type. Payloads are
+    validated into the annotated type of the handler's first parameter.
+    Failing handlers are retried with backoff before the event is moved to
+    the dead-letter stream.
+
+    Usage:
+        event_handler = AsyncEventHandler(manager=AsyncEventManager())
+        await event_handler.start_handlers()
+        reply = await event_handler.request("user_created", data, timeout=2)
+        await event_handler.stop_handlers()
+    """
+
+    def __init__(
+        self,
+        manager: "IAsyncEventManager",
+        dead_letters: Optional[DeadLetterManager] = None,
+    ):
+        self.manager = manager
+        self.dead_letters = dead_letters or DeadLetterManager()
+        self.reply_channel = f"replies.async.{socket.gethostname()}.{os.getpid()}"
+        self._futures: dict[str, asyncio.Future] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._inbox: Optional[asyncio.Task] = None
+
+    async def start_handlers(self) -> None:
+        for spec in get_handler_registry():
+            logger.info(
+                "Starting async [green]%s[/] for event: [yellow]%s[/] in service: [bold red blink]%s[/] with %s workers",
+                spec.method.__name__,
+                spec.event_name,
+                spec.service.__class__.__name__,
+                spec.workers,
+                extra={"markup": True},
+            )
+            await self.subscribe(event_name=spec.event_name)
+            self._tasks.extend(
+                asyncio.create_task(self._run_handler(spec))
+                for _ in range(spec.workers)
+            )
+
+    async def stop_handlers(self) -> None:
+        tasks = [*self._tasks, self._inbox] if self._inbox else self._tasks
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._inbox = None
+        await self.manager.close()
+
+    async def _run_handler(self, spec: "HandlerSpec") -> None:
+        while True:
+            envelope = await self.receive(event_name=spec.event_name)
+            if envelope is None:
+                continue
+            status = "success"
+            started = time.perf_counter()
+            in_flight = HANDLER_IN_FLIGHT.labels(event=spec.event_name)
+            in_flight.inc()
+            try:
+                if not await self._process_handler(spec, envelope):
+                    status = "error"
+            except Exception as e:
+                status = "error"
+                logger.exception("Handler %s failed: %s", spec.name, str(e))
+            finally:
+                in_flight.dec()
+                HANDLER_DURATION.labels(event=spec.event_name, status=status).observe(
+                    time.perf_counter() - started
+                )
+
+    async def _call(self, spec: "HandlerSpec", payload: Any) -> Any:
+        if asyncio.iscoroutinefunction(spec.method):
+            return await spec.method(payload)
+        return await asyncio.to_thread(spec.method, payload)
+
+    async def _process_handler(
+        self,
+        spec: "HandlerSpec",
+        envelope: EventEnvelope,
+    ) -> bool:
+        try:
+            payload = load_payload(envelope, spec.payload_type)
+        except (ValidationError, TypeError, ValueError) as error:
+            logger.warning(
+                "Invalid payload for event [red]%s[/] version %s: %s",
+                envelope.type,
+                envelope.version,
+                error,
+                extra={"markup": True},
+            )
+            await asyncio.to_thread(
+                self.dead_letters.push, envelope, spec.name, error, 1
+            )
+            return False
+
+        attempt = 1
+        while True:
+            try:
+                reply_data = await self._call(spec, payload)
+                break
+            except Exception as error:
+                if attempt > spec.retries:
+                    await asyncio.to_thread(
+                        self.dead_letters.push, envelope, spec.name, error, attempt
+                    )
+                    return False
+                logger.warning(
+                    "Retrying [green]%s[/] for event [yellow]%s[/], attempt %s failed: %s",
+                    spec.name,
+                    envelope.type,
+                    attempt,
+                    error,
+                    extra={"markup": True},
+                )
+                HANDLER_RETRIES.labels(event=envelope.type).inc()
+                await asyncio.sleep(spec.backoff(attempt))
+                attempt += 1
+
+        if reply_data is not None:
+            await self.reply(request=envelope, event_data=reply_data)
+        return True
+
+    async def _run_inbox(self) -> None:
+        while True:
+            envelope = await self.manager.receive(event_name=self.reply_channel)
+            if envelope is None:
+                continue
+            future = self._futures.pop(envelope.correlation_id, None)
+            if future is None or future.done():
+                logger.warning(
+                    "Dropped late reply with correlation id: %s",
+                    envelope.correlation_id,
+                )
+                continue
+            future.set_result(envelope.payload)
+
+    async def _ensure_inbox(self) -> None:
+        if self._inbox is None or self._inbox.done():
+            await self.subscribe(event_name=self.reply_channel)
+            self._inbox = asyncio.create_task(self._run_inbox())
+
+    async def publish(self, event_name: str, event_data: Any) -> None:
+        await self.manager.publish(event_name=event_name, event_data=event_data)
+
+    async def request(
+        self,
+        event_name: str,
+        event_data: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        await self._ensure_inbox()
+        correlation_id = str(uuid.uuid4())
+        future = asyncio.get_running_loop().create_future()
+        self._futures[correlation_id] = future
+        try:
+            await self.publish(
+                event_name=event_name,
+                event_data=EventEnvelope.create(
+                    event_name=event_name,
+                    event_data=event_data,
+                    correlation_id=correlation_id,
+                    reply_to=self.reply_channel,
+                ),
+            )
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            observe_request_timeout(event_name)
+            logger.warning(
+                "Request %s timed out waiting for reply %s",
+                event_name,
+                correlation_id,
+            )
+            return None
+        finally:
+            self._futures.pop(correlation_id, None)
+
+    async def reply(
+        self,
+        request: EventEnvelope,
+        event_data: Any,
+    ) -> None:
+        if not request.reply_to:
+            return
+        await self.publish(
+            event_name=request.reply_to,
+            event_data=EventEnvelope.create(
+                event_name=request.reply_to,
+                event_data=event_data,
+                correlation_id=request.correlation_id,
+            ),
+        )
+
+    async def subscribe(self, event_name: str) -> None:
+        await self.manager.subscribe(event_name=event_name)
+
+    async def receive(
+        self,
+        event_name: str,
+        timeout: Optional[None | float] = None,
+        with_subscription: bool = False,
+    ) -> Optional[EventEnvelope]:
+        if with_subscription:
+            await self.subscribe(event_name=event_name)
+
+        if not self.manager.is_subscribed(event_name=event_name):
+            logger.info("Event %s is not subscribed", event_name)
+            return None
+
+        try:
+            envelope = await self.manager.receive(
+                event_name=event_name,
+                timeout=timeout,
+            )
+        except Exception as e:
+            logger.error("Error processing event %s: %s", event_name, str(e))
+            return None
+
+        if envelope is None and timeout is not None:
+            observe_receive_timeout(event_name)
+        return envelope
+
+    async def unsubscribe(self, event_name: str) -> None:
+        logger.info("Unsubscribing from event: %s", event_name)
+        await self.manager.unsubscribe(event_name=event_name)
@@ -1,11 +1,27 @@
-import importlib
+import atexit
 import logging
+import os
+import socket
 import threading
-from typing import TYPE_CHECKING, Optional
+import time
+import uuid
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, Optional
 
 from django.conf import settings
+from pydantic import ValidationError
 
+from src.data.events import EventEnvelope, load_payload
+from src.data.handlers.handler_registry import HandlerSpec, get_handler_registry
 from src.data.interfaces import IEventHandler
+from src.data.managers.dead_letter_manager import DeadLetterManager
+from src.data.managers.handler_executor import HandlerExecutor
+from src.data.metrics import (
+    HANDLER_RETRIES,
+    observe_receive_timeout,
+    observe_request_timeout,
+)
 
 if TYPE_CHECKING:
     from src.data.interfaces import IEventManager
@@ -13,40 +29,249 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class ReplyInbox:
+    """
+    Per-process reply inbox.
+
+    Subscribes to a channel unique to this process and resolves the future
+    of the waiting request whose correlation id matches the reply.
+
+    Attributes:
+        manager (IEventManager): Event manager used to receive replies.
+        channel (str): Reply channel of this process.
+
+    Methods:
+        for_manager(manager: IEventManager)
+        register(correlation_id: str)
+        discard(correlation_id: str)
+
+    Usage:
+        inbox = ReplyInbox.for_manager(manager)
+        future = inbox.register(correlation_id)
+        future.result(timeout=2)
+    """
+
+    _instances: dict[int, "ReplyInbox"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, manager: "IEventManager"):
+        self.manager = manager
+        self.channel = f"replies.{socket.gethostname()}.{os.getpid()}"
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.manager.subscribe(event_name=self.channel)
+        threading.Thread(
+            target=self._run,
+            name="event-reply-inbox",
+            daemon=True,
+        ).start()
+
+    @classmethod
+    def for_manager(cls, manager: "IEventManager") -> "ReplyInbox":
+        pid = os.getpid()
+        with cls._instances_lock:
+            inbox = cls._instances.get(pid)
+            if inbox is None:
+                inbox = cls(manager=manager)
+                cls._instances[pid] = inbox
+            return inbox
+
+    def register(self, correlation_id: str) -> Future:
+        future = Future()
+        with self._lock:
+            self._futures[correlation_id] = future
+        return future
+
+    def discard(self, correlation_id: str) -> None:
+        with self._lock:
+            self._futures.pop(correlation_id, None)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                # Polled, so the manager keeps the reply stream alive
+                envelope = self.manager.receive(
+                    event_name=self.channel,
+                    timeout=settings.EVENT_HANDLER_POLL_TIMEOUT,
+                )
+            except Exception as e:
+                logger.error("Error receiving reply on %s: %s", self.channel, str(e))
+                time.sleep(1)
+                continue
+            if envelope is None:
+                continue
+
+            self.manager.acknowledge(event_name=self.channel, envelope=envelope)
+            with self._lock:
+                future = self._futures.pop(envelope.correlation_id, None)
+            if future is None:
+                logger.warning(
+                    "Dropped late reply with correlation id: %s",
+                    envelope.correlation_id,
+                )
+                continue
+            future.set_result(envelope.payload)
+
+
 class EventHandler(IEventHandler):
+    """
+    Event handler running WORKING_HANDLERS on bounded worker pools.
+
+    Every event type gets a receiver thread feeding a bounded queue and
+    ``EVENT_HANDLER_WORKERS`` worker threads, so a slow handler only stalls
+    its own event type and throughput scales with the configured workers.
+    When the queue is full ``EVENT_HANDLER_OVERFLOW`` decides whether the
+    receiver blocks or an event is dropped. Handlers get the envelope payload
+    validated into the annotated type of their first parameter. Failing
+    handlers are retried with exponential backoff, then the event is moved to
+    the dead-letter stream.
+
+    A received event is acknowledged to the manager only once its handler
+    succeeded or it was dead-lettered. Events dropped by a full queue or
+    lost with a crashed worker stay unacknowledged, durable managers deliver
+    them again.
+
+    Usage:
+        event_handler = EventHandler(manager=get_event_manager())
+        event_handler.start_handlers()
+        event_handler.stop_handlers(timeout=10)
+    """
+
     def __init__(
         self,
         manager: "IEventManager",
+        dead_letters: Optional[DeadLetterManager] = None,
     ):
         self.manager = manager
+        self.dead_letters = dead_letters or DeadLetterManager()
+        self._executors: dict[str, HandlerExecutor] = {}
+        self._receivers: list[threading.Thread] = []
+        self._stopping = threading.Event()
+        # Delivery ids queued or running, redeliveries of them are skipped
+        self._in_flight: set[str] = set()
+        self._in_flight_lock = threading.Lock()
 
     def start_handlers(self) -> None:
-        if bool(settings.WORKING_HANDLERS or settings.WORKING_HANDLERS != []):
-            for event_class in settings.WORKING_HANDLERS:
-                module_path, class_name, service_name, method_name = event_class.rsplit(
-                    sep=".", maxsplit=3
+        self._stopping.clear()
+        for spec in get_handler_registry():
+            logger.info(
+                "Starting [green]%s[/] for event: [yellow]%s[/] in service: [bold red blink]%s[/] with %s workers",
+                spec.method.__name__,
+                spec.event_name,
+                spec.service.__class__.__name__,
+                spec.workers,
+                extra={"markup": True},
+            )
+            executor = HandlerExecutor(
+                event_name=spec.event_name,
+                process=lambda event_data, spec=spec: self._process_handler(
+                    spec, event_data
+                ),
+                workers=spec.workers,
+                queue_size=settings.EVENT_HANDLER_QUEUE_SIZE,
+                overflow=settings.EVENT_HANDLER_OVERFLOW,
+                on_drop=self._release,
+            )
+            executor.start()
+            self._executors[spec.event_name] = executor
+
+            receiver = threading.Thread(
+                target=self._run_receiver,
+                args=(spec, executor),
+                name=f"event-{spec.event_name}-receiver",
+                daemon=True,
+            )
+            receiver.start()
+            self._receivers.append(receiver)
+
+        if self._receivers:
+            atexit.register(self.stop_handlers)
+
+    def stop_handlers(self, timeout: Optional[float] = None) -> None:
+        """Stop receiving events and drain queued events within ``timeout``."""
+        if self._stopping.is_set():
+            return
+        self._stopping.set()
+        if timeout is None:
+            timeout = settings.EVENT_HANDLER_DRAIN_TIMEOUT
+
+        deadline = time.monotonic() + timeout
+        for receiver in self._receivers:
+            receiver.join(timeout=max(deadline - time.monotonic(), 0))
+        for executor in self._executors.values():
+            executor.shutdown(timeout=max(deadline - time.monotonic(), 0))
+        self._receivers = []
+        self._executors = {}
+
+    def _run_receiver(self, spec: HandlerSpec, executor: HandlerExecutor) -> None:
+        self.subscribe(event_name=spec.event_name)
+        while not self._stopping.is_set():
+            envelope = self.receive(
+                event_name=spec.event_name,
+                timeout=settings.EVENT_HANDLER_POLL_TIMEOUT,
+            )
+            if envelope is None:
+                continue
+            if envelope.delivery_id:
+                with self._in_flight_lock:
+                    if envelope.delivery_id in self._in_flight:
+                        continue
+                    self._in_flight.add(envelope.delivery_id)
+            if not executor.submit(envelope):
+                self._release(envelope)
+
+    def _release(self, envelope: EventEnvelope) -> None:
+        """Forget an unacknowledged event, so its redelivery is accepted."""
+        if envelope.delivery_id:
+            with self._in_flight_lock:
+                self._in_flight.discard(envelope.delivery_id)
+
+    def _process_handler(self, spec: HandlerSpec, envelope: EventEnvelope) -> None:
+        try:
+            self._handle(spec, envelope)
+        except BaseException:
+            self._release(envelope)
+            raise
+        self.manager.acknowledge(event_name=spec.event_name, envelope=envelope)
+        self._release(envelope)
+
+    def _handle(self, spec: HandlerSpec, envelope: EventEnvelope) -> None:
+        try:
+            payload = load_payload(envelope, spec.payload_type)
+        except (ValidationError, TypeError, ValueError) as error:
+            logger.warning(
+                "Invalid payload for event [red]%s[/] version %s: %s",
+                envelope.type,
+                envelope.version,
+                error,
+                extra={"markup": True},
+            )
+            self.dead_letters.push(envelope, spec.name, error, attempts=1)
+            return
+
+        attempt = 1
+        while True:
+            try:
+                reply_data = spec.method(payload)
+                break
+            except Exception as error:
+                # Stop retrying on shutdown, the event is kept as a dead letter
+                if attempt > spec.retries or self._stopping.wait(spec.backoff(attempt)):
+                    self.dead_letters.push(envelope, spec.name, error, attempt)
+                    return
+                logger.warning(
+                    "Retrying [green]%s[/] for event [yellow]%s[/], attempt %s failed: %s",
+                    spec.name,
+                    envelope.type,
+                    attempt,
+                    error,
+                    extra={"markup": True},
                 )
-                controller = getattr(importlib.import_module(module_path), class_name)
-                services_methods = [
-                    getattr(controller, x)
-                    for x in dir(controller)
-                    if "service" in x
-                    and hasattr(getattr(controller, x), method_name)
-                    and callable(getattr(getattr(controller, x), method_name))
-                ]
-                for service in services_methods:
-                    method = getattr(service, method_name)
-
-                    if method.__name__.startswith("handle"):
-                        event_name = method.__name__.replace("handle_", "")
-                        logger.info(
-                            "Starting [green]%s[/] for event: [yellow]%s[/] in service: [bold red blink]%s[/]",
-                            method.__name__,
-                            event_name,
-                            service.__class__.__name__,
-                            extra={"markup": True},
-                        )
-                        threading.Thread(target=method).start()
+                HANDLER_RETRIES.labels(event=envelope.type).inc()
+                attempt += 1
+
+        if reply_data is not None:
+            self.reply(request=envelope, event_data=reply_data)
 
     def start_subscribers(self) -> None:
         if bool(settings.WORKING_SUBSCRIBERS or settings.WORKING_SUBSCRIBERS != []):
@@ -65,9 +290,56 @@ class EventHandler(IEventHandler):
                 extra={"markup": True},
             )
 
-    def publish(self, event_name: str, event_data: str | dict) -> None:
+    def publish(self, event_name: str, event_data: Any) -> None:
         self.manager.publish(event_name=event_name, event_data=event_data)
 
+    def request(
+        self,
+        event_name: str,
+        event_data: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        inbox = ReplyInbox.for_manager(manager=self.manager)
+        correlation_id = str(uuid.uuid4())
+        future = inbox.register(correlation_id=correlation_id)
+        try:
+            self.publish(
+                event_name=event_name,
+                event_data=EventEnvelope.create(
+                    event_name=event_name,
+                    event_data=event_data,
+                    correlation_id=correlation_id,
+                    reply_to=inbox.channel,
+                ),
+            )
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            observe_request_timeout(event_name)
+            logger.warning(
+                "Request %s timed out waiting for reply %s",
+                event_name,
+                correlation_id,
+            )
+            return None
+        finally:
+            inbox.discard(correlation_id=correlation_id)
+
+    def reply(
+        self,
+        request: EventEnvelope,
+        event_data: Any,
+    ) -> None:
+        if not request.reply_to:
+            return
+        self.publish(
+            event_name=request.reply_to,
+            event_data=EventEnvelope.create(
+                event_name=request.reply_to,
+                event_data=event_data,
+                correlation_id=request.correlation_id,
+            ),
+        )
+
     def subscribe(
         self,
         event_name: str,
@@ -78,20 +350,17 @@ class EventHandler(IEventHandler):
         self,
         event_name: str,
         timeout: Optional[None | float] = None,
-    ) -> Optional[dict]:
+    ) -> Optional[EventEnvelope]:
         try:
-            # Receive event data using the manager
-            event_data = self.manager.receive(
+            # Receive the event envelope using the manager
+            envelope = self.manager.receive(
                 event_name=event_name,
                 timeout=timeout,
             )
 
-            # Check if the event data is valid and return it
-            if event_data and isinstance(event_data, dict):
-                return event_data
-            else:
-                logger.warning("Received invalid event data for event: %s", event_name)
-                return None
+            if envelope is None and timeout is not None:
+                observe_receive_timeout(event_name)
+            return envelope
         except Exception as e:
             logger.error("Error processing event %s: %s", event_name, str(e))
             return None
@@ -101,7 +370,7 @@ class EventHandler(IEventHandler):
         event_name: str,
         timeout: Optional[None | float] = None,
         with_subscription: bool = False,
-    ) -> Optional[dict]:
+    ) -> Optional[EventEnvelope]:
         if with_subscription:
             self.subscribe(event_name=event_name)
 
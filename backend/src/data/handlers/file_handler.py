@@ -1,10 +1,17 @@
+import time
 from logging import getLogger
 from typing import Optional, TypeVar, Union
 from uuid import UUID
 
+from django.conf import settings
+from django.utils.functional import cached_property
 from ninja.files import UploadedFile
 
+from src.core.config import get_shared_cache_storage
+from src.data.handlers.media_resolver import MediaUrlResolver
+from src.data.handlers.redis_handler import CacheHandler
 from src.data.interfaces import ICloudStorage, IFileHandler
+from src.data.utils import clean_name, get_extension
 
 logger = getLogger(__name__)
 ObjectType = TypeVar("ObjectType", bound=Union[UUID, str, int])
@@ -16,25 +23,145 @@ class MediaFileHandler(IFileHandler):
         storage: ICloudStorage,
         folder: str,
         content_type: str = "image/webp",
+        resolver: Optional[MediaUrlResolver] = None,
     ):
         super().__init__(storage=storage)
         self.folder = folder
         self.content_type = content_type
+        self.resolver = resolver or MediaUrlResolver()
         self._set_folder_policy(folder=folder)
 
     def _set_folder_policy(self, folder):
         self.storage.add_prefix_policy(path=[f"{folder}/*"])
 
+    @cached_property
+    def signed_urls(self) -> Optional[CacheHandler]:
+        # Deletes drop cached URLs, every process must see the same entries
+        storage = get_shared_cache_storage()
+        if not storage.shared:
+            logger.warning(
+                "Signed URL cache disabled, %s is not shared by processes",
+                settings.CACHE_SHARED_STORAGE,
+            )
+            return None
+        return CacheHandler(pool_storage=storage, namespace="media-signed")
+
+    @staticmethod
+    def _signing_window() -> tuple[int, int]:
+        """
+        Return the current expiry bucket and the seconds left in it.
+
+        A URL signed within a bucket stays valid for at least
+        ``MEDIA_SIGNED_URL_MARGIN`` seconds after the bucket ends.
+        """
+        period = settings.MEDIA_SIGNED_URL_EXPIRE - settings.MEDIA_SIGNED_URL_MARGIN
+        now = time.time()
+        bucket = int(now // period)
+        return bucket, max(1, int((bucket + 1) * period - now))
+
+    def _exists_many(self, full_object_keys: list[str]) -> list[bool]:
+        """
+        Check objects in the media index.
+
+        Only while the index is cold, an object is checked once in the
+        storage and the result is indexed.
+        """
+        exists = self.resolver.exists_many(full_object_keys)
+        for index, full_object_key in enumerate(full_object_keys):
+            if exists[index] is None:
+                exists[index] = bool(self.storage.is_object_exist(full_object_key))
+                self.resolver.mark(full_object_key, exists=exists[index])
+        return exists
+
     def get_media(
         self,
         filename: str,
         object_key: Optional[ObjectType] = None,
-    ) -> str:
-        return self.storage.get_file(
+    ) -> Optional[str]:
+        return self.get_media_many(files=[(filename, object_key)])[0]
+
+    def get_media_many(
+        self,
+        files: list[tuple[str, Optional[ObjectType]]],
+    ) -> list[Optional[str]]:
+        """
+        Return signed URLs of ``(filename, object_key)`` pairs in order.
+
+        URLs are cached per object and expiry bucket, only objects without a
+        URL in the current bucket are signed, locally and without a stat.
+        """
+        bucket, ttl = self._signing_window()
+        full_object_keys = [
+            self.storage.get_object_key(
+                filename=filename,
+                folder=self.folder,
+                object_key=object_key,
+            )
+            for filename, object_key in files
+        ]
+        cache_keys = [f"{bucket}:{key}" for key in full_object_keys]
+        urls = (
+            self.signed_urls.get_many(keys=cache_keys)
+            if self.signed_urls
+            else [None] * len(cache_keys)
+        )
+        missing = [index for index, url in enumerate(urls) if url is None]
+        if not missing:
+            return urls
+
+        signed: dict[str, str] = {}
+        exists = self._exists_many([full_object_keys[index] for index in missing])
+        for index, found in zip(missing, exists):
+            if not found:
+                continue
+            urls[index] = self.storage.get_presigned_url(
+                full_object_key=full_object_keys[index],
+                expire=settings.MEDIA_SIGNED_URL_EXPIRE,
+            )
+            if urls[index]:
+                signed[cache_keys[index]] = urls[index]
+        if signed and self.signed_urls:
+            self.signed_urls.set_many(mapping=signed, expire=ttl)
+        return urls
+
+    def get_media_url(
+        self,
+        filename: str,
+        object_key: Optional[ObjectType] = None,
+    ) -> Optional[str]:
+        """Return the public URL of the object without calling the storage."""
+        full_object_key = self.storage.get_object_key(
             filename=filename,
             folder=self.folder,
             object_key=object_key,
         )
+        if self._exists_many([full_object_key])[0]:
+            return self.resolver.url(full_object_key)
+        return None
+
+    def _index(
+        self,
+        filename: str,
+        object_key: Optional[ObjectType],
+        content_type: Optional[str],
+        exists: bool,
+    ) -> None:
+        # Same object name as ``upload_file`` gives the uploaded file
+        filename = clean_name(filename)
+        if content_type:
+            filename = filename.split(".")[0] + "." + content_type.split("/")[1]
+        full_object_key = self.storage.get_object_key(
+            filename=filename,
+            folder=self.folder,
+            object_key=object_key,
+        )
+        try:
+            self.resolver.mark(full_object_key, exists=exists)
+            if not exists and self.signed_urls:
+                bucket, _ = self._signing_window()
+                self.signed_urls.delete_value(key=f"{bucket}:{full_object_key}")
+        except Exception as e:
+            logger.exception(e)
 
     def upload_media_from_url(
         self,
@@ -44,13 +171,14 @@ class MediaFileHandler(IFileHandler):
         content_type: Optional[str] = None,
     ) -> bool:
         try:
-            self.storage.upload_file_from_url(
+            if self.storage.upload_file_from_url(
                 filename=filename,
                 folder=self.folder,
                 file=file,
                 object_key=object_key,
                 content_type=content_type,
-            )
+            ):
+                self._index(filename, object_key, content_type, exists=True)
             return True
         except Exception as e:
             logger.exception(e)
@@ -63,12 +191,13 @@ class MediaFileHandler(IFileHandler):
         content_type: Optional[str] = None,
     ) -> bool:
         try:
-            self.storage.upload_file_from_path(
+            if self.storage.upload_file_from_path(
                 filename=filename,
                 folder=self.folder,
                 object_key=object_key,
                 content_type=content_type,
-            )
+            ):
+                self._index(filename, object_key, content_type, exists=True)
             return True
         except Exception as e:
             logger.exception(e)
@@ -79,12 +208,20 @@ class MediaFileHandler(IFileHandler):
         filename: str,
         object_key: Optional[ObjectType] = None,
     ) -> bool:
-        return self.storage.delete_file(
+        deleted = self.storage.delete_file(
             filename=filename,
             folder=self.folder,
             object_key=object_key,
             content_type=self.content_type,
         )
+        if deleted:
+            self._index(
+                filename + get_extension(self.content_type),
+                object_key,
+                None,
+                exists=False,
+            )
+        return deleted
 
 
 class AvatarFileHandler(MediaFileHandler):
@@ -102,6 +239,16 @@ class AvatarFileHandler(MediaFileHandler):
             object_key=object_key,
         )
 
+    def get_avatar_url(
+        self,
+        object_key: Optional[ObjectType] = None,
+    ) -> Optional[str]:
+        filename = f"{self.filename}.{self.content_type.split('/')[1]}"
+        return self.get_media_url(
+            filename=filename,
+            object_key=object_key,
+        )
+
     def upload_avatar(
         self,
         file: UploadedFile,
@@ -141,6 +288,15 @@ class ProductFileHandler(MediaFileHandler):
             object_key=object_key,
         )
 
+    def get_products(
+        self,
+        object_keys: list[ObjectType],
+    ) -> list[Optional[str]]:
+        filename = f"{self.filename}.{self.content_type.split('/')[1]}"
+        return self.get_media_many(
+            files=[(filename, object_key) for object_key in object_keys],
+        )
+
     def upload_product(
         self,
         file: UploadedFile,
@@ -0,0 +1,86 @@
+import importlib
+import inspect
+import random
+import typing
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+
+@dataclass(frozen=True)
+class HandlerSpec:
+    event_name: str
+    service: Any
+    method: Callable[[Any], Any]
+    workers: int
+    payload_type: Any = None
+    retries: int = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.service.__class__.__name__}.{self.method.__name__}"
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter before retry number ``attempt``."""
+        delay = min(
+            settings.EVENT_HANDLER_RETRY_BACKOFF * 2 ** (attempt - 1),
+            settings.EVENT_HANDLER_RETRY_BACKOFF_MAX,
+        )
+        return delay * random.uniform(0.5, 1.0)
+
+
+def _payload_type(method: Callable) -> Any:
+    """Return the annotation of the handler's event parameter, if any."""
+    parameters = list(inspect.signature(method).parameters)
+    if not parameters:
+        return None
+    try:
+        hints = typing.get_type_hints(method)
+    except NameError:
+        return None
+    payload_type = hints.get(parameters[0])
+    return None if payload_type is dict else payload_type
+
+
+def _resolve_handler(handler_path: str) -> HandlerSpec:
+    module_path, class_name, service_name, method_name = handler_path.rsplit(
+        sep=".", maxsplit=3
+    )
+    if not method_name.startswith("handle_"):
+        raise ImproperlyConfigured(
+            f"Handler '{handler_path}' must point to a 'handle_<event>' method"
+        )
+
+    controller = getattr(importlib.import_module(module_path), class_name)
+    service = getattr(controller, service_name)
+    method = getattr(service, method_name)
+    if not callable(method):
+        raise ImproperlyConfigured(f"Handler '{handler_path}' is not callable")
+
+    event_name = method_name.removeprefix("handle_")
+    workers = settings.EVENT_HANDLER_WORKERS.get(
+        event_name, settings.EVENT_HANDLER_DEFAULT_WORKERS
+    )
+    retries = settings.EVENT_HANDLER_RETRIES.get(
+        event_name, settings.EVENT_HANDLER_DEFAULT_RETRIES
+    )
+    return HandlerSpec(
+        event_name=event_name,
+        service=service,
+        method=method,
+        workers=max(int(workers), 1),
+        payload_type=_payload_type(method),
+        retries=max(int(retries), 0),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_handler_registry() -> tuple[HandlerSpec, ...]:
+    """Resolve WORKING_HANDLERS once into handler specs."""
+    return tuple(
+        _resolve_handler(handler_path)
+        for handler_path in settings.WORKING_HANDLERS or []
+    )
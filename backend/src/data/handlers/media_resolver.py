@@ -0,0 +1,147 @@
+import logging
+import time
+from typing import Iterable, Optional
+from urllib.parse import quote
+
+from django.conf import settings
+from django.utils.functional import cached_property
+
+from src.core.config import get_shared_cache_storage
+from src.data.handlers.redis_handler import CacheHandler
+
+logger = logging.getLogger(__name__)
+
+# Index key set by every reconcile, while it lives a key missing from the
+# index is known to be missing from the bucket
+READY_KEY = "__reconciled__"
+
+
+class MediaUrlResolver:
+    """
+    Network-free resolution of public media URLs.
+
+    URLs are built from ``BUCKET_URL`` and the object key, the bucket layout
+    is ``<folder>/<object_key>/<filename>``. Whether an object exists is read
+    from an index of object keys in the ``media`` cache namespace: ``True``
+    for stored objects, ``False`` for objects known to be missing. The
+    index is updated by ``MediaFileHandler`` on upload and delete and
+    refreshed from a bucket listing by the ``reconcile_media_index`` task.
+    Marks keep the time they were made, a reconcile never overwrites a mark
+    made after its listing started.
+
+    ``exists`` returns ``None`` when the index cannot tell, the key is not
+    indexed and no reconcile ran within ``MEDIA_INDEX_TTL``. The index lives
+    in ``CACHE_SHARED_STORAGE``, with a per-process storage it is disabled
+    and ``exists`` always returns ``None``.
+
+    Attributes:
+        base_url (str): Public URL of the bucket, ending with "/".
+        handler (Optional[CacheHandler]): Cache handler of the index, ``None``
+            when the index is disabled.
+
+    Methods:
+        url(object_key: str)
+        exists(object_key: str)
+        exists_many(object_keys: list[str])
+        resolve(object_key: str)
+        mark(object_key: str, exists: bool)
+        reconcile(object_keys: Iterable[str])
+
+    Usage:
+        resolver = MediaUrlResolver()
+        resolver.mark("avatars/1/avatar.webp", exists=True)
+        resolver.resolve("avatars/1/avatar.webp")
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        namespace: str = "media",
+    ):
+        self.base_url = base_url or settings.BUCKET_URL
+        self.namespace = namespace
+        self.ttl = settings.MEDIA_INDEX_TTL
+
+    @cached_property
+    def handler(self) -> Optional[CacheHandler]:
+        storage = get_shared_cache_storage()
+        if not storage.shared:
+            logger.warning(
+                "Media index disabled, %s is not shared by processes",
+                settings.CACHE_SHARED_STORAGE,
+            )
+            return None
+        return CacheHandler(pool_storage=storage, namespace=self.namespace)
+
+    def url(self, object_key: str) -> str:
+        return f"{self.base_url}{quote(object_key, safe='/')}"
+
+    def exists(self, object_key: str) -> Optional[bool]:
+        return self.exists_many([object_key])[0]
+
+    def exists_many(self, object_keys: list[str]) -> list[Optional[bool]]:
+        """Look up many objects and the reconcile marker in one round trip."""
+        if self.handler is None:
+            return [None] * len(object_keys)
+        *indexed, ready = self.handler.get_many(keys=[*object_keys, READY_KEY])
+        unknown = False if ready else None
+        return [unknown if value is None else self._exists(value) for value in indexed]
+
+    @staticmethod
+    def _exists(value: bool | list) -> bool:
+        # Marks are [exists, marked_at], reconciled entries plain True
+        return bool(value[0]) if isinstance(value, list) else bool(value)
+
+    def resolve(self, object_key: str) -> Optional[str]:
+        """Return the public URL of an indexed object, ``None`` otherwise."""
+        if self.exists(object_key):
+            return self.url(object_key)
+        return None
+
+    def mark(self, object_key: str, exists: bool) -> None:
+        if self.handler is None:
+            return
+        self.handler.set_value(
+            key=object_key, value=[exists, time.time()], expire=self.ttl
+        )
+
+    def _write_batch(self, batch: list[str], started: float) -> int:
+        """Mark a batch as stored, skipping keys marked since ``started``."""
+        current = self.handler.get_many(keys=batch)
+        mapping = {
+            object_key: True
+            for object_key, value in zip(batch, current)
+            if not (isinstance(value, list) and value[1] >= started)
+        }
+        if mapping:
+            self.handler.set_many(mapping=mapping, expire=self.ttl)
+        return len(mapping)
+
+    def reconcile(self, object_keys: Iterable[str]) -> int:
+        """
+        Mark the listed objects as stored, in batches of ``CACHE_SCAN_BATCH``.
+
+        Keys missing from the listing are not touched, their entries expire
+        after ``MEDIA_INDEX_TTL`` unless an upload marks them again. Keys
+        marked once the listing started, like objects deleted meanwhile,
+        keep their mark.
+        """
+        if self.handler is None:
+            return 0
+        started = time.time()
+        count = 0
+        batch: list[str] = []
+        for object_key in object_keys:
+            batch.append(object_key)
+            if len(batch) >= settings.CACHE_SCAN_BATCH:
+                count += self._write_batch(batch, started)
+                batch = []
+        if batch:
+            count += self._write_batch(batch, started)
+        self.handler.set_value(key=READY_KEY, value=True, expire=self.ttl)
+        logger.info(
+            "Media index reconciled with [blue]%s[/] objects",
+            count,
+            extra={"markup": True},
+        )
+        return count
@@ -1,67 +1,617 @@
+import functools
 import json
+import logging
+import math
+import os
+import random
+import socket
+import threading
+import time
+from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+from uuid import uuid4
 
+from django.conf import settings
+
+from src.data.codecs import get_cache_codec
 from src.data.interfaces import ICacheHandler
+from src.data.managers.event_dispatcher import EventDispatcher
+from src.data.metrics import (
+    observe_cache_error,
+    observe_cache_read,
+    observe_cache_set,
+)
 from src.data.storages import RedisStorage
 
+logger = logging.getLogger(__name__)
+
+
+def escape_pattern(value: str) -> str:
+    """Escape glob characters of a SCAN MATCH pattern."""
+    return "".join(f"\\{char}" if char in "*?[]\\" else char for char in value)
+
+
+def observed(operation: str) -> Callable:
+    """Count failures of a cache handler operation per namespace."""
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self: "CacheHandler", *args, **kwargs) -> Any:
+            try:
+                return method(self, *args, **kwargs)
+            except Exception:
+                observe_cache_error(self.namespace, operation)
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+# Marks a get_or_set refresh without a current value to fall back to
+_NO_VALUE = object()
+
+# Wraps get_or_set entries, so a plain set_value of the same key is a miss
+_ENTRY_TAG = "__cache_entry__"
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with a TTL per entry.
+
+    Keeps raw cached values, the least recently used entries are evicted
+    when either the entry or the byte budget is exceeded.
+
+    Attributes:
+        max_entries (int): Maximum number of entries.
+        max_bytes (int): Maximum total size of cached values.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        size = len(value) if isinstance(value, (str, bytes)) else 0
+        if ttl <= 0 or size > self.max_bytes:
+            self.delete(key)
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+class CacheInvalidator:
+    """
+    Process-wide broadcast of cache invalidations.
+
+    Writes publish the changed key on ``CACHE_INVALIDATION_CHANNEL``, every
+    other process evicts it from its local cache of that namespace. A missed
+    message only leaves an entry stale until its local TTL runs out.
+
+    Methods:
+        for_storage(storage: RedisStorage)
+        local_cache(namespace: str)
+        publish(namespace: str, key: Optional[str] = None)
+        publish_many(namespace: str, keys: list[str])
+        evict(namespace: str, keys: Optional[list[str]] = None)
+    """
+
+    _instances: dict[int, "CacheInvalidator"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, storage: RedisStorage):
+        self.redis = storage.storage
+        self.channel = settings.CACHE_INVALIDATION_CHANNEL
+        self.origin = f"{socket.gethostname()}-{os.getpid()}"
+        self._caches: dict[str, LocalCache] = {}
+        self._lock = threading.Lock()
+        self.dispatcher = EventDispatcher.for_client(self.redis)
+        self.dispatcher.subscribe(self.channel)
+        threading.Thread(
+            target=self._run,
+            name="cache-invalidator",
+            daemon=True,
+        ).start()
+
+    @classmethod
+    def for_storage(cls, storage: RedisStorage) -> "CacheInvalidator":
+        pid = os.getpid()
+        with cls._instances_lock:
+            invalidator = cls._instances.get(pid)
+            if invalidator is None:
+                invalidator = cls(storage=storage)
+                cls._instances[pid] = invalidator
+            return invalidator
+
+    def local_cache(self, namespace: str) -> LocalCache:
+        with self._lock:
+            cache = self._caches.get(namespace)
+            if cache is None:
+                cache = LocalCache(
+                    max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+                    max_bytes=settings.CACHE_LOCAL_MAX_BYTES,
+                )
+                self._caches[namespace] = cache
+            return cache
+
+    def publish(self, namespace: str, key: Optional[str] = None) -> None:
+        message = {"origin": self.origin, "namespace": namespace, "key": key}
+        try:
+            self.redis.publish(self.channel, json.dumps(message))
+        except Exception as error:
+            logger.warning("Cache invalidation of %s failed: %s", key, error)
+
+    def publish_many(self, namespace: str, keys: list[str]) -> None:
+        if not keys:
+            return
+        message = {"origin": self.origin, "namespace": namespace, "keys": keys}
+        try:
+            self.redis.publish(self.channel, json.dumps(message))
+        except Exception as error:
+            logger.warning("Cache invalidation of %s keys failed: %s", len(keys), error)
+
+    def evict(self, namespace: str, keys: Optional[list[str]] = None) -> None:
+        """Evict keys, or the whole namespace, from this and every other process."""
+        cache = self._caches.get(namespace)
+        if keys is None:
+            if cache is not None:
+                cache.clear()
+            self.publish(namespace)
+            return
+        if cache is not None:
+            for key in keys:
+                cache.delete(key)
+        self.publish_many(namespace, keys)
+
+    def _run(self) -> None:
+        while True:
+            message = self.dispatcher.get(channel=self.channel)
+            if not message:
+                time.sleep(1)
+                continue
+            try:
+                data = json.loads(message["data"])
+            except (TypeError, ValueError):
+                continue
+            if data.get("origin") == self.origin:
+                continue
+            cache = self._caches.get(data.get("namespace"))
+            if cache is None:
+                continue
+            if "keys" in data:
+                for key in data["keys"]:
+                    cache.delete(key)
+            elif data.get("key") is None:
+                cache.clear()
+            else:
+                cache.delete(data["key"])
+
 
 class CacheHandler(ICacheHandler):
     """
     Redis cache handler
 
+    Namespaces listed in ``CACHE_LOCAL_NAMESPACES`` also keep values in an
+    in-process LRU, so hot keys are served without a Redis round trip. A
+    local entry lives for the namespace TTL but never longer than the key
+    lives in Redis.
+
+    Values are stored with ``CacheCodec``, as orjson compressed above
+    ``CACHE_COMPRESSION_THRESHOLD`` bytes.
+
+    Keys live under ``<CACHE_KEY_PREFIX>:<namespace>:``, so a namespace is
+    cleared without touching Celery, event or other namespaces' keys. Values
+    may be tagged, ``invalidate_tag`` drops every key of a tag at once.
+    Both walk the key space with SCAN/SSCAN and UNLINK in bounded batches.
+
     Attributes:
         storage (RedisStorage): Redis storage
+        namespace (Optional[str]): Cache namespace
+        prefix (str): Prefix of the namespace keys
+        codec (CacheCodec): Codec of cached values
+        local (Optional[LocalCache]): In-process cache of the namespace
 
     Methods:
         get_value(key: Any)
-        set_value(key: Any, value: Any, expire: Optional[int] = None)
+        set_value(key: Any, value: Any, expire: Optional[int] = None, tags: Optional[list[str]] = None)
         delete_value(key: Any)
+        get_or_set(key: Any, loader: Callable, ttl: Optional[int] = None, serve_stale: bool = False, tags: Optional[list[str]] = None)
+        get_many(keys: list[Any])
+        set_many(mapping: dict[Any, Any], expire: Optional[int] = None, tags: Optional[list[str]] = None)
+        delete_many(keys: list[Any])
+        invalidate_tag(tag: str)
+        clear_namespace(namespace: Optional[str] = None)
         exists_all_values(key: Any)
         delete_all_values()
 
     Usage:
-        cache_handler = CacheHandler(pool_storage)
+        cache_handler = CacheHandler(pool_storage, namespace="auth")
         cache_handler.get_value(key="key")
-        cache_handler.set_value(key="key", value="value")
+        cache_handler.set_value(key="key", value="value", tags=["user:1"])
         cache_handler.delete_value(key="key")
+        cache_handler.get_or_set(key="key", loader=lambda: "value", ttl=60)
+        cache_handler.get_many(keys=["key", "other"])
+        cache_handler.set_many(mapping={"key": "value", "other": "value"})
+        cache_handler.delete_many(keys=["key", "other"])
+        cache_handler.invalidate_tag(tag="user:1")
+        cache_handler.clear_namespace()
         cache_handler.exists_all_values(key="key")
         cache_handler.delete_all_values()
     """
 
-    def __init__(self, pool_storage: RedisStorage, *args, **kwargs):
+    def __init__(
+        self,
+        pool_storage: RedisStorage,
+        namespace: Optional[str] = None,
+        *args,
+        **kwargs,
+    ):
         super().__init__(pool_storage, *args, **kwargs)
         self.storage = pool_storage
+        self.namespace = namespace
+        self.prefix = f"{settings.CACHE_KEY_PREFIX}:{namespace or 'default'}:"
+        self.codec = get_cache_codec()
+        self.local_ttl = settings.CACHE_LOCAL_NAMESPACES.get(namespace)
+        self.local: Optional[LocalCache] = None
+        self.invalidator: Optional[CacheInvalidator] = None
+        if self.local_ttl and isinstance(pool_storage, RedisStorage):
+            self.invalidator = CacheInvalidator.for_storage(pool_storage)
+            self.local = self.invalidator.local_cache(namespace)
+
+    @staticmethod
+    def _seconds(expire: Optional[int | timedelta]) -> float:
+        if isinstance(expire, timedelta):
+            return expire.total_seconds()
+        return float(expire or settings.REDIS_EXPIRE)
+
+    def _local_ttl(self, ttl: Optional[float]) -> float:
+        return min(self.local_ttl, ttl) if ttl else self.local_ttl
+
+    def _key(self, key: Any) -> str:
+        return f"{self.prefix}{key}"
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}-tags:{tag}"
 
+    def _tag(
+        self,
+        keys: list[Any],
+        tags: Optional[list[str]],
+        expire: Optional[int | timedelta],
+    ) -> None:
+        if tags:
+            self.storage.add_tags(
+                keys=[self._key(key) for key in keys],
+                tags=[self._tag_key(tag) for tag in tags],
+                expire=math.ceil(self._seconds(expire)),
+            )
+
+    def _get_raw(self, key: Any) -> Optional[bytes]:
+        if self.local is None:
+            data = self.storage.get(key=self._key(key))
+        else:
+            data = self.local.get(str(key))
+            if data is not None:
+                observe_cache_read(self.namespace, "local_hit")
+                return data
+            data, ttl = self.storage.get_with_ttl(key=self._key(key))
+            if data:
+                self.local.set(str(key), data, self._local_ttl(ttl))
+        observe_cache_read(self.namespace, "hit" if data else "miss")
+        return data
+
+    def _set_raw(
+        self,
+        key: Any,
+        data: bytes,
+        expire: Optional[int | timedelta] = None,
+        tags: Optional[list[str]] = None,
+    ) -> None:
+        self.storage.set(key=self._key(key), value=data, expire=expire)
+        self._tag([key], tags, expire)
+        observe_cache_set(self.namespace)
+        if self.local is not None:
+            self.local.set(str(key), data, self._local_ttl(self._seconds(expire)))
+            self.invalidator.publish(self.namespace, str(key))
+
+    @observed("get_value")
     def get_value(
         self,
         key: Any,
     ) -> Optional[Any]:
-        value_json = self.storage.get(key=key)
-        if value_json:
-            return json.loads(value_json)
+        data = self._get_raw(key=key)
+        if data:
+            return self.codec.decode(data)
         return None
 
+    @observed("set_value")
     def set_value(
         self,
         key: Any,
         value: Any,
         expire: Optional[int | timedelta] = None,
+        tags: Optional[list[str]] = None,
     ) -> None:
-        value_json = json.dumps(value)
-        self.storage.set(key=key, value=value_json, expire=expire)
+        self._set_raw(key=key, data=self.codec.encode(value), expire=expire, tags=tags)
+
+    @observed("get_or_set")
+    def get_or_set(
+        self,
+        key: Any,
+        loader: Callable[[], Any],
+        ttl: Optional[int | timedelta] = None,
+        serve_stale: bool = False,
+        tags: Optional[list[str]] = None,
+    ) -> Any:
+        """
+        Return the cached value of ``key``, computing it with ``loader`` on a miss.
+
+        Only the holder of a short Redis lock runs the loader, concurrent
+        callers wait for its result instead of recomputing. Entries are
+        refreshed early with a probability growing as the expiry nears and
+        with the time the loader took (XFetch), so hot keys rarely expire
+        at all. With ``serve_stale`` an expired entry is kept for
+        ``CACHE_STALE_TTL`` more seconds and returned while one caller
+        refreshes it in the background. Entries are stored wrapped, anything
+        else found at the key, such as a ``set_value`` value, counts as a miss.
+        """
+        ttl_seconds = self._seconds(ttl)
+        entry = self._entry(self._get_raw(key=key))
+        if entry is not None:
+            value, delta, expires_at = entry
+            now = time.time()
+            early = delta * settings.CACHE_XFETCH_BETA * -math.log(1 - random.random())
+            if now + early < expires_at:
+                return value
+            if now < expires_at:
+                # Early refresh, whoever loses the lock keeps the current value
+                return self._refresh(key, loader, ttl_seconds, serve_stale, tags, value)
+            if serve_stale:
+                return self._refresh(
+                    key, loader, ttl_seconds, serve_stale, tags, value, background=True
+                )
+
+        return self._refresh(key, loader, ttl_seconds, serve_stale, tags)
+
+    def _refresh(
+        self,
+        key: Any,
+        loader: Callable[[], Any],
+        ttl: float,
+        serve_stale: bool,
+        tags: Optional[list[str]],
+        current: Any = _NO_VALUE,
+        background: bool = False,
+    ) -> Any:
+        lock_key = f"{self._key(key)}:lock"
+        token = uuid4().hex
+        lock_timeout = settings.CACHE_LOCK_TIMEOUT
+        if self.storage.acquire_lock(key=lock_key, token=token, timeout=lock_timeout):
+            if background:
+                threading.Thread(
+                    target=self._load,
+                    args=(key, loader, ttl, serve_stale, tags, lock_key, token),
+                    name="cache-refresh",
+                    daemon=True,
+                ).start()
+                return current
+            return self._load(key, loader, ttl, serve_stale, tags, lock_key, token)
+
+        if current is not _NO_VALUE:
+            return current
 
+        # Another caller is loading, wait for its result up to the lock timeout
+        deadline = time.monotonic() + lock_timeout
+        delay = 0.01
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
+            entry = self._entry(self.storage.get(key=self._key(key)))
+            if entry is not None:
+                value, _, expires_at = entry
+                if time.time() < expires_at:
+                    return value
+        return loader()
+
+    def _entry(self, data: Optional[bytes]) -> Optional[tuple[Any, float, float]]:
+        """Decode a get_or_set entry, ``None`` for anything else stored at the key."""
+        entry = self.codec.decode(data) if data else None
+        if not isinstance(entry, dict) or entry.keys() != {_ENTRY_TAG}:
+            return None
+        entry = entry[_ENTRY_TAG]
+        if (
+            not isinstance(entry, list)
+            or len(entry) != 3
+            or not all(isinstance(number, (int, float)) for number in entry[1:])
+        ):
+            return None
+        value, delta, expires_at = entry
+        return value, delta, expires_at
+
+    def _load(
+        self,
+        key: Any,
+        loader: Callable[[], Any],
+        ttl: float,
+        serve_stale: bool,
+        tags: Optional[list[str]],
+        lock_key: str,
+        token: str,
+    ) -> Any:
+        try:
+            started = time.monotonic()
+            value = loader()
+            delta = time.monotonic() - started
+            expire = ttl + settings.CACHE_STALE_TTL if serve_stale else ttl
+            self._set_raw(
+                key=key,
+                data=self.codec.encode({_ENTRY_TAG: [value, delta, time.time() + ttl]}),
+                expire=math.ceil(expire),
+                tags=tags,
+            )
+            return value
+        except Exception as error:
+            logger.exception("Cache refresh of %s failed: %s", key, error)
+            raise
+        finally:
+            self.storage.release_lock(key=lock_key, token=token)
+
+    @observed("delete_value")
     def delete_value(
         self,
         key: Any,
     ) -> None:
-        self.storage.delete(key=key)
+        self.storage.delete(key=self._key(key))
+        if self.local is not None:
+            self.local.delete(str(key))
+            self.invalidator.publish(self.namespace, str(key))
+
+    @observed("get_many")
+    def get_many(
+        self,
+        keys: list[Any],
+    ) -> list[Optional[Any]]:
+        """Return the values of ``keys`` in order, ``None`` for missing ones."""
+        values_data: list[Optional[bytes]] = [None] * len(keys)
+        missing = list(range(len(keys)))
+        if self.local is not None:
+            missing = []
+            for index, key in enumerate(keys):
+                values_data[index] = self.local.get(str(key))
+                if values_data[index] is None:
+                    missing.append(index)
+
+        if missing:
+            missing_keys = [keys[index] for index in missing]
+            storage_keys = [self._key(key) for key in missing_keys]
+            if self.local is None:
+                fetched = self.storage.get_many(keys=storage_keys)
+            else:
+                fetched = []
+                for key, (data, ttl) in zip(
+                    missing_keys, self.storage.get_many_with_ttl(keys=storage_keys)
+                ):
+                    if data:
+                        self.local.set(str(key), data, self._local_ttl(ttl))
+                    fetched.append(data)
+            for index, data in zip(missing, fetched):
+                values_data[index] = data
+            hits = sum(1 for data in fetched if data)
+            observe_cache_read(self.namespace, "hit", hits)
+            observe_cache_read(self.namespace, "miss", len(fetched) - hits)
+        observe_cache_read(self.namespace, "local_hit", len(keys) - len(missing))
 
+        return [self.codec.decode(value) if value else None for value in values_data]
+
+    @observed("set_many")
+    def set_many(
+        self,
+        mapping: dict[Any, Any],
+        expire: Optional[int | timedelta] = None,
+        tags: Optional[list[str]] = None,
+    ) -> None:
+        values_data = {key: self.codec.encode(value) for key, value in mapping.items()}
+        self.storage.set_many(
+            mapping={self._key(key): data for key, data in values_data.items()},
+            expire=expire,
+        )
+        self._tag(list(mapping), tags, expire)
+        observe_cache_set(self.namespace, len(mapping))
+        if self.local is not None:
+            local_ttl = self._local_ttl(self._seconds(expire))
+            for key, data in values_data.items():
+                self.local.set(str(key), data, local_ttl)
+            self.invalidator.publish_many(self.namespace, [str(key) for key in mapping])
+
+    @observed("delete_many")
+    def delete_many(
+        self,
+        keys: list[Any],
+    ) -> int:
+        deleted = self.storage.delete_many(keys=[self._key(key) for key in keys])
+        if self.local is not None:
+            for key in keys:
+                self.local.delete(str(key))
+            self.invalidator.publish_many(self.namespace, [str(key) for key in keys])
+        return deleted
+
+    @observed("exists_all_values")
     def exists_all_values(
         self,
         key: Any,
     ) -> bool:
-        return self.storage.exists(key=key)
+        return self.storage.exists(key=self._key(key))
+
+    @observed("invalidate_tag")
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete every key tagged with ``tag``, in any namespace."""
+        deleted = self.storage.delete_tagged(tag=self._tag_key(tag))
+        invalidator = self._local_invalidator()
+        if invalidator is not None:
+            root = f"{settings.CACHE_KEY_PREFIX}:"
+            by_namespace: dict[str, list[str]] = {}
+            for key in deleted:
+                key = key.decode() if isinstance(key, bytes) else key
+                namespace, _, local_key = key.removeprefix(root).partition(":")
+                by_namespace.setdefault(namespace, []).append(local_key)
+            for namespace, keys in by_namespace.items():
+                invalidator.evict(namespace, keys)
+        return len(deleted)
+
+    @observed("clear_namespace")
+    def clear_namespace(self, namespace: Optional[str] = None) -> int:
+        """Delete every key of ``namespace``, the handler namespace by default."""
+        namespace = namespace or self.namespace or "default"
+        deleted = self.storage.delete_pattern(
+            pattern=f"{settings.CACHE_KEY_PREFIX}:{escape_pattern(namespace)}:*"
+        )
+        invalidator = self._local_invalidator()
+        if invalidator is not None:
+            invalidator.evict(namespace)
+        return deleted
+
+    def _local_invalidator(self) -> Optional[CacheInvalidator]:
+        if self.invalidator is None and settings.CACHE_LOCAL_NAMESPACES:
+            if isinstance(self.storage, RedisStorage):
+                self.invalidator = CacheInvalidator.for_storage(self.storage)
+        return self.invalidator
 
     def delete_all_values(self) -> None:
-        self.storage.flush()
+        self.clear_namespace()
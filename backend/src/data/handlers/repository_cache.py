@@ -0,0 +1,230 @@
+import functools
+import hashlib
+import logging
+from typing import Any, Callable, Optional, TypeVar
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.functional import cached_property
+from redis.exceptions import RedisError
+
+from src.core.config import get_repository_cache_storage
+from src.data.handlers.redis_handler import CacheHandler
+from src.data.interfaces import ICacheStorage
+
+logger = logging.getLogger(__name__)
+
+ModelType = TypeVar("ModelType", bound=models.Model)
+
+# Cached marker of a lookup that found no row
+MISSING = False
+
+
+class RepositoryCache:
+    """
+    Read-through cache of single-row repository lookups.
+
+    A row is stored once, as a compact list of its column values under
+    ``<model>:<version>:<key_field>:<value>`` of the cache namespace. Lookups by other
+    unique fields cache a pointer to the row key, which is checked against
+    the row on read, so a pointer left behind by a changed email or username
+    is ignored. The version is derived from the model columns, a migration
+    never reads snapshots written by the old schema.
+
+    Misses are cached as well, with a short TTL. Every save or delete of the
+    model drops the row and the pointers of its current values, immediately
+    and again once the transaction commits.
+
+    Fields in ``exclude_fields``, like password hashes, are never written to
+    the cache, they are deferred on cached rows and read from the database
+    when accessed.
+
+    Rows are stored in ``CACHE_REPOSITORY_STORAGE``. Saves made by another
+    process only reach a shared storage, with a per-process storage the
+    cache is disabled and every lookup reads the database.
+
+    Attributes:
+        model (type[Model]): Cached model.
+        key_field (str): Unique field the row snapshots are stored under.
+        exclude_fields (list[str]): Fields left out of the row snapshots.
+        namespace (str): Cache namespace.
+        handler (CacheHandler): Cache handler, created on first use.
+        enabled (bool): Whether the storage is shared by every process.
+
+    Methods:
+        lookup(field: str, ttl: Optional[int] = None, negative_ttl: Optional[int] = None)
+        invalidate(instance: Model)
+
+    Usage:
+        user_cache = RepositoryCache(
+            User, key_field="id", pointer_fields=["email"], exclude_fields=["password"]
+        )
+
+        class UserRepository:
+            @user_cache.lookup("id", ttl=300)
+            def get_user_by_id(self, user_id: UUID) -> Optional[User]:
+                ...
+    """
+
+    def __init__(
+        self,
+        model: type[ModelType],
+        key_field: str = "id",
+        pointer_fields: Optional[list[str]] = None,
+        namespace: str = "repositories",
+        exclude_fields: Optional[list[str]] = None,
+    ):
+        self.model = model
+        self.key_field = key_field
+        self.pointer_fields = pointer_fields or []
+        self.namespace = namespace
+        self.exclude_fields = exclude_fields or []
+        excluded = {model._meta.get_field(name) for name in self.exclude_fields}
+        if {key_field, *self.pointer_fields} & {field.name for field in excluded}:
+            raise ValueError("Key and pointer fields cannot be excluded from the cache")
+        self.fields = [
+            field for field in model._meta.concrete_fields if field not in excluded
+        ]
+        self.key_attname = model._meta.get_field(key_field).attname
+        columns = ",".join(field.attname for field in self.fields)
+        schema = f"{settings.CACHE_REPOSITORY_VERSION}:{columns}"
+        self.version = hashlib.blake2b(schema.encode(), digest_size=4).hexdigest()
+        self.prefix = f"{model._meta.label_lower}:{self.version}"
+
+        dispatch_uid = f"repository-cache:{namespace}:{self.prefix}"
+        post_save.connect(self._on_change, sender=model, dispatch_uid=dispatch_uid)
+        post_delete.connect(self._on_change, sender=model, dispatch_uid=dispatch_uid)
+
+    @cached_property
+    def storage(self) -> ICacheStorage:
+        return get_repository_cache_storage()
+
+    @cached_property
+    def enabled(self) -> bool:
+        if not self.storage.shared:
+            logger.warning(
+                "Repository cache of %s disabled, %s is not shared by processes",
+                self.model._meta.label,
+                settings.CACHE_REPOSITORY_STORAGE,
+            )
+        return self.storage.shared
+
+    @cached_property
+    def handler(self) -> CacheHandler:
+        return CacheHandler(pool_storage=self.storage, namespace=self.namespace)
+
+    def _key(self, field: str, value: Any) -> str:
+        return f"{self.prefix}:{field}:{value}"
+
+    def _attname(self, field: str) -> str:
+        return self.model._meta.get_field(field).attname
+
+    def _snapshot(self, instance: ModelType) -> list[Optional[str]]:
+        values = []
+        for field in self.fields:
+            value = field.value_from_object(instance)
+            values.append(None if value is None else field.value_to_string(instance))
+        return values
+
+    def _restore(self, snapshot: list[Optional[str]]) -> ModelType:
+        values = [
+            None if value is None else field.to_python(value)
+            for field, value in zip(self.fields, snapshot)
+        ]
+        return self.model.from_db(
+            None, [field.attname for field in self.fields], values
+        )
+
+    def _read(self, field: str, value: Any) -> tuple[bool, Optional[ModelType]]:
+        """Return whether the lookup was cached and the cached row."""
+        cached = self.handler.get_value(key=self._key(field, value))
+        if cached is None:
+            return False, None
+        if cached is MISSING:
+            return True, None
+        if field == self.key_field:
+            return True, self._restore(cached)
+
+        snapshot = self.handler.get_value(key=self._key(self.key_field, cached))
+        if not snapshot:
+            return False, None
+        instance = self._restore(snapshot)
+        if str(getattr(instance, self._attname(field))) != str(value):
+            return False, None
+        return True, instance
+
+    def _write(
+        self,
+        field: str,
+        value: Any,
+        instance: Optional[ModelType],
+        ttl: int,
+        negative_ttl: int,
+    ) -> None:
+        if instance is None:
+            self.handler.set_value(
+                key=self._key(field, value), value=MISSING, expire=negative_ttl
+            )
+            return
+        key_value = str(getattr(instance, self.key_attname))
+        mapping: dict[str, Any] = {
+            self._key(self.key_field, key_value): self._snapshot(instance)
+        }
+        if field != self.key_field:
+            mapping[self._key(field, value)] = key_value
+        self.handler.set_many(mapping=mapping, expire=ttl)
+
+    def lookup(
+        self,
+        field: str,
+        ttl: Optional[int] = None,
+        negative_ttl: Optional[int] = None,
+    ) -> Callable:
+        """Cache a repository method returning the row where ``field`` equals its argument."""
+        ttl = ttl or settings.CACHE_REPOSITORY_TTL
+        negative_ttl = negative_ttl or settings.CACHE_REPOSITORY_NEGATIVE_TTL
+
+        def decorator(method: Callable) -> Callable:
+            @functools.wraps(method)
+            def wrapper(repository: Any, *args, **kwargs) -> Optional[ModelType]:
+                if not self.enabled:
+                    return method(repository, *args, **kwargs)
+                value = args[0] if args else next(iter(kwargs.values()))
+                try:
+                    hit, instance = self._read(field, value)
+                    if hit:
+                        return instance
+                except (RedisError, TypeError, ValueError) as error:
+                    logger.warning("Repository cache read failed: %s", error)
+
+                instance = method(repository, *args, **kwargs)
+                try:
+                    self._write(field, value, instance, ttl, negative_ttl)
+                except (RedisError, TypeError, ValueError) as error:
+                    logger.warning("Repository cache write failed: %s", error)
+                return instance
+
+            return wrapper
+
+        return decorator
+
+    def invalidate(self, instance: ModelType) -> None:
+        if not self.enabled:
+            return
+        keys = [self._key(self.key_field, getattr(instance, self.key_attname))]
+        keys.extend(
+            self._key(field, getattr(instance, self._attname(field)))
+            for field in self.pointer_fields
+        )
+        try:
+            self.handler.delete_many(keys=keys)
+        except RedisError as error:
+            logger.warning("Repository cache invalidation failed: %s", error)
+
+    def _on_change(
+        self, sender: type[ModelType], instance: ModelType, **kwargs
+    ) -> None:
+        self.invalidate(instance)
+        # Readers may cache the old row again until the transaction commits
+        transaction.on_commit(functools.partial(self.invalidate, instance))
@@ -1,21 +1,31 @@
 from src.data.interfaces.client.abstract_client import IClient
+from src.data.interfaces.codec.abstract_codec import ICodec
+from src.data.interfaces.handler.abstract_async_event import IAsyncEventHandler
 from src.data.interfaces.handler.abstract_cache import ICacheHandler
 from src.data.interfaces.handler.abstract_event import IEventHandler
 from src.data.interfaces.handler.abstract_file import IFileHandler
 from src.data.interfaces.handler.abstract_mail import IRegistrationEmailHandler
 from src.data.interfaces.handler.abstract_phone import IPhoneHandler
+from src.data.interfaces.managers.abstract_async_event_manager import (
+    IAsyncEventManager,
+)
 from src.data.interfaces.managers.abstract_event_manager import IEventManager
 from src.data.interfaces.storage.abstract_cache import ICacheStorage
 from src.data.interfaces.storage.abstract_cloud import ICloudStorage
+from src.data.interfaces.storage.abstract_multipart import IMultipartClient
 
 __all__ = [
     "IClient",
+    "ICodec",
     "ICacheHandler",
     "IFileHandler",
     "ICacheStorage",
     "ICloudStorage",
+    "IMultipartClient",
     "IRegistrationEmailHandler",
     "IEventManager",
     "IEventHandler",
+    "IAsyncEventManager",
+    "IAsyncEventHandler",
     "IPhoneHandler",
 ]
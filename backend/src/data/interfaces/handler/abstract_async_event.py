@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from src.data.events import EventEnvelope
+
+
+class IAsyncEventHandler(ABC):
+    @abstractmethod
+    async def start_handlers(self) -> None:
+        pass
+
+    @abstractmethod
+    async def stop_handlers(self) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, event_name: str, event_data: Any) -> None:
+        pass
+
+    @abstractmethod
+    async def request(
+        self,
+        event_name: str,
+        event_data: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        pass
+
+    @abstractmethod
+    async def reply(
+        self,
+        request: "EventEnvelope",
+        event_data: Any,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def subscribe(self, event_name: str) -> None:
+        pass
+
+    @abstractmethod
+    async def receive(
+        self,
+        event_name: str,
+        timeout: Optional[None | float] = None,
+        with_subscription: bool = False,
+    ) -> Optional["EventEnvelope"]:
+        pass
@@ -25,6 +25,7 @@ class ICacheHandler(ABC):
         key: Any,
         value: Any,
         expire: Optional[int | timedelta] = None,
+        tags: Optional[list[str]] = None,
     ) -> None:
         pass
 
@@ -35,6 +36,43 @@ class ICacheHandler(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    def get_many(
+        self,
+        keys: list[Any],
+    ) -> list[Optional[Any]]:
+        pass
+
+    @abstractmethod
+    def set_many(
+        self,
+        mapping: dict[Any, Any],
+        expire: Optional[int | timedelta] = None,
+        tags: Optional[list[str]] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def delete_many(
+        self,
+        keys: list[Any],
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def invalidate_tag(
+        self,
+        tag: str,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def clear_namespace(
+        self,
+        namespace: Optional[str] = None,
+    ) -> int:
+        pass
+
     @abstractmethod
     def exists_all_values(
         self,
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from src.data.events import EventEnvelope
 
 
 class IEventHandler(ABC):
@@ -7,12 +10,33 @@ class IEventHandler(ABC):
     def start_handlers(self) -> None:
         pass
 
+    @abstractmethod
+    def stop_handlers(self, timeout: Optional[float] = None) -> None:
+        pass
+
     @abstractmethod
     def start_subscribers(self) -> None:
         pass
 
     @abstractmethod
-    def publish(self, event_name: str, event_data: Union[str, dict]) -> None:
+    def publish(self, event_name: str, event_data: Any) -> None:
+        pass
+
+    @abstractmethod
+    def request(
+        self,
+        event_name: str,
+        event_data: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        pass
+
+    @abstractmethod
+    def reply(
+        self,
+        request: "EventEnvelope",
+        event_data: Any,
+    ) -> None:
         pass
 
     @abstractmethod
@@ -25,5 +49,5 @@ class IEventHandler(ABC):
         event_name: str,
         timeout: Optional[None | float] = None,
         with_subscription: bool = False,
-    ) -> Optional[dict]:
+    ) -> Optional["EventEnvelope"]:
         pass
@@ -20,7 +20,14 @@ class IFileHandler(ABC):
         self,
         filename: str,
         object_key: Optional[ObjectType] = None,
-    ) -> str:
+    ) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def get_media_many(
+        self,
+        files: list[tuple[str, Optional[ObjectType]]],
+    ) -> list[Optional[str]]:
         pass
 
     @abstractmethod
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from src.data.events import EventEnvelope
+
+
+class IAsyncEventManager(ABC):
+    @abstractmethod
+    async def publish(
+        self,
+        event_name: str,
+        event_data: Any,
+    ) -> int:
+        """Return the number of subscribers reached, a stored entry counts as one."""
+        pass
+
+    @abstractmethod
+    async def subscribe(
+        self,
+        event_name: Optional[str] = None,
+        event_list: Optional[list[str]] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def unsubscribe(
+        self,
+        event_name: str,
+        event_list: Optional[list[str]] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def receive(
+        self,
+        event_name: str,
+        timeout: Optional[None | float] = None,
+    ) -> Optional["EventEnvelope"]:
+        pass
+
+    @abstractmethod
+    def is_subscribed(
+        self,
+        event_name: str,
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
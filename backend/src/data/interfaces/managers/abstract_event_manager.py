@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from src.data.events import EventEnvelope
 
 
 class IEventManager(ABC):
@@ -7,8 +10,9 @@ class IEventManager(ABC):
     def publish(
         self,
         event_name: str,
-        event_data: str | dict,
-    ) -> None:
+        event_data: Any,
+    ) -> int:
+        """Return the number of subscribers reached, a stored entry counts as one."""
         pass
 
     @abstractmethod
@@ -32,7 +36,7 @@ class IEventManager(ABC):
         self,
         event_name: str,
         timeout: Optional[None | float] = None,
-    ) -> Optional[dict]:
+    ) -> Optional["EventEnvelope"]:
         pass
 
     @abstractmethod
@@ -41,3 +45,11 @@ class IEventManager(ABC):
         event_name: str,
     ) -> bool:
         pass
+
+    def acknowledge(
+        self,
+        event_name: str,
+        envelope: "EventEnvelope",
+    ) -> None:
+        """Confirm a received event was handled, a no-op for non-durable managers."""
+        pass
@@ -4,6 +4,9 @@ from typing import Any, Optional
 
 
 class ICacheStorage(ABC):
+    # Whether every process and node sees the same keys
+    shared: bool = True
+
     @abstractmethod
     def set(
         self,
@@ -20,6 +23,35 @@ class ICacheStorage(ABC):
     ) -> str:
         pass
 
+    @abstractmethod
+    def get_with_ttl(
+        self,
+        key: Any,
+    ) -> tuple[Optional[str], Optional[float]]:
+        pass
+
+    @abstractmethod
+    def get_many(
+        self,
+        keys: list[Any],
+    ) -> list[Optional[str]]:
+        pass
+
+    @abstractmethod
+    def get_many_with_ttl(
+        self,
+        keys: list[Any],
+    ) -> list[tuple[Optional[str], Optional[float]]]:
+        pass
+
+    @abstractmethod
+    def set_many(
+        self,
+        mapping: dict[Any, Any],
+        expire: Optional[int | timedelta] = None,
+    ) -> None:
+        pass
+
     @abstractmethod
     def delete(
         self,
@@ -27,6 +59,53 @@ class ICacheStorage(ABC):
     ) -> bool:
         pass
 
+    @abstractmethod
+    def delete_many(
+        self,
+        keys: list[Any],
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def add_tags(
+        self,
+        keys: list[Any],
+        tags: list[str],
+        expire: int,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def delete_tagged(
+        self,
+        tag: str,
+    ) -> list[Any]:
+        pass
+
+    @abstractmethod
+    def delete_pattern(
+        self,
+        pattern: str,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def acquire_lock(
+        self,
+        key: Any,
+        token: str,
+        timeout: float,
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    def release_lock(
+        self,
+        key: Any,
+        token: str,
+    ) -> bool:
+        pass
+
     @abstractmethod
     def flush(self) -> bool:
         pass
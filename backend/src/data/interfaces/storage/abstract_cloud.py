@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, TypeVar, Union
+from typing import BinaryIO, Iterable, Iterator, Optional, TypeVar, Union
 from uuid import UUID
 
 from ninja.files import UploadedFile
@@ -50,6 +50,17 @@ class ICloudStorage(ABC):
     ) -> bool:
         pass
 
+    @abstractmethod
+    def upload_stream(
+        self,
+        full_object_key: str,
+        data: Union[BinaryIO, bytes, Iterable[bytes]],
+        length: Optional[int] = None,
+        content_type: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> bool:
+        pass
+
     @abstractmethod
     def get_file(
         self,
@@ -59,6 +70,21 @@ class ICloudStorage(ABC):
     ) -> Optional[str]:
         pass
 
+    @abstractmethod
+    def get_object_data(
+        self,
+        full_object_key: str,
+    ) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def get_presigned_url(
+        self,
+        full_object_key: str,
+        expire: int,
+    ) -> Optional[str]:
+        pass
+
     @abstractmethod
     def delete_file(
         self,
@@ -69,6 +95,13 @@ class ICloudStorage(ABC):
     ) -> bool:
         pass
 
+    @abstractmethod
+    def list_object_keys(
+        self,
+        prefix: Optional[str] = None,
+    ) -> Iterator[str]:
+        pass
+
     def is_object_exist(
         self,
         full_object_key: ObjectType,
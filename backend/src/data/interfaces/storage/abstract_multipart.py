@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class IMultipartClient(ABC):
+    @abstractmethod
+    def create(
+        self,
+        full_object_key: str,
+        content_type: Optional[str] = None,
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def upload_part(
+        self,
+        full_object_key: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def list_parts(
+        self,
+        full_object_key: str,
+        upload_id: str,
+    ) -> dict[int, str]:
+        pass
+
+    @abstractmethod
+    def complete(
+        self,
+        full_object_key: str,
+        upload_id: str,
+        parts: dict[int, str],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def abort(
+        self,
+        full_object_key: str,
+        upload_id: str,
+    ) -> None:
+        pass
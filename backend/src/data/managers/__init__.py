@@ -1,7 +1,20 @@
+from src.data.managers.async_event_manager import AsyncEventManager
+from src.data.managers.dead_letter_manager import DeadLetter, DeadLetterManager
+from src.data.managers.event_dispatcher import EventDispatcher
 from src.data.managers.event_manager import EventManager
+from src.data.managers.handler_executor import HandlerExecutor
+from src.data.managers.in_process_event_manager import InProcessEventManager
 from src.data.managers.mail_manager import MailManager
+from src.data.managers.stream_event_manager import StreamEventManager
 
 __all__ = [
+    "AsyncEventManager",
+    "DeadLetter",
+    "DeadLetterManager",
+    "EventDispatcher",
     "EventManager",
+    "HandlerExecutor",
+    "InProcessEventManager",
     "MailManager",
+    "StreamEventManager",
 ]
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+from typing import Any, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError, TimeoutError
+
+from src.data.clients import RedisPoolRegistry
+from src.data.events import EventEnvelope
+from src.data.interfaces import IAsyncEventManager
+from src.data.metrics import observe_published, observe_received
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEventManager(IAsyncEventManager):
+    """
+    Class for managing events on the asyncio event loop.
+
+    A single reader task owns the Redis PubSub connection and fans incoming
+    messages into per-channel asyncio queues, waiting for an event costs a
+    coroutine instead of an OS thread.
+
+    Attributes:
+        redis (Redis): Async Redis instance.
+        pubsub (PubSub): Async Redis PubSub instance.
+        queue_size (int): Maximum number of pending messages per channel.
+
+    Methods:
+        publish(event_name: str, event_data: dict)
+        subscribe(event_name: Optional[str] = None, event_list: Optional[list[str]] = None)
+        unsubscribe(event_name: str, event_list: Optional[list[str]] = None)
+        receive(event_name: str, timeout: Optional[float] = None)
+        close()
+
+    Usage:
+        event_manager = AsyncEventManager()
+        await event_manager.subscribe("test_event")
+        await event_manager.publish("test_event", {"key": "value"})
+        await event_manager.receive("test_event", timeout=2)
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        queue_size: int = 1000,
+        poll_timeout: float = 1.0,
+    ):
+        self.redis = redis or Redis(
+            connection_pool=RedisPoolRegistry.get_async_pool(decode_responses=False)
+        )
+        self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self.queue_size = queue_size
+        self.poll_timeout = poll_timeout
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._reader: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _validate_event_name(event_name: str):
+        if not isinstance(event_name, str):
+            raise TypeError("'event_name' must be a string")
+
+    @staticmethod
+    def _validate_event_list(event_list: list[str]):
+        if not isinstance(event_list, list):
+            raise TypeError("'event_list' must be a list of event names")
+        if not all(isinstance(event, str) for event in event_list):
+            raise ValueError("All elements in 'event_list' must be strings")
+
+    async def publish(
+        self,
+        event_name: str,
+        event_data: Any,
+    ) -> int:
+        envelope = EventEnvelope.create(event_name=event_name, event_data=event_data)
+        receivers = await self.redis.publish(
+            channel=event_name, message=envelope.encode()
+        )
+        observe_published(event_name)
+        logger.info(
+            "[yellow]Publish[/] Event: [red]%s[/] with data: [blue]%s[/]",
+            event_name,
+            envelope.payload,
+            extra={"markup": True},
+        )
+        return receivers
+
+    async def subscribe(
+        self,
+        event_name: Optional[str] = None,
+        event_list: Optional[list[str]] = None,
+    ) -> None:
+        if not event_name and not event_list:
+            raise ValueError("Either 'event_name' or 'event_list' must be provided")
+
+        if event_list:
+            self._validate_event_list(event_list)
+        else:
+            self._validate_event_name(event_name)
+            event_list = [event_name]
+
+        new_channels = [event for event in event_list if event not in self._queues]
+        for channel in new_channels:
+            self._queues[channel] = asyncio.Queue(maxsize=self.queue_size)
+        if new_channels:
+            await self.pubsub.subscribe(*new_channels)
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._run())
+        logger.info(
+            "[yellow]Subscribe[/] to events [red]%s[/]",
+            event_list,
+            extra={"markup": True},
+        )
+
+    async def unsubscribe(
+        self,
+        event_name: str,
+        event_list: Optional[list[str]] = None,
+    ) -> None:
+        if not event_name and not event_list:
+            raise ValueError("Either 'event_name' or 'event_list' must be provided")
+
+        if event_name:
+            self._validate_event_name(event_name)
+            event_list = [event_name]
+        else:
+            self._validate_event_list(event_list)
+
+        known_channels = [event for event in event_list if event in self._queues]
+        for channel in known_channels:
+            del self._queues[channel]
+        if known_channels:
+            await self.pubsub.unsubscribe(*known_channels)
+        logger.info(
+            "[yellow]Unsubscribed[/] to events [red]%s[/]",
+            event_list,
+            extra={"markup": True},
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                message = await self.pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self.poll_timeout,
+                )
+            except (ConnectionError, TimeoutError) as error:
+                logger.warning("Async event reader connection error: %s", error)
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            if message and message.get("type") == "message":
+                self._dispatch(message)
+
+    def _dispatch(self, message: dict) -> None:
+        channel = message.get("channel")
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+            message["channel"] = channel
+        channel_queue = self._queues.get(channel)
+        if channel_queue is None:
+            return
+        if channel_queue.full():
+            channel_queue.get_nowait()
+            logger.warning(
+                "Event queue full for channel [red]%s[/], dropped oldest message",
+                message.get("channel"),
+                extra={"markup": True},
+            )
+        channel_queue.put_nowait(message)
+
+    async def receive(
+        self,
+        event_name: str,
+        timeout: Optional[None | float] = None,
+    ) -> Optional[EventEnvelope]:
+        channel_queue = self._queues.get(event_name)
+        if channel_queue is None:
+            logger.warning("Channel %s is not subscribed", event_name)
+            return None
+
+        try:
+            message = await asyncio.wait_for(channel_queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        try:
+            envelope = EventEnvelope.decode(message["data"], event_name=event_name)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Failed to decode data for event: [red]%s[/]",
+                event_name,
+                extra={"markup": True},
+            )
+            return None
+
+        observe_received(event_name, envelope.timestamp)
+        logger.info(
+            "[yellow]Receive[/] Event: [red]%s[/] with data: [blue]%s[/]",
+            event_name,
+            envelope.payload,
+            extra={"markup": True},
+        )
+        return envelope
+
+    def is_subscribed(self, event_name: str) -> bool:
+        return event_name in self._queues
+
+    async def close(self) -> None:
+        if self._reader:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+        await self.pubsub.aclose()
+        await self.redis.aclose()
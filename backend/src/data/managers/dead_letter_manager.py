@@ -0,0 +1,212 @@
+import logging
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from django.conf import settings
+
+from src.data.clients import RedisClient
+from src.data.events import EventEnvelope
+from src.data.metrics import EVENT_DEAD_LETTERS
+
+if TYPE_CHECKING:
+    from src.data.interfaces import IEventManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DeadLetter:
+    id: str
+    envelope: EventEnvelope
+    handler: str
+    error: str
+    attempts: int
+    failed_at: float
+
+
+class DeadLetterManager:
+    """
+    Class for managing events whose handlers kept failing.
+
+    Dead letters are kept in a single Redis stream, every entry holds the
+    original envelope, the handler, the last error and the number of
+    attempts, so they can be inspected and replayed in bulk.
+
+    Attributes:
+        client (RedisClient): Redis client.
+        redis (Redis): Redis instance.
+        stream (str): Dead-letter stream name.
+        maxlen (int): Approximate maximum length of the stream.
+
+    Methods:
+        push(envelope: EventEnvelope, handler: str, error: BaseException, attempts: int)
+        iter(event_name: Optional[str] = None, count: Optional[int] = None)
+        replay(manager: IEventManager, event_name: Optional[str] = None, ids: Optional[list[str]] = None)
+        purge(event_name: Optional[str] = None, ids: Optional[list[str]] = None)
+        count()
+
+    Usage:
+        dead_letters = DeadLetterManager()
+        dead_letters.push(envelope, "handle_user_created", error, attempts=3)
+        dead_letters.replay(get_event_manager(), event_name="user_created")
+    """
+
+    batch_size = 100
+
+    def __init__(
+        self,
+        client: Optional[RedisClient] = None,
+        stream: Optional[str] = None,
+        maxlen: Optional[int] = None,
+    ):
+        self.client = client or RedisClient(decode_responses=False)
+        self.redis = self.client.redis
+        self.stream = stream or settings.EVENT_DEAD_LETTER_STREAM
+        self.maxlen = maxlen or settings.EVENT_DEAD_LETTER_MAXLEN
+
+    def push(
+        self,
+        envelope: EventEnvelope,
+        handler: str,
+        error: BaseException,
+        attempts: int,
+    ) -> None:
+        self.redis.xadd(
+            name=self.stream,
+            fields={
+                "event": envelope.type,
+                "envelope": envelope.encode(),
+                "handler": handler,
+                "error": f"{error.__class__.__name__}: {error}",
+                "attempts": attempts,
+                "failed_at": time.time(),
+            },
+            maxlen=self.maxlen,
+            approximate=True,
+        )
+        EVENT_DEAD_LETTERS.labels(event=envelope.type).inc()
+        logger.error(
+            "[red]Dead letter[/] Event: [yellow]%s[/] handler: %s after %s attempts: %s",
+            envelope.type,
+            handler,
+            attempts,
+            error,
+            extra={"markup": True},
+        )
+
+    @staticmethod
+    def _field(fields: dict, name: str) -> Optional[str]:
+        value = fields.get(name.encode(), fields.get(name))
+        return value.decode() if isinstance(value, bytes) else value
+
+    def _to_dead_letter(self, message_id: bytes | str, fields: dict) -> DeadLetter:
+        event_name = self._field(fields, "event")
+        return DeadLetter(
+            id=message_id.decode() if isinstance(message_id, bytes) else message_id,
+            envelope=EventEnvelope.decode(
+                fields.get(b"envelope") or fields["envelope"],
+                event_name=event_name,
+            ),
+            handler=self._field(fields, "handler"),
+            error=self._field(fields, "error"),
+            attempts=int(self._field(fields, "attempts") or 0),
+            failed_at=float(self._field(fields, "failed_at") or 0),
+        )
+
+    def iter(
+        self,
+        event_name: Optional[str] = None,
+        count: Optional[int] = None,
+    ) -> Iterator[DeadLetter]:
+        """Yield dead letters from the oldest, reading the stream in batches."""
+        start = "-"
+        yielded = 0
+        while count is None or yielded < count:
+            entries = self.redis.xrange(self.stream, min=start, count=self.batch_size)
+            if not entries:
+                return
+            for message_id, fields in entries:
+                dead_letter = self._to_dead_letter(message_id, fields)
+                if event_name and dead_letter.envelope.type != event_name:
+                    continue
+                yield dead_letter
+                yielded += 1
+                if count is not None and yielded >= count:
+                    return
+            last_id = entries[-1][0]
+            start = "(" + (last_id.decode() if isinstance(last_id, bytes) else last_id)
+
+    def _select(
+        self,
+        event_name: Optional[str] = None,
+        ids: Optional[list[str]] = None,
+        count: Optional[int] = None,
+    ) -> Iterator[DeadLetter]:
+        if not ids:
+            yield from self.iter(event_name=event_name, count=count)
+            return
+        yielded = 0
+        for message_id in ids:
+            for entry_id, fields in self.redis.xrange(
+                self.stream, min=message_id, max=message_id
+            ):
+                dead_letter = self._to_dead_letter(entry_id, fields)
+                if event_name and dead_letter.envelope.type != event_name:
+                    continue
+                yield dead_letter
+                yielded += 1
+                if count is not None and yielded >= count:
+                    return
+
+    def replay(
+        self,
+        manager: "IEventManager",
+        event_name: Optional[str] = None,
+        ids: Optional[list[str]] = None,
+        count: Optional[int] = None,
+    ) -> int:
+        """
+        Publish dead letters again and remove the delivered ones from the stream.
+
+        Dead letters published to no subscriber, like PubSub events without
+        a running handler, are kept for a later replay.
+        """
+        replayed: list[str] = []
+        for dead_letter in self._select(event_name=event_name, ids=ids, count=count):
+            receivers = manager.publish(
+                event_name=dead_letter.envelope.type,
+                event_data=replace(dead_letter.envelope, timestamp=time.time()),
+            )
+            if not receivers:
+                logger.warning(
+                    "Dead letter %s of event [yellow]%s[/] reached no subscriber, kept",
+                    dead_letter.id,
+                    dead_letter.envelope.type,
+                    extra={"markup": True},
+                )
+                continue
+            replayed.append(dead_letter.id)
+            if len(replayed) % self.batch_size == 0:
+                self.redis.xdel(self.stream, *replayed[-self.batch_size :])
+        remaining = replayed[len(replayed) - len(replayed) % self.batch_size :]
+        if remaining:
+            self.redis.xdel(self.stream, *remaining)
+        return len(replayed)
+
+    def purge(
+        self,
+        event_name: Optional[str] = None,
+        ids: Optional[list[str]] = None,
+    ) -> int:
+        if not event_name and not ids:
+            purged = self.count()
+            self.redis.unlink(self.stream)
+            return purged
+        purged = [dead_letter.id for dead_letter in self._select(event_name, ids)]
+        for start in range(0, len(purged), self.batch_size):
+            self.redis.xdel(self.stream, *purged[start : start + self.batch_size])
+        return len(purged)
+
+    def count(self) -> int:
+        return self.redis.xlen(self.stream)
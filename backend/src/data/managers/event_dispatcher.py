@@ -0,0 +1,213 @@
+import logging
+import os
+import socket
+import threading
+import time
+from queue import Empty, Full, Queue
+from typing import Optional
+
+from django.conf import settings
+from redis import Redis
+from redis.exceptions import ConnectionError, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class EventDispatcher:
+    """
+    Process-wide Redis PubSub dispatcher.
+
+    A single daemon thread blocks on the shared PubSub socket and fans
+    incoming messages out into per-channel in-memory queues. Receivers wait
+    on their channel queue instead of polling Redis.
+
+    Subscription state is read from the PubSub channel set, so checking it
+    costs no round trip. For cross-process diagnostics the dispatcher
+    refreshes a ``events:subscribers:{channel}:{host}-{pid}`` key with a TTL
+    for every channel it listens on.
+
+    Attributes:
+        redis (Redis): Redis instance.
+        pubsub (PubSub): Shared Redis PubSub instance.
+        queue_size (int): Maximum number of pending messages per channel.
+        poll_timeout (float): Seconds the dispatcher blocks on the socket
+            before re-checking the stop flag.
+        heartbeat_interval (int): Seconds between diagnostic key refreshes.
+
+    Methods:
+        for_client(redis: Redis)
+        subscribe(*channels: str)
+        unsubscribe(*channels: str)
+        get(channel: str, timeout: Optional[float] = None)
+        is_subscribed(channel: str)
+        stop()
+
+    Usage:
+        dispatcher = EventDispatcher.for_client(redis)
+        dispatcher.subscribe("test_event")
+        message = dispatcher.get("test_event", timeout=2)
+    """
+
+    _instances: dict[tuple, "EventDispatcher"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        redis: Redis,
+        queue_size: int = 1000,
+        poll_timeout: float = 1.0,
+        heartbeat_interval: Optional[int] = None,
+    ):
+        self.redis = redis
+        self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self.queue_size = queue_size
+        self.poll_timeout = poll_timeout
+        self._queues: dict[str, Queue] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.heartbeat_interval = (
+            heartbeat_interval or settings.EVENT_SUBSCRIPTION_HEARTBEAT
+        )
+        self._consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._last_heartbeat = 0.0
+
+    @classmethod
+    def for_client(cls, redis: Redis) -> "EventDispatcher":
+        connection_kwargs = redis.connection_pool.connection_kwargs
+        key = (
+            os.getpid(),
+            connection_kwargs.get("host"),
+            connection_kwargs.get("port"),
+            connection_kwargs.get("db"),
+            connection_kwargs.get("decode_responses", False),
+        )
+        with cls._instances_lock:
+            dispatcher = cls._instances.get(key)
+            if dispatcher is None:
+                dispatcher = cls(redis=redis)
+                cls._instances[key] = dispatcher
+            return dispatcher
+
+    def _start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="event-dispatcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                message = self.pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self.poll_timeout,
+                )
+            except (ConnectionError, TimeoutError) as error:
+                logger.warning("Event dispatcher connection error: %s", error)
+                time.sleep(self.poll_timeout)
+                continue
+
+            if message and message.get("type") == "message":
+                self._dispatch(message)
+
+            if time.monotonic() - self._last_heartbeat >= self.heartbeat_interval:
+                self._heartbeat()
+
+    def _heartbeat_key(self, channel: str) -> str:
+        return f"events:subscribers:{channel}:{self._consumer}"
+
+    def _heartbeat(self, *channels: str) -> None:
+        channels = channels or tuple(self._queues)
+        if not channels:
+            return
+        try:
+            with self.redis.pipeline(transaction=False) as pipe:
+                for channel in channels:
+                    pipe.set(
+                        self._heartbeat_key(channel),
+                        int(time.time()),
+                        ex=self.heartbeat_interval * 3,
+                    )
+                pipe.execute()
+        except (ConnectionError, TimeoutError) as error:
+            logger.warning("Event dispatcher heartbeat failed: %s", error)
+        self._last_heartbeat = time.monotonic()
+
+    def _dispatch(self, message: dict) -> None:
+        channel = message.get("channel")
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+            message["channel"] = channel
+        channel_queue = self._queues.get(channel)
+        if channel_queue is None:
+            return
+        try:
+            channel_queue.put_nowait(message)
+        except Full:
+            try:
+                channel_queue.get_nowait()
+            except Empty:
+                pass
+            channel_queue.put_nowait(message)
+            logger.warning(
+                "Event queue full for channel [red]%s[/], dropped oldest message",
+                message.get("channel"),
+                extra={"markup": True},
+            )
+
+    def subscribe(self, *channels: str) -> None:
+        with self._lock:
+            new_channels = [
+                channel for channel in channels if channel not in self._queues
+            ]
+            for channel in new_channels:
+                self._queues[channel] = Queue(maxsize=self.queue_size)
+            if new_channels:
+                self.pubsub.subscribe(*new_channels)
+                self._heartbeat(*new_channels)
+            self._start()
+
+    def unsubscribe(self, *channels: str) -> None:
+        with self._lock:
+            known_channels = [
+                channel for channel in channels if channel in self._queues
+            ]
+            for channel in known_channels:
+                del self._queues[channel]
+            if known_channels:
+                self.pubsub.unsubscribe(*known_channels)
+                self.redis.unlink(*map(self._heartbeat_key, known_channels))
+
+    def get(
+        self,
+        channel: str,
+        timeout: Optional[float] = None,
+    ) -> Optional[dict]:
+        channel_queue = self._queues.get(channel)
+        if channel_queue is None:
+            logger.warning("Channel %s is not subscribed", channel)
+            return None
+        try:
+            return channel_queue.get(timeout=timeout)
+        except Empty:
+            return None
+
+    def is_subscribed(self, channel: str) -> bool:
+        # PubSub keeps channel names as bytes unless responses are decoded
+        channels = self.pubsub.channels
+        return channel in channels or channel.encode() in channels
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_timeout * 2)
+        self.pubsub.close()
+        with self._instances_lock:
+            for key, dispatcher in list(self._instances.items()):
+                if dispatcher is self:
+                    del self._instances[key]
@@ -1,15 +1,11 @@
-import asyncio
-import json
 import logging
-import threading
-import time
-from datetime import timedelta
-from queue import Empty, Queue
-from threading import current_thread
-from typing import Optional
+from typing import Any, Optional
 
 from src.data.clients import RedisClient
+from src.data.events import EventEnvelope
 from src.data.interfaces import IEventManager
+from src.data.managers.event_dispatcher import EventDispatcher
+from src.data.metrics import observe_published, observe_received
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +17,10 @@ class EventManager(IEventManager):
     Attributes:
         client (RedisClient): Redis client.
         redis (Redis): Redis instance.
-        pubsub (PubSub): Redis PubSub instance.
+        dispatcher (EventDispatcher): Process-wide PubSub dispatcher.
+
+    Events are sent as ``EventEnvelope`` messages encoded with the
+    ``EVENT_CODEC`` codec, so the Redis connection must not decode responses.
 
     Methods:
         publish(event_name: str, event_data: dict)
@@ -36,10 +35,10 @@ class EventManager(IEventManager):
         event_manager.unsubscribe("test_event")
     """
 
-    def __init__(self, client: RedisClient = RedisClient()):
-        self.client = client
+    def __init__(self, client: Optional[RedisClient] = None):
+        self.client = client or RedisClient(decode_responses=False)
         self.redis = self.client.redis
-        self.pubsub = self.redis.pubsub()
+        self.dispatcher = EventDispatcher.for_client(self.redis)
 
     @staticmethod
     def _validate_event_name(event_name: str):
@@ -56,20 +55,21 @@ class EventManager(IEventManager):
     def publish(
         self,
         event_name: str,
-        event_data: str | dict,
-    ):
-        if isinstance(event_data, dict):
-            event_data = json.dumps(event_data)
-        self.redis.publish(
+        event_data: Any,
+    ) -> int:
+        envelope = EventEnvelope.create(event_name=event_name, event_data=event_data)
+        receivers = self.redis.publish(
             channel=event_name,
-            message=event_data,
+            message=envelope.encode(),
         )
+        observe_published(event_name)
         logger.info(
             "[yellow]Publish[/] Event: [red]%s[/] with data: [blue]%s[/]",
             event_name,
-            event_data,
+            envelope.payload,
             extra={"markup": True},
         )
+        return receivers
 
     def subscribe(
         self,
@@ -81,9 +81,7 @@ class EventManager(IEventManager):
 
         if event_list:
             self._validate_event_list(event_list)
-            for event in event_list:
-                self.redis.set(name=f"{event}_subscribed", value=json.dumps(True))
-                self.pubsub.subscribe(event)
+            self.dispatcher.subscribe(*event_list)
             logger.info(
                 "[yellow]Subscribe[/] to events [red]%s[/]",
                 event_list,
@@ -91,8 +89,7 @@ class EventManager(IEventManager):
             )
         else:
             self._validate_event_name(event_name)
-            self.pubsub.subscribe(event_name)
-            self.redis.set(name=f"{event_name}_subscribed", value=json.dumps(True))
+            self.dispatcher.subscribe(event_name)
             logger.info(
                 "[yellow]Subscribe[/] Event: [red]%s[/]",
                 event_name,
@@ -109,7 +106,7 @@ class EventManager(IEventManager):
 
         if event_name:
             self._validate_event_name(event_name)
-            self.pubsub.unsubscribe(event_name)
+            self.dispatcher.unsubscribe(event_name)
             logger.info(
                 "[yellow]Unsubscribe[/] Event: [red]%s[/]",
                 event_name,
@@ -117,7 +114,7 @@ class EventManager(IEventManager):
             )
         else:
             self._validate_event_list(event_list)
-            self.pubsub.unsubscribe(*event_list)
+            self.dispatcher.unsubscribe(*event_list)
             logger.info(
                 "[yellow]Unsubscribed[/] to events [red]%s[/]",
                 event_list,
@@ -128,51 +125,35 @@ class EventManager(IEventManager):
         self,
         event_name: str,
         timeout: Optional[None | float] = None,
-    ) -> Optional[dict]:
-        end_time = time.time() + timeout if timeout else None
-
-        logger.info(
+    ) -> Optional[EventEnvelope]:
+        logger.debug(
             "Waiting for event: [yellow]%s[/]",
             event_name,
             extra={"markup": True},
         )
 
-        while True:
-            message = self.pubsub.get_message(ignore_subscribe_messages=True)
-
-            if not message or not self._is_message(message, event_name):
-                if timeout and time.time() >= end_time:
-                    return None
-                time.sleep(0.1)
-                continue
-
-            try:
-                event_data = json.loads(message["data"])
-                logger.info(
-                    "[yellow]Receive[/] Event: [red]%s[/] with data: [blue]%s[/]",
-                    event_name,
-                    event_data,
-                    extra={"markup": True},
-                )
-                return event_data
-            except json.JSONDecodeError:
-                logger.warning(
-                    "Failed to decode JSON data for event: [red]%s[/]",
-                    event_name,
-                    extra={"markup": True},
-                )
-                return None
+        message = self.dispatcher.get(channel=event_name, timeout=timeout)
+        if not message:
+            return None
 
-    @staticmethod
-    def _is_message(msg: Optional[dict], event_name: str) -> bool:
-        return msg.get("type") == "message" and msg.get("channel") == event_name
+        try:
+            envelope = EventEnvelope.decode(message["data"], event_name=event_name)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Failed to decode data for event: [red]%s[/]",
+                event_name,
+                extra={"markup": True},
+            )
+            return None
+
+        observe_received(event_name, envelope.timestamp)
+        logger.info(
+            "[yellow]Receive[/] Event: [red]%s[/] with data: [blue]%s[/]",
+            event_name,
+            envelope.payload,
+            extra={"markup": True},
+        )
+        return envelope
 
     def is_subscribed(self, event_name: str) -> bool:
-        data = self.redis.get(f"{event_name}_subscribed")
-        if data is None:
-            return False
-        else:
-            if isinstance(data, str):
-                return json.loads(data)
-            else:
-                return False
+        return self.dispatcher.is_subscribed(event_name)
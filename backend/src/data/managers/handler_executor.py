@@ -0,0 +1,180 @@
+import logging
+import threading
+import time
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Optional
+
+from src.data.metrics import (
+    HANDLER_DROPPED,
+    HANDLER_DURATION,
+    HANDLER_IN_FLIGHT,
+    HANDLER_QUEUED,
+)
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST)
+
+_STOP = object()
+
+
+class HandlerExecutor:
+    """
+    Bounded worker pool for a single event type.
+
+    Events are put into a bounded queue and processed by a fixed number of
+    worker threads. When the queue is full the overflow policy decides
+    whether the producer blocks (backpressure) or an event is dropped,
+    ``on_drop`` is called with every dropped event.
+
+    Attributes:
+        event_name (str): Handled event name.
+        workers (int): Number of worker threads.
+        queue_size (int): Maximum number of queued events.
+        overflow (str): One of "block", "drop_newest", "drop_oldest".
+        on_drop (Optional[Callable]): Called with a dropped event.
+
+    Methods:
+        start()
+        submit(event_data: dict)
+        shutdown(timeout: Optional[float] = None)
+
+    Usage:
+        executor = HandlerExecutor("user_created", process, workers=4)
+        executor.start()
+        executor.submit({"user_id": "..."})
+        executor.shutdown(timeout=10)
+    """
+
+    def __init__(
+        self,
+        event_name: str,
+        process: Callable[[dict], None],
+        workers: int = 1,
+        queue_size: int = 100,
+        overflow: str = OVERFLOW_BLOCK,
+        on_drop: Optional[Callable[[Any], None]] = None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"'overflow' must be one of {OVERFLOW_POLICIES}")
+        self.event_name = event_name
+        self.process = process
+        self.workers = workers
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.on_drop = on_drop
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._threads: list[threading.Thread] = []
+        self._accepting = False
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        self._accepting = True
+        for number in range(self.workers):
+            thread = threading.Thread(
+                target=self._work,
+                name=f"event-{self.event_name}-{number}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def _queued_gauge(self):
+        return HANDLER_QUEUED.labels(event=self.event_name)
+
+    def _work(self) -> None:
+        while True:
+            event_data = self._queue.get()
+            if event_data is _STOP:
+                self._queue.task_done()
+                return
+            self._queued_gauge.dec()
+
+            status = "success"
+            started = time.perf_counter()
+            in_flight = HANDLER_IN_FLIGHT.labels(event=self.event_name)
+            in_flight.inc()
+            try:
+                self.process(event_data)
+            except Exception as e:
+                status = "error"
+                logger.exception(
+                    "Worker for event %s failed: %s", self.event_name, str(e)
+                )
+            finally:
+                in_flight.dec()
+                HANDLER_DURATION.labels(event=self.event_name, status=status).observe(
+                    time.perf_counter() - started
+                )
+                self._queue.task_done()
+
+    def submit(self, event_data: dict) -> bool:
+        if not self._accepting:
+            logger.warning("Executor for event %s is stopped", self.event_name)
+            return False
+
+        if self.overflow == OVERFLOW_BLOCK:
+            self._queue.put(event_data)
+            self._queued_gauge.inc()
+            return True
+
+        try:
+            self._queue.put_nowait(event_data)
+            self._queued_gauge.inc()
+            return True
+        except Full:
+            HANDLER_DROPPED.labels(event=self.event_name, policy=self.overflow).inc()
+            if self.overflow == OVERFLOW_DROP_NEWEST:
+                logger.warning(
+                    "Event queue full for [red]%s[/], dropped newest event",
+                    self.event_name,
+                    extra={"markup": True},
+                )
+                if self.on_drop:
+                    self.on_drop(event_data)
+                return False
+            try:
+                dropped = self._queue.get_nowait()
+                self._queue.task_done()
+                self._queued_gauge.dec()
+                if self.on_drop:
+                    self.on_drop(dropped)
+            except Empty:
+                pass
+            self._queue.put_nowait(event_data)
+            self._queued_gauge.inc()
+            logger.warning(
+                "Event queue full for [red]%s[/], dropped oldest event",
+                self.event_name,
+                extra={"markup": True},
+            )
+            return True
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting events and wait for queued events to drain."""
+        self._accepting = False
+        for _ in self._threads:
+            self._queue.put(_STOP)
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for thread in self._threads:
+            remaining = (
+                max(deadline - time.monotonic(), 0) if deadline is not None else None
+            )
+            thread.join(timeout=remaining)
+
+        pending = sum(thread.is_alive() for thread in self._threads)
+        if pending:
+            logger.warning(
+                "Executor for event %s stopped with %s busy workers",
+                self.event_name,
+                pending,
+            )
+        self._threads = []
@@ -0,0 +1,169 @@
+import dataclasses
+import logging
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from src.data.events import EventEnvelope
+from src.data.interfaces import IEventManager
+from src.data.metrics import observe_published, observe_received
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessEventManager(IEventManager):
+    """
+    Class for managing events inside a single process.
+
+    Channels are shared by every instance in the process, so a producer and
+    a consumer using separate managers still talk to each other. Like Redis
+    PubSub, events published to a channel without subscribers are dropped.
+    Meant for single-node deployments and benchmarks, events never leave
+    the process.
+
+    Attributes:
+        queue_size (int): Maximum number of pending events per channel.
+
+    Methods:
+        publish(event_name: str, event_data: Any)
+        subscribe(event_name: Optional[str] = None, event_list: Optional[list[str]] = None)
+        unsubscribe(event_name: str, event_list: Optional[list[str]] = None)
+        receive(event_name: str, timeout: Optional[float] = None)
+
+    Usage:
+        event_manager = InProcessEventManager()
+        event_manager.subscribe("test_event")
+        event_manager.publish("test_event", {"key": "value"})
+        event_manager.receive("test_event", timeout=2)
+    """
+
+    _queues: dict[str, Queue] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, queue_size: int = 1000):
+        self.queue_size = queue_size
+
+    @staticmethod
+    def _validate_event_name(event_name: str):
+        if not isinstance(event_name, str):
+            raise TypeError("'event_name' must be a string")
+
+    @staticmethod
+    def _validate_event_list(event_list: list[str]):
+        if not isinstance(event_list, list):
+            raise TypeError("'event_list' must be a list of event names")
+        if not all(isinstance(event, str) for event in event_list):
+            raise ValueError("All elements in 'event_list' must be strings")
+
+    def publish(
+        self,
+        event_name: str,
+        event_data: Any,
+    ) -> int:
+        envelope = EventEnvelope.create(event_name=event_name, event_data=event_data)
+        if isinstance(envelope.payload, BaseModel):
+            # Consumers get plain data, as if the event was decoded from Redis
+            envelope = dataclasses.replace(
+                envelope, payload=envelope.payload.model_dump()
+            )
+
+        channel_queue = self._queues.get(event_name)
+        if channel_queue is not None:
+            try:
+                channel_queue.put_nowait(envelope)
+            except Full:
+                try:
+                    channel_queue.get_nowait()
+                except Empty:
+                    pass
+                channel_queue.put_nowait(envelope)
+                logger.warning(
+                    "Event queue full for channel [red]%s[/], dropped oldest event",
+                    event_name,
+                    extra={"markup": True},
+                )
+
+        observe_published(event_name)
+        logger.info(
+            "[yellow]Publish[/] In-process event: [red]%s[/] with data: [blue]%s[/]",
+            event_name,
+            envelope.payload,
+            extra={"markup": True},
+        )
+        return 0 if channel_queue is None else 1
+
+    def subscribe(
+        self,
+        event_name: Optional[str] = None,
+        event_list: Optional[list[str]] = None,
+    ) -> None:
+        if not event_name and not event_list:
+            raise ValueError("Either 'event_name' or 'event_list' must be provided")
+
+        if event_list:
+            self._validate_event_list(event_list)
+        else:
+            self._validate_event_name(event_name)
+            event_list = [event_name]
+
+        with self._lock:
+            for event in event_list:
+                if event not in self._queues:
+                    self._queues[event] = Queue(maxsize=self.queue_size)
+        logger.info(
+            "[yellow]Subscribe[/] In-process events [red]%s[/]",
+            event_list,
+            extra={"markup": True},
+        )
+
+    def unsubscribe(
+        self,
+        event_name: str,
+        event_list: Optional[list[str]] = None,
+    ) -> None:
+        if not event_name and not event_list:
+            raise ValueError("Either 'event_name' or 'event_list' must be provided")
+
+        if event_name:
+            self._validate_event_name(event_name)
+            event_list = [event_name]
+        else:
+            self._validate_event_list(event_list)
+
+        with self._lock:
+            for event in event_list:
+                self._queues.pop(event, None)
+        logger.info(
+            "[yellow]Unsubscribe[/] In-process events [red]%s[/]",
+            event_list,
+            extra={"markup": True},
+        )
+
+    def receive(
+        self,
+        event_name: str,
+        timeout: Optional[None | float] = None,
+    ) -> Optional[EventEnvelope]:
+        channel_queue = self._queues.get(event_name)
+        if channel_queue is None:
+            logger.warning("Channel %s is not subscribed", event_name)
+            return None
+
+        try:
+            envelope = channel_queue.get(timeout=timeout)
+        except Empty:
+            return None
+
+        observe_received(event_name, envelope.timestamp)
+        logger.info(
+            "[yellow]Receive[/] In-process event: [red]%s[/] with data: [blue]%s[/]",
+            event_name,
+            envelope.payload,
+            extra={"markup": True},
+        )
+        return envelope
+
+    def is_subscribed(self, event_name: str) -> bool:
+        return event_name in self._queues
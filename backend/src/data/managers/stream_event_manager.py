@@ -0,0 +1,335 @@
+import atexit
+import logging
+import os
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Optional
+
+from django.conf import settings
+from redis.exceptions import ResponseError
+
+from src.data.clients import RedisClient
+from src.data.events import EventEnvelope
+from src.data.interfaces import IEventManager
+from src.data.metrics import observe_published, observe_received
+
+logger = logging.getLogger(__name__)
+
+
+class StreamEventManager(IEventManager):
+    """
+    Class for managing durable events on Redis Streams.
+
+    Every event name maps to a stream. Consumers join a shared consumer
+    group, so each event is delivered to exactly one consumer across all
+    processes. Received envelopes carry their entry id in ``delivery_id``
+    and stay pending until the consumer calls ``acknowledge`` once the
+    event is handled. Entries left pending by a dead or failed consumer are
+    reclaimed once they have been idle for ``claim_idle`` milliseconds.
+
+    Reply channels (``replies.*``) are per-process streams: they are trimmed
+    to ``EVENT_REPLY_STREAM_MAXLEN``, expire after ``EVENT_REPLY_STREAM_TTL``
+    seconds without use, and the ones read by this process are deleted at
+    exit.
+
+    Attributes:
+        client (RedisClient): Redis client.
+        redis (Redis): Redis instance.
+        group (str): Consumer group name.
+        consumer (str): Consumer name of this process.
+        maxlen (int): Approximate maximum length of every stream.
+        claim_idle (int): Idle time in milliseconds before reclaiming entries.
+        claim_batch (int): Pending entries reclaimed per XAUTOCLAIM call.
+
+    Methods:
+        publish(event_name: str, event_data: dict)
+        subscribe(event_name: Optional[str] = None, event_list: Optional[list[str]] = None)
+        unsubscribe(event_name: str, event_list: Optional[list[str]] = None)
+        receive(event_name: str, timeout: Optional[float] = None)
+        acknowledge(event_name: str, envelope: EventEnvelope)
+
+    Usage:
+        event_manager = StreamEventManager()
+        event_manager.subscribe("test_event")
+        event_manager.publish("test_event", {"key": "value"})
+        envelope = event_manager.receive("test_event", timeout=2)
+        event_manager.acknowledge("test_event", envelope)
+    """
+
+    claim_batch = 100
+
+    def __init__(
+        self,
+        client: Optional[RedisClient] = None,
+        group: Optional[str] = None,
+        maxlen: Optional[int] = None,
+        claim_idle: Optional[int] = None,
+    ):
+        self.client = client or RedisClient(decode_responses=False)
+        self.redis = self.client.redis
+        self.group = group or settings.EVENT_STREAM_GROUP
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self.maxlen = maxlen or settings.EVENT_STREAM_MAXLEN
+        self.claim_idle = claim_idle or settings.EVENT_STREAM_CLAIM_IDLE
+        self._streams: set[str] = set()
+        self._reply_streams: set[str] = set()
+        self._last_claim: dict[str, float] = {}
+        self._claim_cursor: dict[str, bytes | str] = {}
+        self._claimed: dict[str, deque] = defaultdict(deque)
+        self._last_refresh: dict[str, float] = {}
+
+    @staticmethod
+    def _validate_event_name(event_name: str):
+        if not isinstance(event_name, str):
+            raise TypeError("'event_name' must be a string")
+
+    @staticmethod
+    def _validate_event_list(event_list: list[str]):
+        if not isinstance(event_list, list):
+            raise TypeError("'event_list' must be a list of event names")
+        if not all(isinstance(event, str) for event in event_list):
+            raise ValueError("All elements in 'event_list' must be strings")
+
+    @staticmethod
+    def _stream_name(event_name: str) -> str:
+        return f"stream:{event_name}"
+
+    @staticmethod
+    def _is_reply(event_name: str) -> bool:
+        return event_name.startswith("replies.")
+
+    def publish(
+        self,
+        event_name: str,
+        event_data: Any,
+    ) -> int:
+        envelope = EventEnvelope.create(event_name=event_name, event_data=event_data)
+        stream = self._stream_name(event_name)
+        if self._is_reply(event_name):
+            # A reply to a dead requester must not leave a stream behind
+            with self.redis.pipeline(transaction=False) as pipe:
+                pipe.xadd(
+                    name=stream,
+                    fields={"data": envelope.encode()},
+                    maxlen=settings.EVENT_REPLY_STREAM_MAXLEN,
+                    approximate=True,
+                )
+                pipe.expire(stream, settings.EVENT_REPLY_STREAM_TTL)
+                pipe.execute()
+        else:
+            self.redis.xadd(
+                name=stream,
+                fields={"data": envelope.encode()},
+                maxlen=self.maxlen,
+                approximate=True,
+            )
+        observe_published(event_name)
+        logger.info(
+            "[yellow]Publish[/] Stream event: [red]%s[/] with data: [blue]%s[/]",
+            event_name,
+            envelope.payload,
+            extra={"markup": True},
+        )
+        # The entry is stored until a consumer group reads it
+        return 1
+
+    def _create_group(self, event_name: str) -> None:
+        try:
+            self.redis.xgroup_create(
+                name=self._stream_name(event_name),
+                groupname=self.group,
+                id="$",
+                mkstream=True,
+            )
+        except ResponseError as error:
+            if "BUSYGROUP" not in str(error):
+                raise
+        if self._is_reply(event_name):
+            self._refresh(event_name, force=True)
+
+    def _refresh(self, event_name: str, force: bool = False) -> None:
+        """Push back the expiry of a reply stream read by this process."""
+        now = time.monotonic()
+        ttl = settings.EVENT_REPLY_STREAM_TTL
+        if not force and now - self._last_refresh.get(event_name, 0) < ttl / 3:
+            return
+        self._last_refresh[event_name] = now
+        self.redis.expire(self._stream_name(event_name), ttl)
+
+    def close(self) -> None:
+        """Delete the reply streams of this process."""
+        if self._reply_streams:
+            self.redis.delete(
+                *(self._stream_name(event) for event in self._reply_streams)
+            )
+            self._reply_streams.clear()
+
+    def subscribe(
+        self,
+        event_name: Optional[str] = None,
+        event_list: Optional[list[str]] = None,
+    ):
+        if not event_name and not event_list:
+            raise ValueError("Either 'event_name' or 'event_list' must be provided")
+
+        if event_list:
+            self._validate_event_list(event_list)
+        else:
+            self._validate_event_name(event_name)
+            event_list = [event_name]
+
+        for event in event_list:
+            if event not in self._streams:
+                self._create_group(event)
+                self._streams.add(event)
+                if self._is_reply(event):
+                    if not self._reply_streams:
+                        atexit.register(self.close)
+                    self._reply_streams.add(event)
+        logger.info(
+            "[yellow]Subscribe[/] Stream events [red]%s[/] in group [blue]%s[/]",
+            event_list,
+            self.group,
+            extra={"markup": True},
+        )
+
+    def unsubscribe(
+        self,
+        event_name: str,
+        event_list: Optional[list[str]] = None,
+    ):
+        if not event_name and not event_list:
+            raise ValueError("Either 'event_name' or 'event_list' must be provided")
+
+        if event_name:
+            self._validate_event_name(event_name)
+            event_list = [event_name]
+        else:
+            self._validate_event_list(event_list)
+
+        for event in event_list:
+            self._streams.discard(event)
+        logger.info(
+            "[yellow]Unsubscribe[/] Stream events [red]%s[/]",
+            event_list,
+            extra={"markup": True},
+        )
+
+    def acknowledge(self, event_name: str, envelope: EventEnvelope) -> None:
+        if envelope.delivery_id:
+            self.redis.xack(
+                self._stream_name(event_name), self.group, envelope.delivery_id
+            )
+
+    def _claim(self, event_name: str) -> Optional[tuple[str, dict]]:
+        """
+        Return an entry left pending by a dead consumer.
+
+        Entries are claimed in batches of ``claim_batch`` and buffered, the
+        scan continues from its cursor until the pending list is drained.
+        Only a scan that found nothing is throttled for ``claim_idle``.
+        """
+        claimed = self._claimed[event_name]
+        if claimed:
+            return claimed.popleft()
+        if time.monotonic() - self._last_claim.get(event_name, 0) < (
+            self.claim_idle / 1000
+        ):
+            return None
+
+        while True:
+            cursor, entries, *_ = self.redis.xautoclaim(
+                name=self._stream_name(event_name),
+                groupname=self.group,
+                consumername=self.consumer,
+                min_idle_time=self.claim_idle,
+                start_id=self._claim_cursor.get(event_name, "0-0"),
+                count=self.claim_batch,
+            )
+            done = cursor in (b"0-0", "0-0")
+            self._claim_cursor[event_name] = "0-0" if done else cursor
+            if entries:
+                logger.info(
+                    "[yellow]Reclaimed[/] Stream event: [red]%s[/] %s entries",
+                    event_name,
+                    len(entries),
+                    extra={"markup": True},
+                )
+                claimed.extend(entries)
+                return claimed.popleft()
+            if done:
+                self._last_claim[event_name] = time.monotonic()
+                return None
+
+    def _read(
+        self,
+        event_name: str,
+        timeout: Optional[float] = None,
+    ) -> Optional[tuple[str, dict]]:
+        if self._is_reply(event_name):
+            self._refresh(event_name)
+        response = self.redis.xreadgroup(
+            groupname=self.group,
+            consumername=self.consumer,
+            streams={self._stream_name(event_name): ">"},
+            count=1,
+            block=0 if timeout is None else max(int(timeout * 1000), 1),
+        )
+        if not response:
+            return None
+        _, entries = response[0]
+        return entries[0] if entries else None
+
+    def receive(
+        self,
+        event_name: str,
+        timeout: Optional[None | float] = None,
+    ) -> Optional[EventEnvelope]:
+        logger.debug(
+            "Waiting for stream event: [yellow]%s[/]",
+            event_name,
+            extra={"markup": True},
+        )
+
+        try:
+            entry = self._claim(event_name) or self._read(event_name, timeout=timeout)
+        except ResponseError as error:
+            # The stream expired or was deleted together with its group
+            if "NOGROUP" not in str(error):
+                raise
+            self._create_group(event_name)
+            return None
+        if not entry:
+            return None
+
+        message_id, fields = entry
+        try:
+            envelope = EventEnvelope.decode(
+                fields.get(b"data") or fields["data"],
+                event_name=event_name,
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.warning(
+                "Failed to decode data for stream event: [red]%s[/]",
+                event_name,
+                extra={"markup": True},
+            )
+            self.redis.xack(self._stream_name(event_name), self.group, message_id)
+            return None
+
+        envelope.delivery_id = (
+            message_id.decode() if isinstance(message_id, bytes) else message_id
+        )
+        observe_received(event_name, envelope.timestamp)
+        logger.info(
+            "[yellow]Receive[/] Stream event: [red]%s[/] with data: [blue]%s[/]",
+            event_name,
+            envelope.payload,
+            extra={"markup": True},
+        )
+        return envelope
+
+    def is_subscribed(self, event_name: str) -> bool:
+        return event_name in self._streams
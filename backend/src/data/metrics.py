@@ -0,0 +1,166 @@
+import os
+import time
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+EVENTS_PUBLISHED = Counter(
+    "olivin_events_published_total",
+    "Events published per channel",
+    ["channel"],
+)
+EVENTS_RECEIVED = Counter(
+    "olivin_events_received_total",
+    "Events received per channel",
+    ["channel"],
+)
+EVENT_LATENCY = Histogram(
+    "olivin_event_latency_seconds",
+    "Time between publishing and receiving an event",
+    ["channel"],
+    buckets=LATENCY_BUCKETS,
+)
+EVENT_RECEIVE_TIMEOUTS = Counter(
+    "olivin_event_receive_timeouts_total",
+    "Receive calls that returned without an event before the timeout",
+    ["channel"],
+)
+EVENT_REQUEST_TIMEOUTS = Counter(
+    "olivin_event_request_timeouts_total",
+    "Requests that did not get a reply before the timeout",
+    ["channel"],
+)
+HANDLER_DURATION = Histogram(
+    "olivin_event_handler_duration_seconds",
+    "Event handler execution time",
+    ["event", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HANDLER_IN_FLIGHT = Gauge(
+    "olivin_event_handler_in_flight",
+    "Events being processed by handlers",
+    ["event"],
+    multiprocess_mode="livesum",
+)
+HANDLER_QUEUED = Gauge(
+    "olivin_event_handler_queued",
+    "Events waiting in the handler queue",
+    ["event"],
+    multiprocess_mode="livesum",
+)
+HANDLER_RETRIES = Counter(
+    "olivin_event_handler_retries_total",
+    "Handler attempts retried after a failure",
+    ["event"],
+)
+EVENT_DEAD_LETTERS = Counter(
+    "olivin_event_dead_letters_total",
+    "Events moved to the dead-letter stream",
+    ["event"],
+)
+HANDLER_DROPPED = Counter(
+    "olivin_event_handler_dropped_total",
+    "Events dropped by the handler overflow policy",
+    ["event", "policy"],
+)
+CACHE_REQUESTS = Counter(
+    "olivin_cache_requests_total",
+    "Cache reads per namespace, by result (local_hit, hit or miss)",
+    ["namespace", "result"],
+)
+CACHE_SETS = Counter(
+    "olivin_cache_sets_total",
+    "Values written to the cache per namespace",
+    ["namespace"],
+)
+CACHE_ERRORS = Counter(
+    "olivin_cache_errors_total",
+    "Cache operations that failed per namespace",
+    ["namespace", "operation"],
+)
+CACHE_STORAGE_DURATION = Histogram(
+    "olivin_cache_storage_duration_seconds",
+    "Duration of cache storage calls",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def channel_label(channel: str) -> str:
+    """Collapse per-process reply channels into a single label value."""
+    if channel.startswith("replies."):
+        return "replies"
+    return channel
+
+
+def observe_published(channel: str) -> None:
+    EVENTS_PUBLISHED.labels(channel=channel_label(channel)).inc()
+
+
+def observe_received(channel: str, published_at: Optional[float] = None) -> None:
+    label = channel_label(channel)
+    EVENTS_RECEIVED.labels(channel=label).inc()
+    if published_at:
+        EVENT_LATENCY.labels(channel=label).observe(max(time.time() - published_at, 0))
+
+
+def observe_receive_timeout(channel: str) -> None:
+    EVENT_RECEIVE_TIMEOUTS.labels(channel=channel_label(channel)).inc()
+
+
+def observe_request_timeout(channel: str) -> None:
+    EVENT_REQUEST_TIMEOUTS.labels(channel=channel_label(channel)).inc()
+
+
+def observe_cache_read(namespace: Optional[str], result: str, count: int = 1) -> None:
+    if count:
+        CACHE_REQUESTS.labels(namespace=namespace or "default", result=result).inc(
+            count
+        )
+
+
+def observe_cache_set(namespace: Optional[str], count: int = 1) -> None:
+    CACHE_SETS.labels(namespace=namespace or "default").inc(count)
+
+
+def observe_cache_error(namespace: Optional[str], operation: str) -> None:
+    CACHE_ERRORS.labels(namespace=namespace or "default", operation=operation).inc()
+
+
+def export_metrics() -> tuple[bytes, str]:
+    """
+    Render metrics, aggregating worker processes when multiprocess is on.
+
+    Without ``PROMETHEUS_MULTIPROC_DIR`` only the metrics of the serving
+    process are rendered. Event handlers, Celery workers and any server
+    with more than one worker process must share the directory, wiped
+    before they start, for their metrics to be exported.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -1,9 +1,21 @@
 from src.data.storages.amazon_storage import AmazonS3Storage
+from src.data.storages.memory_storage import InMemoryStorage
 from src.data.storages.minio_storage import MinioStorage
+from src.data.storages.multipart import (
+    AmazonMultipartClient,
+    MinioMultipartClient,
+    MultipartUploader,
+)
 from src.data.storages.redis_storage import RedisStorage
+from src.data.storages.sharded_redis_storage import ShardedRedisStorage
 
 __all__ = [
     "RedisStorage",
+    "ShardedRedisStorage",
+    "InMemoryStorage",
     "AmazonS3Storage",
     "MinioStorage",
+    "MultipartUploader",
+    "MinioMultipartClient",
+    "AmazonMultipartClient",
 ]
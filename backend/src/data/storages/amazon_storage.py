@@ -1,7 +1,8 @@
 import json
 import logging
 import mimetypes
-from typing import Optional, TypeVar, Union
+import os
+from typing import Iterator, Optional, TypeVar, Union
 from uuid import UUID
 
 from botocore.exceptions import ClientError
@@ -12,12 +13,15 @@ from ninja_extra.exceptions import APIException
 
 from src.data.clients import AmazonClient
 from src.data.interfaces import ICloudStorage
+from src.data.storages.multipart import AmazonMultipartClient, MultipartUploader
 from src.data.utils import (
+    StreamType,
     clean_name,
     get_content_type,
     get_extension,
     get_file_io,
     get_file_size,
+    open_stream,
     path_file,
     upload_file,
 )
@@ -34,6 +38,9 @@ class AmazonS3Storage(ICloudStorage, Storage):
         self.static = client.static
         self._bucket = None
         self.basic_content_type = "application/octet-stream"
+        self.multipart = MultipartUploader(
+            client=AmazonMultipartClient(self.client, self.bucket_name)
+        )
         self.resource = client.amazon_s3_resource
         self.add_prefix_policy(path=["static/*", "media/*"])
 
@@ -110,6 +117,47 @@ class AmazonS3Storage(ICloudStorage, Storage):
 
         return f"{folder}/{filename}"
 
+    def upload_stream(
+        self,
+        full_object_key: str,
+        data: StreamType,
+        length: Optional[int] = None,
+        content_type: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> bool:
+        """
+        Stream ``data`` to the object, see ``open_stream`` for the accepted data.
+
+        Objects above ``MULTIPART_THRESHOLD`` bytes are uploaded in parallel
+        parts, resumable when ``fingerprint`` identifies the content.
+        """
+        stream, length = open_stream(data, length)
+        try:
+            if length > settings.MULTIPART_THRESHOLD:
+                self.multipart.upload(
+                    full_object_key=full_object_key,
+                    stream=stream,
+                    length=length,
+                    content_type=content_type or self.basic_content_type,
+                    fingerprint=fingerprint,
+                )
+                return True
+            self.client.put_object(
+                Bucket=self.bucket_name,
+                Key=full_object_key,
+                Body=stream,
+                ContentLength=length,
+                ContentType=content_type or self.basic_content_type,
+            )
+            logger.info(f"File {full_object_key} uploaded to {self.bucket_name}.")
+            return True
+        except Exception as error:
+            logger.error(f"Error uploading file {full_object_key} to S3: {error}")
+            return False
+        finally:
+            if stream is not data:
+                stream.close()
+
     def upload_file_from_path(
         self,
         filename: str,
@@ -117,7 +165,6 @@ class AmazonS3Storage(ICloudStorage, Storage):
         object_key: Optional[ObjectType] = None,
         content_type: Optional[str] = None,
     ) -> bool:
-        uploaded_file = None
         try:
             with path_file(
                 filename=filename,
@@ -131,34 +178,25 @@ class AmazonS3Storage(ICloudStorage, Storage):
                     if content_type
                     else mimetypes.guess_type(file.name)[0],
                 )
-        except Exception as error:
+                full_object_key = self.get_object_key(
+                    filename=uploaded_file.name,
+                    folder=folder,
+                    object_key=object_key,
+                )
+                if self.is_object_exist(full_object_key):
+                    logger.info("File already exists in the bucket.")
+                    return False
+                stat = os.fstat(file.fileno())
+                return self.upload_stream(
+                    full_object_key=full_object_key,
+                    data=uploaded_file.file,
+                    length=uploaded_file.size,
+                    content_type=uploaded_file.content_type,
+                    fingerprint=f"{stat.st_size}:{stat.st_mtime_ns}",
+                )
+        except OSError as error:
             logger.error(f"Error opening file {filename}: {error}")
-
-        if not uploaded_file:
             return False
-        full_object_key = self.get_object_key(
-            filename=uploaded_file.name,
-            folder=folder,
-            object_key=object_key,
-        )
-
-        if not self.is_object_exist(full_object_key):
-            try:
-                self.client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=full_object_key,
-                    Body=uploaded_file,
-                    ContentLength=uploaded_file.size,
-                    ContentType=uploaded_file.content_type,
-                )
-                logger.info(f"File {full_object_key} uploaded to {self.bucket_name}.")
-                return True
-            except Exception as error:
-                logger.error(f"Error uploading file {full_object_key} to S3: {error}")
-                return False
-
-        logger.info("File already exists in the bucket.")
-        return False
 
     def upload_file_from_url(
         self,
@@ -180,26 +218,16 @@ class AmazonS3Storage(ICloudStorage, Storage):
             folder=folder,
             object_key=object_key,
         )
-        if not self.is_object_exist(full_object_key):
-            if uploaded_file:
-                try:
-                    self.bucket.put_object(
-                        Key=full_object_key,
-                        Body=uploaded_file,
-                        ContentLength=uploaded_file.size,
-                        ContentType=uploaded_file.content_type,
-                    )
-                    return True
-                except APIException as error:
-                    logger.error(f"Failed to upload file {file.name}: {error}")
-                    return False
-                except Exception as error:
-                    logger.error(f"An unexpected error occurred: {error}")
-                    return False
-        else:
+
+        if self.is_object_exist(full_object_key):
             logger.info("File already exists in the bucket.")
             return False
-        return False
+        return self.upload_stream(
+            full_object_key=full_object_key,
+            data=get_file_io(uploaded_file),
+            length=uploaded_file.size,
+            content_type=uploaded_file.content_type,
+        )
 
     def get_file(
         self,
@@ -229,6 +257,38 @@ class AmazonS3Storage(ICloudStorage, Storage):
             logger.error(f"Error retrieving file {full_object_path} from S3: {error}")
             return None
 
+    def get_object_data(
+        self,
+        full_object_key: str,
+    ) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket_name, Key=full_object_key
+            )
+        except self.client.exceptions.NoSuchKey:
+            return None
+        with response["Body"] as body:
+            return body.read()
+
+    def get_presigned_url(
+        self,
+        full_object_key: str,
+        expire: int,
+    ) -> Optional[str]:
+        """Sign a GET of the object without checking that it exists."""
+        try:
+            return self.client.generate_presigned_url(
+                ClientMethod="get_object",
+                Params={
+                    "Bucket": self.bucket_name,
+                    "Key": full_object_key,
+                },
+                ExpiresIn=expire,
+            )
+        except Exception as error:
+            logger.error(f"Error signing file {full_object_key} from S3: {error}")
+            return None
+
     def delete_file(
         self,
         filename: str,
@@ -262,6 +322,14 @@ class AmazonS3Storage(ICloudStorage, Storage):
             if error.response["ResponseMetadata"]["HTTPStatusCode"] == 404:
                 return False
 
+    def list_object_keys(
+        self,
+        prefix: Optional[str] = None,
+    ) -> Iterator[str]:
+        for obj in self.bucket.objects.filter(Prefix=prefix or ""):
+            if not obj.key.endswith("/"):
+                yield obj.key
+
     # django storage static files
 
     def exists(self, name: str) -> bool:
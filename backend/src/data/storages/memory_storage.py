@@ -0,0 +1,208 @@
+import fnmatch
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Optional
+
+from django.conf import settings
+
+from src.data.interfaces import ICacheStorage
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryStorage(ICacheStorage):
+    """
+    Thread-safe in-process cache storage.
+
+    Keys are shared by every instance of the process, with the same
+    semantics as ``RedisStorage``: values expire after ``expire`` seconds,
+    expired keys are dropped when read and by a periodic sweep, and the
+    least recently used keys are evicted once ``CACHE_MEMORY_MAX_ENTRIES``
+    or ``CACHE_MEMORY_MAX_BYTES`` is exceeded. Meant for single-node
+    deployments and benchmarks, worker processes do not see each other's
+    keys.
+
+    Methods:
+        get(key: Any)
+        set(key: Any, value: Any, expire: Optional[int] = None)
+        delete(key: Any)
+        exists(key: Any)
+        flush()
+
+    Usage:
+        storage = InMemoryStorage()
+        storage.set(key="key", value=b"value", expire=60)
+        storage.get(key="key")
+    """
+
+    shared = False
+
+    # key -> (value, expires_at, size), ordered from the least recently used
+    _entries: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+    _tags: dict[str, tuple[set[str], float]] = {}
+    _bytes = 0
+    _lock = threading.RLock()
+    _sweeper: Optional[threading.Thread] = None
+
+    def __init__(self):
+        self.max_entries = settings.CACHE_MEMORY_MAX_ENTRIES
+        self.max_bytes = settings.CACHE_MEMORY_MAX_BYTES
+        with self._lock:
+            if (
+                InMemoryStorage._sweeper is None
+                or not InMemoryStorage._sweeper.is_alive()
+            ):
+                InMemoryStorage._sweeper = threading.Thread(
+                    target=self._sweep,
+                    args=(settings.CACHE_MEMORY_SWEEP_INTERVAL,),
+                    name="memory-storage-sweeper",
+                    daemon=True,
+                )
+                InMemoryStorage._sweeper.start()
+
+    @staticmethod
+    def _seconds(expire: Optional[int | timedelta]) -> float:
+        if isinstance(expire, timedelta):
+            return expire.total_seconds()
+        return float(expire or settings.REDIS_EXPIRE)
+
+    @staticmethod
+    def _size(value: Any) -> int:
+        return len(value) if isinstance(value, (str, bytes)) else 0
+
+    def _pop(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        InMemoryStorage._bytes -= entry[2]
+        return True
+
+    def _live(self, key: Any) -> Optional[tuple[Any, float, int]]:
+        """Return the entry of ``key`` unless expired, marking it recently used."""
+        key = str(key)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: Any, value: Any, expire: Optional[int | timedelta]) -> None:
+        key = str(key)
+        size = self._size(value)
+        self._pop(key)
+        self._entries[key] = (value, time.monotonic() + self._seconds(expire), size)
+        InMemoryStorage._bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._pop(next(iter(self._entries)))
+
+    def _sweep(self, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            swept = self._sweep_expired()
+            if swept:
+                logger.debug("Swept %s expired cache keys", swept)
+
+    def _sweep_expired(self) -> int:
+        """Drop the expired keys and tags, return the number of dropped keys."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if entry[1] <= now]
+            for key in expired:
+                self._pop(key)
+            for tag in [
+                tag for tag, (_, expires_at) in self._tags.items() if expires_at <= now
+            ]:
+                del self._tags[tag]
+        return len(expired)
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._live(key)
+            return entry[0] if entry else None
+
+    def get_with_ttl(self, key: Any) -> tuple[Optional[Any], Optional[float]]:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                return None, None
+            return entry[0], entry[1] - time.monotonic()
+
+    def get_many(self, keys: list[Any]) -> list[Optional[Any]]:
+        return [value for value, _ in self.get_many_with_ttl(keys)]
+
+    def get_many_with_ttl(
+        self, keys: list[Any]
+    ) -> list[tuple[Optional[Any], Optional[float]]]:
+        with self._lock:
+            return [self.get_with_ttl(key) for key in keys]
+
+    def set(
+        self, key: Any, value: Any, expire: Optional[int | timedelta] = None
+    ) -> None:
+        with self._lock:
+            self._store(key, value, expire)
+
+    def set_many(
+        self, mapping: dict[Any, Any], expire: Optional[int | timedelta] = None
+    ) -> None:
+        with self._lock:
+            for key, value in mapping.items():
+                self._store(key, value, expire)
+
+    def delete(self, key: Any) -> bool:
+        with self._lock:
+            return self._pop(str(key))
+
+    def delete_many(self, keys: list[Any]) -> int:
+        with self._lock:
+            return sum(self._pop(str(key)) for key in keys)
+
+    def add_tags(self, keys: list[Any], tags: list[str], expire: int) -> None:
+        expires_at = time.monotonic() + expire
+        with self._lock:
+            for tag in tags:
+                members, tag_expires_at = self._tags.get(tag, (set(), 0))
+                members.update(str(key) for key in keys)
+                self._tags[tag] = (members, max(tag_expires_at, expires_at))
+
+    def delete_tagged(self, tag: str) -> list[Any]:
+        with self._lock:
+            members, _ = self._tags.pop(tag, (set(), 0))
+            return [key for key in members if self._pop(key)]
+
+    def delete_pattern(self, pattern: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            return sum(self._pop(key) for key in keys)
+
+    def acquire_lock(self, key: Any, token: str, timeout: float) -> bool:
+        with self._lock:
+            if self._live(key) is not None:
+                return False
+            self._store(key, token, timeout)
+            return True
+
+    def release_lock(self, key: Any, token: str) -> bool:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None or entry[0] != token:
+                return False
+            return self._pop(str(key))
+
+    def exists(self, key: Any) -> bool:
+        with self._lock:
+            return self._live(key) is not None
+
+    def flush(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            InMemoryStorage._bytes = 0
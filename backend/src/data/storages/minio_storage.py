@@ -2,7 +2,8 @@ import json
 import logging
 import mimetypes
 import os
-from typing import Optional, TypeVar, Union
+from datetime import timedelta
+from typing import Iterator, Optional, TypeVar, Union
 from uuid import UUID
 
 from django.conf import settings
@@ -14,12 +15,15 @@ from ninja_extra.exceptions import APIException
 
 from src.data.clients import MinioClient
 from src.data.interfaces import ICloudStorage
+from src.data.storages.multipart import MinioMultipartClient, MultipartUploader
 from src.data.utils import (
+    StreamType,
     clean_name,
     get_content_type,
     get_extension,
     get_file_io,
     get_file_size,
+    open_stream,
     path_file,
     upload_file,
 )
@@ -37,6 +41,9 @@ class MinioStorage(ICloudStorage, Storage):
         self.region = client.region
         self._bucket = None
         self.basic_content_type = "application/octet-stream"
+        self.multipart = MultipartUploader(
+            client=MinioMultipartClient(self.client, self.bucket_name)
+        )
         self.add_prefix_policy(path=["static/*", "media/*"])
 
     @property
@@ -91,6 +98,47 @@ class MinioStorage(ICloudStorage, Storage):
 
         return f"{folder}/{filename}"
 
+    def upload_stream(
+        self,
+        full_object_key: str,
+        data: StreamType,
+        length: Optional[int] = None,
+        content_type: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> bool:
+        """
+        Stream ``data`` to the object, see ``open_stream`` for the accepted data.
+
+        Objects above ``MULTIPART_THRESHOLD`` bytes are uploaded in parallel
+        parts, resumable when ``fingerprint`` identifies the content.
+        """
+        stream, length = open_stream(data, length)
+        try:
+            if length > settings.MULTIPART_THRESHOLD:
+                self.multipart.upload(
+                    full_object_key=full_object_key,
+                    stream=stream,
+                    length=length,
+                    content_type=content_type or self.basic_content_type,
+                    fingerprint=fingerprint,
+                )
+                return True
+            self.client.put_object(
+                bucket_name=self.bucket_name,
+                object_name=full_object_key,
+                data=stream,
+                length=length,
+                content_type=content_type or self.basic_content_type,
+            )
+            logger.info(f"File {full_object_key} uploaded to {self.bucket_name}.")
+            return True
+        except Exception as error:
+            logger.error(f"Error uploading file {full_object_key} to S3: {error}")
+            return False
+        finally:
+            if stream is not data:
+                stream.close()
+
     def upload_file_from_path(
         self,
         filename: str,
@@ -98,7 +146,6 @@ class MinioStorage(ICloudStorage, Storage):
         object_key: Optional[ObjectType] = None,
         content_type: Optional[str] = None,
     ) -> bool:
-        uploaded_file = None
         try:
             with path_file(
                 filename=filename,
@@ -112,36 +159,25 @@ class MinioStorage(ICloudStorage, Storage):
                     if content_type
                     else mimetypes.guess_type(file.name)[0],
                 )
-        except Exception as error:
-            logger.error(f"Error opening file {filename}: {error}")
-        if not uploaded_file:
-            return False
-
-        if not uploaded_file:
-            return False
-        full_object_key = self.get_object_key(
-            filename=uploaded_file.name,
-            folder=folder,
-            object_key=object_key,
-        )
-
-        if not self.is_object_exist(full_object_key):
-            try:
-                self.client.put_object(
-                    bucket_name=self.bucket_name,
-                    object_name=full_object_key,
-                    data=get_file_io(file=uploaded_file),
+                full_object_key = self.get_object_key(
+                    filename=uploaded_file.name,
+                    folder=folder,
+                    object_key=object_key,
+                )
+                if self.is_object_exist(full_object_key):
+                    logger.info("File already exists in the bucket.")
+                    return False
+                stat = os.fstat(file.fileno())
+                return self.upload_stream(
+                    full_object_key=full_object_key,
+                    data=uploaded_file.file,
                     length=uploaded_file.size,
                     content_type=uploaded_file.content_type,
+                    fingerprint=f"{stat.st_size}:{stat.st_mtime_ns}",
                 )
-                logger.info(f"File {full_object_key} uploaded to {self.bucket_name}.")
-                return True
-            except Exception as error:
-                logger.error(f"Error uploading file {full_object_key} to S3: {error}")
-                return False
-
-        logger.info("File already exists in the bucket.")
-        return False
+        except OSError as error:
+            logger.error(f"Error opening file {filename}: {error}")
+            return False
 
     def upload_file_from_url(
         self,
@@ -164,28 +200,15 @@ class MinioStorage(ICloudStorage, Storage):
             object_key=object_key,
         )
 
-        if not self.is_object_exist(full_object_key):
-            if uploaded_file:
-                try:
-                    file_io = get_file_io(uploaded_file)
-                    file_size = file_io.getbuffer().nbytes
-                    self.client.put_object(
-                        bucket_name=self.bucket_name,
-                        object_name=full_object_key,
-                        data=file_io,
-                        length=file_size,
-                        content_type=uploaded_file.content_type,
-                    )
-                    return True
-                except APIException as error:
-                    logger.error(f"Failed to upload file {file.name}: {error}")
-                    return False
-                except Exception as error:
-                    logger.error(f"An unexpected error occurred: {error}")
-                    return False
-
-        logger.info("File already exists in the bucket.")
-        return False
+        if self.is_object_exist(full_object_key):
+            logger.info("File already exists in the bucket.")
+            return False
+        return self.upload_stream(
+            full_object_key=full_object_key,
+            data=get_file_io(uploaded_file),
+            length=uploaded_file.size,
+            content_type=uploaded_file.content_type,
+        )
 
     def get_file(
         self,
@@ -208,6 +231,38 @@ class MinioStorage(ICloudStorage, Storage):
             logger.error(error)
             return None
 
+    def get_object_data(
+        self,
+        full_object_key: str,
+    ) -> Optional[bytes]:
+        response = None
+        try:
+            response = self.client.get_object(self.bucket_name, full_object_key)
+            return response.read()
+        except S3Error as error:
+            if error.code == "NoSuchKey":
+                return None
+            logger.error(error)
+            raise
+        finally:
+            if response is not None:
+                response.close()
+                response.release_conn()
+
+    def get_presigned_url(
+        self,
+        full_object_key: str,
+        expire: int,
+    ) -> Optional[str]:
+        """Sign a GET of the object without checking that it exists."""
+        try:
+            return self.client.presigned_get_object(
+                self.bucket_name, full_object_key, expires=timedelta(seconds=expire)
+            )
+        except Exception as error:
+            logger.error(error)
+            return None
+
     def delete_file(
         self,
         filename: str,
@@ -248,6 +303,16 @@ class MinioStorage(ICloudStorage, Storage):
             logger.error(error)
             return False
 
+    def list_object_keys(
+        self,
+        prefix: Optional[str] = None,
+    ) -> Iterator[str]:
+        for obj in self.client.list_objects(
+            self.bucket_name, prefix=prefix, recursive=True
+        ):
+            if not obj.is_dir:
+                yield obj.object_name
+
     # django storage static files
 
     def exists(self, name: str) -> bool:
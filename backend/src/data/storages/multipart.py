@@ -0,0 +1,338 @@
+import io
+import logging
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, BinaryIO, Optional
+
+from django.conf import settings
+from django.utils.functional import cached_property
+from minio import Minio
+from minio.datatypes import Part
+
+from src.core.config import get_shared_cache_storage
+from src.data.interfaces import IMultipartClient
+
+if TYPE_CHECKING:
+    from src.data.handlers import CacheHandler
+
+logger = logging.getLogger(__name__)
+
+# S3 limits, shared by MinIO
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10_000
+
+ABORT_RULE_ID = "abort-incomplete-multipart-uploads"
+
+
+def get_abort_days() -> int:
+    """Days after which the bucket aborts incomplete uploads, once resuming expired."""
+    return max(math.ceil(settings.MULTIPART_STATE_TTL / (60 * 60 * 24)), 1)
+
+
+class MinioMultipartClient(IMultipartClient):
+    """
+    Multipart upload calls of a MinIO bucket.
+
+    The minio package has no public multipart API, the private methods used
+    here are those of the pinned minio version.
+    """
+
+    def __init__(self, client: Minio, bucket_name: str):
+        self.client = client
+        self.bucket_name = bucket_name
+
+    def create(self, full_object_key: str, content_type: Optional[str] = None) -> str:
+        return self.client._create_multipart_upload(
+            self.bucket_name,
+            full_object_key,
+            {"Content-Type": content_type or "application/octet-stream"},
+        )
+
+    def upload_part(
+        self, full_object_key: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        return self.client._upload_part(
+            self.bucket_name, full_object_key, data, None, upload_id, part_number
+        )
+
+    def list_parts(self, full_object_key: str, upload_id: str) -> dict[int, str]:
+        parts: dict[int, str] = {}
+        marker = None
+        while True:
+            result = self.client._list_parts(
+                self.bucket_name, full_object_key, upload_id, part_number_marker=marker
+            )
+            parts.update({part.part_number: part.etag for part in result.parts})
+            if not result.is_truncated:
+                return parts
+            marker = str(result.next_part_number_marker)
+
+    def complete(
+        self, full_object_key: str, upload_id: str, parts: dict[int, str]
+    ) -> None:
+        self.client._complete_multipart_upload(
+            self.bucket_name,
+            full_object_key,
+            upload_id,
+            [Part(number, etag) for number, etag in sorted(parts.items())],
+        )
+
+    def abort(self, full_object_key: str, upload_id: str) -> None:
+        self.client._abort_multipart_upload(
+            self.bucket_name, full_object_key, upload_id
+        )
+
+
+class AmazonMultipartClient(IMultipartClient):
+    """Multipart upload calls of an S3 bucket."""
+
+    def __init__(self, client, bucket_name: str):
+        self.client = client
+        self.bucket_name = bucket_name
+
+    def create(self, full_object_key: str, content_type: Optional[str] = None) -> str:
+        response = self.client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=full_object_key,
+            ContentType=content_type or "application/octet-stream",
+        )
+        return response["UploadId"]
+
+    def upload_part(
+        self, full_object_key: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        response = self.client.upload_part(
+            Bucket=self.bucket_name,
+            Key=full_object_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return response["ETag"]
+
+    def list_parts(self, full_object_key: str, upload_id: str) -> dict[int, str]:
+        paginator = self.client.get_paginator("list_parts")
+        return {
+            part["PartNumber"]: part["ETag"]
+            for page in paginator.paginate(
+                Bucket=self.bucket_name, Key=full_object_key, UploadId=upload_id
+            )
+            for part in page.get("Parts", [])
+        }
+
+    def complete(
+        self, full_object_key: str, upload_id: str, parts: dict[int, str]
+    ) -> None:
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=full_object_key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": number, "ETag": etag}
+                    for number, etag in sorted(parts.items())
+                ]
+            },
+        )
+
+    def abort(self, full_object_key: str, upload_id: str) -> None:
+        self.client.abort_multipart_upload(
+            Bucket=self.bucket_name, Key=full_object_key, UploadId=upload_id
+        )
+
+
+class MultipartUploader:
+    """
+    Parallel multipart upload of a stream.
+
+    Parts are read in order and uploaded by a pool of ``workers`` threads,
+    at most ``workers`` parts are held in memory. A failed part is retried
+    ``retries`` times with a growing delay.
+
+    An upload with a ``fingerprint`` of its content, like the size and
+    mtime of a local file, is resumable: its upload id is kept in the
+    ``multipart`` namespace of ``CACHE_SHARED_STORAGE``, and a later upload
+    of the same object, length and fingerprint only sends the parts the
+    storage does not list. With a per-process storage nothing is resumable.
+    An object keeps a single resumable upload, the previous one is aborted
+    once the object is uploaded with another length or fingerprint. Any
+    other upload is aborted on failure. Uploads left once their state
+    expired are aborted by the bucket lifecycle rule (``get_abort_days``).
+
+    Attributes:
+        client (IMultipartClient): Multipart calls of the storage.
+        part_size (int): Minimal part size in bytes.
+        workers (int): Parts uploaded at once.
+        retries (int): Attempts of a part after the first one.
+
+    Methods:
+        upload(full_object_key: str, stream: BinaryIO, length: int, content_type: Optional[str] = None, fingerprint: Optional[str] = None)
+
+    Usage:
+        uploader = MultipartUploader(MinioMultipartClient(minio, bucket_name))
+        uploader.upload("products/1/video.mp4", file, length=size)
+    """
+
+    def __init__(
+        self,
+        client: IMultipartClient,
+        part_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        retries: Optional[int] = None,
+    ):
+        self.client = client
+        self.part_size = max(part_size or settings.MULTIPART_PART_SIZE, MIN_PART_SIZE)
+        self.workers = workers or settings.MULTIPART_WORKERS
+        self.retries = settings.MULTIPART_PART_RETRIES if retries is None else retries
+
+    @cached_property
+    def state(self) -> Optional["CacheHandler"]:
+        # Imported late, the handlers import the storages
+        from src.data.handlers import CacheHandler
+
+        storage = get_shared_cache_storage()
+        if not storage.shared:
+            logger.warning(
+                "Resumable uploads disabled, %s is not shared by processes",
+                settings.CACHE_SHARED_STORAGE,
+            )
+            return None
+        return CacheHandler(pool_storage=storage, namespace="multipart")
+
+    def get_part_size(self, length: int) -> int:
+        """Return the part size of ``length`` bytes, within ``MAX_PARTS`` parts."""
+        return max(self.part_size, math.ceil(length / MAX_PARTS))
+
+    def _upload_part(
+        self, full_object_key: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        for attempt in range(self.retries + 1):
+            try:
+                return self.client.upload_part(
+                    full_object_key, upload_id, part_number, data
+                )
+            except Exception as error:
+                if attempt == self.retries:
+                    raise
+                logger.warning(
+                    "Part %s of %s failed, retrying: %s",
+                    part_number,
+                    full_object_key,
+                    error,
+                )
+                time.sleep(0.5 * 2**attempt)
+
+    @staticmethod
+    def _skip(stream: BinaryIO, size: int) -> None:
+        seekable = getattr(stream, "seekable", None)
+        if seekable and seekable():
+            stream.seek(size, io.SEEK_CUR)
+        else:
+            stream.read(size)
+
+    def _start(
+        self,
+        full_object_key: str,
+        content_type: Optional[str],
+        signature: Optional[str],
+    ) -> tuple[str, dict[int, str]]:
+        """Return the upload id and the uploaded parts of a resumed upload."""
+        state = self.state.get_value(key=full_object_key) if signature else None
+        if state:
+            previous_signature, upload_id = state
+            if previous_signature == signature:
+                try:
+                    parts = self.client.list_parts(full_object_key, upload_id)
+                    logger.info(
+                        "Resuming upload of [blue]%s[/] with %s parts uploaded",
+                        full_object_key,
+                        len(parts),
+                        extra={"markup": True},
+                    )
+                    return upload_id, parts
+                except Exception as error:
+                    logger.info(
+                        "Upload of %s not resumable: %s", full_object_key, error
+                    )
+            # Replaced by another content, its parts would never be completed
+            self._abort(full_object_key, upload_id)
+
+        upload_id = self.client.create(full_object_key, content_type)
+        if signature:
+            self.state.set_value(
+                key=full_object_key,
+                value=[signature, upload_id],
+                expire=settings.MULTIPART_STATE_TTL,
+            )
+        return upload_id, {}
+
+    def upload(
+        self,
+        full_object_key: str,
+        stream: BinaryIO,
+        length: int,
+        content_type: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        part_size = self.get_part_size(length)
+        signature = (
+            f"{length}:{part_size}:{fingerprint}"
+            if fingerprint and self.state
+            else None
+        )
+        upload_id, parts = self._start(full_object_key, content_type, signature)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="multipart"
+        )
+        pending: dict[Future, int] = {}
+        try:
+            for part_number in range(1, math.ceil(length / part_size) + 1):
+                size = min(part_size, length - (part_number - 1) * part_size)
+                if part_number in parts:
+                    self._skip(stream, size)
+                    continue
+                data = stream.read(size)
+                if len(data) != size:
+                    raise IOError(
+                        f"Stream of {full_object_key} ended at part {part_number}"
+                    )
+                future = executor.submit(
+                    self._upload_part, full_object_key, upload_id, part_number, data
+                )
+                pending[future] = part_number
+                if len(pending) >= self.workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        parts[pending.pop(future)] = future.result()
+            for future in wait(pending).done:
+                parts[pending.pop(future)] = future.result()
+            self.client.complete(full_object_key, upload_id, parts)
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if signature:
+                logger.warning(
+                    "Upload of %s interrupted after %s parts, kept for resuming",
+                    full_object_key,
+                    len(parts),
+                )
+            else:
+                self._abort(full_object_key, upload_id)
+            raise
+        executor.shutdown()
+        if signature:
+            self.state.delete_value(key=full_object_key)
+        logger.info(
+            "File [blue]%s[/] uploaded in %s parts",
+            full_object_key,
+            len(parts),
+            extra={"markup": True},
+        )
+
+    def _abort(self, full_object_key: str, upload_id: str) -> None:
+        try:
+            self.client.abort(full_object_key, upload_id)
+            logger.info("Upload of %s aborted", full_object_key)
+        except Exception as error:
+            logger.error("Error aborting upload of %s: %s", full_object_key, error)
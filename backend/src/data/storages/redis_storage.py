@@ -4,33 +4,171 @@ from datetime import timedelta
 from typing import Any, Optional
 
 from django.conf import settings
+from redis import Redis
 
 from src.data.clients import RedisClient
 from src.data.interfaces import ICacheStorage
+from src.data.metrics import CACHE_STORAGE_DURATION
 
 logger = logging.getLogger(__name__)
 
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
 
 class RedisStorage(ICacheStorage):
-    def __init__(self, **kwargs):
-        self.storage = RedisClient().connect(**kwargs)
+    def __init__(self, client: Optional[RedisClient] = None):
+        # Binary connection, cached values are encoded by the cache codec
+        self.storage = (client or RedisClient(decode_responses=False)).redis
+
+    def _redis(self, key: Any) -> Redis:
+        """Return the Redis instance holding ``key``."""
+        return self.storage
+
+    def _groups(self, keys: list[Any]) -> list[tuple[Redis, list[Any]]]:
+        """Split ``keys`` by the Redis instance holding them."""
+        return [(self.storage, keys)]
 
+    def _instances(self) -> list[Redis]:
+        return [self.storage]
+
+    @CACHE_STORAGE_DURATION.labels(operation="get").time()
     def get(self, key: Any) -> Optional[Any]:
-        return self.storage.get(name=key)
+        return self._redis(key).get(name=key)
+
+    @CACHE_STORAGE_DURATION.labels(operation="get_with_ttl").time()
+    def get_with_ttl(self, key: Any) -> tuple[Optional[Any], Optional[float]]:
+        """Return the value and its remaining lifetime in seconds in one round trip."""
+        with self._redis(key).pipeline(transaction=False) as pipe:
+            value, ttl_ms = pipe.get(name=key).pttl(name=key).execute()
+        return value, ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else None
 
+    @CACHE_STORAGE_DURATION.labels(operation="get_many").time()
+    def get_many(self, keys: list[Any]) -> list[Optional[Any]]:
+        if not keys:
+            return []
+        values: dict[Any, Any] = {}
+        for redis, group in self._groups(keys):
+            values.update(zip(group, redis.mget(group)))
+        return [values[key] for key in keys]
+
+    @CACHE_STORAGE_DURATION.labels(operation="get_many_with_ttl").time()
+    def get_many_with_ttl(
+        self, keys: list[Any]
+    ) -> list[tuple[Optional[Any], Optional[float]]]:
+        """Return values and remaining lifetimes of many keys in one round trip."""
+        if not keys:
+            return []
+        entries: dict[Any, tuple[Optional[Any], Optional[float]]] = {}
+        for redis, group in self._groups(keys):
+            with redis.pipeline(transaction=False) as pipe:
+                pipe.mget(group)
+                for key in group:
+                    pipe.pttl(name=key)
+                values, *ttls = pipe.execute()
+            for key, value, ttl_ms in zip(group, values, ttls):
+                entries[key] = (value, ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else None)
+        return [entries[key] for key in keys]
+
+    @CACHE_STORAGE_DURATION.labels(operation="set").time()
     def set(
         self, key: Any, value: Any, expire: Optional[int | timedelta] = None
     ) -> None:
         if not expire:
             expire = settings.REDIS_EXPIRE
 
-        self.storage.set(name=key, value=value, ex=expire)
+        self._redis(key).set(name=key, value=value, ex=expire)
+
+    @CACHE_STORAGE_DURATION.labels(operation="set_many").time()
+    def set_many(
+        self, mapping: dict[Any, Any], expire: Optional[int | timedelta] = None
+    ) -> None:
+        if not mapping:
+            return
+        if not expire:
+            expire = settings.REDIS_EXPIRE
+
+        for redis, group in self._groups(list(mapping)):
+            with redis.pipeline(transaction=False) as pipe:
+                for key in group:
+                    pipe.set(name=key, value=mapping[key], ex=expire)
+                pipe.execute()
+
+    @CACHE_STORAGE_DURATION.labels(operation="delete").time()
+    def delete(self, key: Any) -> bool:
+        return bool(self._redis(key).delete(key))
+
+    @CACHE_STORAGE_DURATION.labels(operation="delete_many").time()
+    def delete_many(self, keys: list[Any]) -> int:
+        if not keys:
+            return 0
+        return sum(redis.unlink(*group) for redis, group in self._groups(keys))
+
+    @CACHE_STORAGE_DURATION.labels(operation="add_tags").time()
+    def add_tags(self, keys: list[Any], tags: list[str], expire: int) -> None:
+        """Add ``keys`` to the tag sets, which live as long as their longest key."""
+        for redis, group in self._groups(tags):
+            with redis.pipeline(transaction=False) as pipe:
+                for tag in group:
+                    pipe.sadd(tag, *keys)
+                    pipe.expire(tag, expire, nx=True)
+                    pipe.expire(tag, expire, gt=True)
+                pipe.execute()
+
+    @CACHE_STORAGE_DURATION.labels(operation="delete_tagged").time()
+    def delete_tagged(self, tag: str) -> list[Any]:
+        """Unlink the members of a tag set in batches, then the set itself."""
+        batch_size = settings.CACHE_SCAN_BATCH
+        tag_redis = self._redis(tag)
+        deleted: list[Any] = []
+        batch: list[Any] = []
+        for key in tag_redis.sscan_iter(tag, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                self.delete_many(batch)
+                deleted.extend(batch)
+                batch = []
+        if batch:
+            self.delete_many(batch)
+            deleted.extend(batch)
+        tag_redis.unlink(tag)
+        return deleted
+
+    @CACHE_STORAGE_DURATION.labels(operation="delete_pattern").time()
+    def delete_pattern(self, pattern: str) -> int:
+        """Unlink the keys matching ``pattern`` with SCAN, never blocking Redis."""
+        batch_size = settings.CACHE_SCAN_BATCH
+        deleted = 0
+        for redis in self._instances():
+            batch: list[Any] = []
+            for key in redis.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += redis.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += redis.unlink(*batch)
+        return deleted
+
+    @CACHE_STORAGE_DURATION.labels(operation="acquire_lock").time()
+    def acquire_lock(self, key: Any, token: str, timeout: float) -> bool:
+        return bool(
+            self._redis(key).set(name=key, value=token, nx=True, px=int(timeout * 1000))
+        )
 
-    def delete(self, key: Any) -> None:
-        self.storage.delete(*key)
+    @CACHE_STORAGE_DURATION.labels(operation="release_lock").time()
+    def release_lock(self, key: Any, token: str) -> bool:
+        """Delete the lock only while it still holds ``token``."""
+        return bool(self._redis(key).eval(RELEASE_LOCK_SCRIPT, 1, key, token))
 
+    @CACHE_STORAGE_DURATION.labels(operation="exists").time()
     def exists(self, key: Any) -> bool:
-        return self.storage.exists(*key)
+        return bool(self._redis(key).exists(key))
 
     def flush(self) -> None:
-        self.storage.flushdb()
+        for redis in self._instances():
+            redis.flushdb()
@@ -0,0 +1,40 @@
+from typing import Any, Optional
+
+from redis import Redis
+
+from src.data.clients import ShardedRedisClient
+from src.data.storages.redis_storage import RedisStorage
+
+
+class ShardedRedisStorage(RedisStorage):
+    """
+    Redis cache storage spread over ``REDIS_NODES``.
+
+    Keys are routed by consistent hashing, multi-key operations are split
+    into one round trip per node and namespace clears scan every node. Tag
+    sets live on the node of the tag, their members wherever they hash.
+    ``storage`` is the first node, cache invalidation PubSub runs there.
+
+    Attributes:
+        client (ShardedRedisClient): Sharded Redis client.
+
+    Usage:
+        storage = ShardedRedisStorage()
+        storage.set_many({"a": b"1", "b": b"2"}, expire=60)
+    """
+
+    def __init__(self, client: Optional[ShardedRedisClient] = None):
+        self.client = client or ShardedRedisClient(decode_responses=False)
+        self.storage = self.client.redis
+
+    def _redis(self, key: Any) -> Redis:
+        return self.client.get_client(key)
+
+    def _groups(self, keys: list[Any]) -> list[tuple[Redis, list[Any]]]:
+        return [
+            (self.client.nodes[node], group)
+            for node, group in self.client.group(keys).items()
+        ]
+
+    def _instances(self) -> list[Redis]:
+        return list(self.client.nodes.values())
@@ -0,0 +1,21 @@
+import logging
+
+from django.conf import settings
+
+from src.core.celery import celery
+from src.core.config import get_storage
+from src.data.handlers.media_resolver import MediaUrlResolver
+
+logger = logging.getLogger(__name__)
+
+
+@celery.task(queue="tasks")
+def reconcile_media_index() -> int:
+    """Refresh the media index from a listing of the media folders."""
+    storage = get_storage()
+    object_keys = (
+        object_key
+        for folder in settings.MEDIA_INDEX_FOLDERS
+        for object_key in storage.list_object_keys(prefix=f"{folder}/")
+    )
+    return MediaUrlResolver().reconcile(object_keys)
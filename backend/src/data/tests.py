@@ -0,0 +1,636 @@
+import importlib.util
+import io
+import shutil
+import socket
+import subprocess
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import Optional
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+from redis import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.data.clients import HashRing, ShardedRedisClient
+from src.data.codecs import CacheCodec, get_event_codec
+from src.data.events import EventEnvelope, EventSchema
+from src.data.handlers import CacheHandler
+from src.data.handlers.redis_handler import LocalCache
+from src.data.interfaces import IMultipartClient
+from src.data.managers.handler_executor import (
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_OLDEST,
+    HandlerExecutor,
+)
+from src.data.storages import InMemoryStorage, ShardedRedisStorage
+from src.data.storages.multipart import MIN_PART_SIZE, MultipartUploader
+
+
+class FakeMultipartClient(IMultipartClient):
+    def __init__(self, fail_parts: Optional[set[int]] = None):
+        self.fail_parts = fail_parts or set()
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.completed: dict[str, bytes] = {}
+        self.aborted: list[str] = []
+        self.sent: list[int] = []
+
+    def create(self, full_object_key: str, content_type: Optional[str] = None) -> str:
+        upload_id = f"upload-{len(self.uploads) + len(self.aborted) + 1}"
+        self.uploads[upload_id] = {}
+        return upload_id
+
+    def upload_part(
+        self, full_object_key: str, upload_id: str, part_number: int, data: bytes
+    ) -> str:
+        if part_number in self.fail_parts:
+            raise IOError(f"Part {part_number} failed")
+        self.sent.append(part_number)
+        self.uploads[upload_id][part_number] = data
+        return f"etag-{part_number}"
+
+    def list_parts(self, full_object_key: str, upload_id: str) -> dict[int, str]:
+        return {number: f"etag-{number}" for number in self.uploads[upload_id]}
+
+    def complete(
+        self, full_object_key: str, upload_id: str, parts: dict[int, str]
+    ) -> None:
+        uploaded = self.uploads.pop(upload_id)
+        self.completed[full_object_key] = b"".join(
+            uploaded[number] for number in sorted(parts)
+        )
+
+    def abort(self, full_object_key: str, upload_id: str) -> None:
+        self.uploads.pop(upload_id)
+        self.aborted.append(upload_id)
+
+
+class MultipartUploaderTest(SimpleTestCase):
+    key = "products/1/video.mp4"
+    data = bytes(range(256)) * (MIN_PART_SIZE * 3 // 256 + 1)
+
+    def setUp(self):
+        self.client = FakeMultipartClient()
+        self.uploader = MultipartUploader(
+            self.client, part_size=MIN_PART_SIZE, workers=2, retries=0
+        )
+        # A single process, the in-memory state is shared by the uploads
+        self.uploader.state = CacheHandler(
+            pool_storage=InMemoryStorage(), namespace="multipart"
+        )
+        self.uploader.state.delete_value(key=self.key)
+
+    def upload(self, fingerprint: Optional[str] = "1:1") -> None:
+        self.uploader.upload(
+            self.key, io.BytesIO(self.data), len(self.data), fingerprint=fingerprint
+        )
+
+    def test_resume_uploads_missing_parts_only(self):
+        self.client.fail_parts = {3}
+        with self.assertRaises(IOError):
+            self.upload()
+        self.assertEqual(self.client.aborted, [])
+        uploaded = set(self.client.uploads["upload-1"])
+        self.assertIn(1, uploaded)
+
+        self.client.fail_parts = set()
+        self.client.sent = []
+        self.upload()
+
+        self.assertEqual(set(self.client.sent), {1, 2, 3, 4} - uploaded)
+        self.assertEqual(self.client.completed[self.key], self.data)
+        self.assertIsNone(self.uploader.state.get_value(key=self.key))
+
+    def test_changed_content_aborts_previous_upload(self):
+        self.client.fail_parts = {3}
+        with self.assertRaises(IOError):
+            self.upload(fingerprint="1:1")
+
+        self.client.fail_parts = set()
+        self.upload(fingerprint="1:2")
+
+        self.assertEqual(self.client.aborted, ["upload-1"])
+        self.assertEqual(self.client.completed[self.key], self.data)
+        self.assertEqual(self.client.uploads, {})
+
+    def test_upload_without_fingerprint_is_aborted_on_failure(self):
+        self.client.fail_parts = {2}
+        with self.assertRaises(IOError):
+            self.upload(fingerprint=None)
+
+        self.assertEqual(self.client.aborted, ["upload-1"])
+        self.assertEqual(self.client.uploads, {})
+
+
+class CacheCodecTest(SimpleTestCase):
+    value = {"name": "product", "tags": ["a", "b"], "price": 10}
+    large = {"description": "x" * 4096}
+
+    def test_small_values_are_stored_raw(self):
+        codec = CacheCodec(compression="zlib", threshold=1024)
+
+        data = codec.encode(self.value)
+
+        self.assertEqual(data[:1], CacheCodec.RAW)
+        self.assertEqual(codec.decode(data), self.value)
+
+    def test_large_values_are_compressed(self):
+        for compression, marker, package in (
+            ("zlib", CacheCodec.ZLIB, "zlib"),
+            ("lz4", CacheCodec.LZ4, "lz4"),
+            ("zstd", CacheCodec.ZSTD, "zstandard"),
+        ):
+            if importlib.util.find_spec(package) is None:
+                continue
+            with self.subTest(compression=compression):
+                codec = CacheCodec(compression=compression, threshold=1024)
+
+                data = codec.encode(self.large)
+
+                self.assertEqual(data[:1], marker)
+                self.assertLess(len(data), 4096)
+                self.assertEqual(codec.decode(data), self.large)
+
+    def test_values_without_compression_are_stored_raw(self):
+        codec = CacheCodec(compression=None)
+
+        data = codec.encode(self.large)
+
+        self.assertEqual(data[:1], CacheCodec.RAW)
+        self.assertEqual(codec.decode(data), self.large)
+
+    def test_entries_without_marker_decode_as_json(self):
+        codec = CacheCodec()
+
+        self.assertEqual(codec.decode(b'{"name": "product"}'), {"name": "product"})
+        self.assertEqual(codec.decode('["a", 1]'), ["a", 1])
+
+    def test_unknown_marker_is_a_miss(self):
+        codec = CacheCodec()
+
+        with self.assertLogs("src.data.codecs", level="WARNING"):
+            self.assertIsNone(codec.decode(b"\x07payload"))
+
+    def test_unknown_compression_is_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            CacheCodec(compression="brotli")
+
+
+class InMemoryStorageTest(SimpleTestCase):
+    def setUp(self):
+        self.storage = InMemoryStorage()
+        self.storage.flush()
+
+    def tearDown(self):
+        self.storage.flush()
+
+    def test_keys_expire(self):
+        self.storage.set(key="short", value=b"1", expire=timedelta(milliseconds=50))
+        self.storage.set(key="long", value=b"1", expire=60)
+
+        self.assertTrue(self.storage.exists("short"))
+        time.sleep(0.06)
+
+        self.assertIsNone(self.storage.get("short"))
+        self.assertEqual(self.storage.get("long"), b"1")
+        _, ttl = self.storage.get_with_ttl("long")
+        self.assertAlmostEqual(ttl, 60, delta=1)
+
+    def test_sweep_drops_expired_keys_and_tags(self):
+        expire = timedelta(milliseconds=50)
+        self.storage.set_many({"a": b"1", "b": b"1"}, expire=expire)
+        self.storage.set(key="c", value=b"1", expire=60)
+        self.storage.add_tags(["a", "b"], ["items"], expire=0)
+        time.sleep(0.06)
+
+        self.assertEqual(self.storage._sweep_expired(), 2)
+
+        self.assertEqual(list(InMemoryStorage._entries), ["c"])
+        self.assertEqual(InMemoryStorage._tags, {})
+        self.assertEqual(InMemoryStorage._bytes, 1)
+
+    @override_settings(CACHE_MEMORY_MAX_ENTRIES=3)
+    def test_least_recently_used_keys_are_evicted(self):
+        storage = InMemoryStorage()
+        storage.set_many({"a": b"1", "b": b"1", "c": b"1"}, expire=60)
+        storage.get("a")
+
+        storage.set(key="d", value=b"1", expire=60)
+
+        self.assertEqual(
+            storage.get_many(["a", "b", "c", "d"]), [b"1", None, b"1", b"1"]
+        )
+
+    @override_settings(CACHE_MEMORY_MAX_BYTES=10)
+    def test_byte_budget_evicts_keys(self):
+        storage = InMemoryStorage()
+        storage.set_many({"a": b"1234", "b": b"1234"}, expire=60)
+
+        storage.set(key="c", value=b"1234", expire=60)
+
+        self.assertEqual(storage.get_many(["a", "b", "c"]), [None, b"1234", b"1234"])
+        self.assertEqual(InMemoryStorage._bytes, 8)
+
+    def test_lock_is_released_by_its_owner_only(self):
+        self.assertTrue(self.storage.acquire_lock("lock", token="a", timeout=10))
+        self.assertFalse(self.storage.acquire_lock("lock", token="b", timeout=10))
+
+        self.assertFalse(self.storage.release_lock("lock", token="b"))
+        self.assertTrue(self.storage.release_lock("lock", token="a"))
+        self.assertTrue(self.storage.acquire_lock("lock", token="b", timeout=10))
+
+
+class LocalCacheTest(SimpleTestCase):
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = LocalCache(max_entries=2, max_bytes=1024)
+        cache.set("a", b"1", ttl=60)
+        cache.set("b", b"1", ttl=60)
+        cache.get("a")
+
+        cache.set("c", b"1", ttl=60)
+
+        self.assertEqual([cache.get(key) for key in "abc"], [b"1", None, b"1"])
+
+    def test_byte_budget_evicts_entries(self):
+        cache = LocalCache(max_entries=10, max_bytes=10)
+        cache.set("a", b"1234", ttl=60)
+        cache.set("b", b"1234", ttl=60)
+
+        cache.set("c", b"1234", ttl=60)
+
+        self.assertEqual([cache.get(key) for key in "abc"], [None, b"1234", b"1234"])
+        self.assertEqual(cache._bytes, 8)
+
+    def test_values_over_the_budget_are_not_kept(self):
+        cache = LocalCache(max_entries=10, max_bytes=10)
+        cache.set("a", b"1", ttl=60)
+
+        cache.set("a", b"x" * 11, ttl=60)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache._bytes, 0)
+
+    def test_entries_expire(self):
+        cache = LocalCache(max_entries=10, max_bytes=1024)
+        cache.set("a", b"1", ttl=0.05)
+        cache.set("b", b"1", ttl=0)
+
+        self.assertEqual(cache.get("a"), b"1")
+        self.assertIsNone(cache.get("b"))
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("a"))
+
+
+class OrderPaidEventSchema(EventSchema):
+    __event_version__ = 2
+
+    order_id: str
+
+
+class EventEnvelopeTest(SimpleTestCase):
+    def test_encode_and_decode_round_trip(self):
+        envelope = EventEnvelope(
+            type="order_paid",
+            payload={"order_id": "1"},
+            version=2,
+            timestamp=1700000000.5,
+            correlation_id="correlation",
+            reply_to="order_paid:reply",
+            delivery_id="1-0",
+        )
+
+        decoded = EventEnvelope.decode(envelope.encode(), event_name="other")
+
+        self.assertEqual(decoded, envelope)
+        self.assertIsNone(decoded.delivery_id)
+
+    def test_delivery_id_is_not_encoded(self):
+        envelope = EventEnvelope(type="order_paid", delivery_id="1-0")
+
+        self.assertNotIn("delivery_id", get_event_codec().decode(envelope.encode()))
+
+    def test_messages_without_envelope_are_wrapped(self):
+        decoded = EventEnvelope.decode(b'{"order_id": "1"}', event_name="order_paid")
+
+        self.assertEqual(decoded.type, "order_paid")
+        self.assertEqual(decoded.payload, {"order_id": "1"})
+        self.assertEqual(decoded.version, 1)
+
+    def test_create_takes_the_schema_version(self):
+        payload = OrderPaidEventSchema(order_id="1")
+
+        envelope = EventEnvelope.create("order_paid", payload)
+
+        self.assertEqual(envelope.version, 2)
+        self.assertIs(EventEnvelope.create("order_paid", envelope), envelope)
+
+
+class HandlerExecutorTest(SimpleTestCase):
+    def setUp(self):
+        self.processed: list[int] = []
+        self.dropped: list[int] = []
+        self.busy = threading.Event()
+        self.release = threading.Event()
+
+    def process(self, event_data: int) -> None:
+        self.busy.set()
+        self.release.wait(5)
+        self.processed.append(event_data)
+
+    def executor(self, overflow: str) -> HandlerExecutor:
+        """Return an executor with its single worker busy on event 1 and 2 queued."""
+        executor = HandlerExecutor(
+            "order_paid",
+            self.process,
+            workers=1,
+            queue_size=1,
+            overflow=overflow,
+            on_drop=self.dropped.append,
+        )
+        executor.start()
+        self.addCleanup(executor.shutdown, 5)
+        self.addCleanup(self.release.set)
+        executor.submit(1)
+        self.busy.wait(5)
+        executor.submit(2)
+        return executor
+
+    def test_drop_newest_rejects_the_submitted_event(self):
+        executor = self.executor(OVERFLOW_DROP_NEWEST)
+
+        self.assertFalse(executor.submit(3))
+
+        self.release.set()
+        executor.shutdown(timeout=5)
+        self.assertEqual(self.processed, [1, 2])
+        self.assertEqual(self.dropped, [3])
+
+    def test_drop_oldest_replaces_the_queued_event(self):
+        executor = self.executor(OVERFLOW_DROP_OLDEST)
+
+        self.assertTrue(executor.submit(3))
+
+        self.release.set()
+        executor.shutdown(timeout=5)
+        self.assertEqual(self.processed, [1, 3])
+        self.assertEqual(self.dropped, [2])
+
+    def test_block_waits_for_a_free_slot(self):
+        executor = self.executor(OVERFLOW_BLOCK)
+        producer = threading.Thread(target=executor.submit, args=(3,))
+
+        producer.start()
+        producer.join(0.05)
+        self.assertTrue(producer.is_alive())
+
+        self.release.set()
+        producer.join(5)
+        executor.shutdown(timeout=5)
+        self.assertEqual(self.processed, [1, 2, 3])
+        self.assertEqual(self.dropped, [])
+
+    def test_stopped_executor_rejects_events(self):
+        executor = self.executor(OVERFLOW_BLOCK)
+        self.release.set()
+        executor.shutdown(timeout=5)
+
+        self.assertFalse(executor.submit(3))
+        self.assertEqual(self.processed, [1, 2])
+
+    def test_unknown_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            HandlerExecutor("order_paid", self.process, overflow="drop_all")
+
+
+class GetOrSetTest(SimpleTestCase):
+    key = "listing"
+
+    def setUp(self):
+        self.storage = InMemoryStorage()
+        self.storage.flush()
+        self.handler = CacheHandler(pool_storage=self.storage, namespace="listings")
+        self.calls = 0
+
+    def loader(self, value: str = "new"):
+        def load() -> str:
+            self.calls += 1
+            return value
+
+        return load
+
+    def store_entry(self, value: str, delta: float, expires_in: float) -> None:
+        self.storage.set(
+            key=self.handler._key(self.key),
+            value=self.handler.codec.encode(
+                {"__cache_entry__": [value, delta, time.time() + expires_in]}
+            ),
+            expire=60,
+        )
+
+    def test_concurrent_misses_run_the_loader_once(self):
+        started, release = threading.Event(), threading.Event()
+        results: list[str] = []
+
+        def load() -> str:
+            self.calls += 1
+            started.set()
+            release.wait(5)
+            return "new"
+
+        def call() -> None:
+            results.append(self.handler.get_or_set(self.key, load, ttl=60))
+
+        threads = [threading.Thread(target=call) for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, ["new"] * 5)
+
+    def test_fresh_entry_is_served_from_cache(self):
+        self.store_entry("old", delta=0, expires_in=60)
+
+        self.assertEqual(self.handler.get_or_set(self.key, self.loader()), "old")
+        self.assertEqual(self.calls, 0)
+
+    @override_settings(CACHE_XFETCH_BETA=1_000_000)
+    def test_entry_near_expiry_is_refreshed_early(self):
+        self.store_entry("old", delta=1, expires_in=30)
+
+        self.assertEqual(self.handler.get_or_set(self.key, self.loader()), "new")
+        self.assertEqual(self.calls, 1)
+
+    def test_expired_entry_is_reloaded(self):
+        self.store_entry("old", delta=0, expires_in=-1)
+
+        self.assertEqual(self.handler.get_or_set(self.key, self.loader()), "new")
+        self.assertEqual(self.calls, 1)
+
+    def test_serve_stale_refreshes_in_background(self):
+        self.store_entry("old", delta=0, expires_in=-1)
+
+        value = self.handler.get_or_set(self.key, self.loader(), serve_stale=True)
+
+        self.assertEqual(value, "old")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            entry = self.handler._entry(self.storage.get(self.handler._key(self.key)))
+            if entry[0] == "new":
+                break
+            time.sleep(0.01)
+        self.assertEqual(entry[0], "new")
+        self.assertEqual(self.calls, 1)
+
+    def test_plain_values_of_the_key_are_a_miss(self):
+        for value in ("plain", ["a", 1, 2], {"__cache_entry__": "broken"}):
+            self.handler.set_value(key=self.key, value=value)
+
+            self.assertEqual(self.handler.get_or_set(self.key, self.loader()), "new")
+        self.assertEqual(self.calls, 3)
+
+
+class HashRingTest(SimpleTestCase):
+    nodes = ["redis-1:6379/0", "redis-2:6379/0", "redis-3:6379/0"]
+    keys = [f"cache:products:{number}" for number in range(10_000)]
+
+    def test_keys_are_spread_evenly(self):
+        ring = HashRing(self.nodes)
+
+        counts = Counter(ring.get_node(key) for key in self.keys)
+
+        self.assertEqual(set(counts), set(self.nodes))
+        for count in counts.values():
+            self.assertAlmostEqual(count / len(self.keys), 1 / 3, delta=0.05)
+
+    def test_added_node_takes_its_share_only(self):
+        ring = HashRing(self.nodes)
+        before = {key: ring.get_node(key) for key in self.keys}
+
+        ring.add_node("redis-4:6379/0")
+
+        moved = [key for key in self.keys if ring.get_node(key) != before[key]]
+        self.assertAlmostEqual(len(moved) / len(self.keys), 1 / 4, delta=0.05)
+        self.assertEqual({ring.get_node(key) for key in moved}, {"redis-4:6379/0"})
+
+    def test_removed_node_moves_its_keys_only(self):
+        ring = HashRing(self.nodes)
+        before = {key: ring.get_node(key) for key in self.keys}
+
+        ring.remove_node(self.nodes[0])
+
+        moved = {key for key in self.keys if ring.get_node(key) != before[key]}
+        owned = {key for key, node in before.items() if node == self.nodes[0]}
+        self.assertEqual(moved, owned)
+
+    def test_hash_tag_keys_share_a_node(self):
+        ring = HashRing(self.nodes)
+
+        nodes = {
+            ring.get_node(f"cache:auth:{{user:1}}:{suffix}")
+            for suffix in ("token", "profile", "orders")
+        }
+
+        self.assertEqual(len(nodes), 1)
+        self.assertEqual(HashRing.hash_tag("cache:{user:1}:token"), b"user:1")
+        self.assertEqual(HashRing.hash_tag("cache:{}:token"), b"cache:{}:token")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@skipUnless(shutil.which("redis-server"), "redis-server is not installed")
+class ShardedRedisStorageTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        password = settings.REDIS_PASSWORD or None
+        cls.servers: list[subprocess.Popen] = []
+        cls.nodes: list[str] = []
+        for _ in range(3):
+            port = _free_port()
+            command = ["redis-server", "--port", str(port), "--save", ""]
+            if password:
+                command += ["--requirepass", password]
+            cls.servers.append(
+                subprocess.Popen(
+                    command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            )
+            cls.nodes.append(f"127.0.0.1:{port}/0")
+
+        for node in cls.nodes:
+            host, port, _ = ShardedRedisClient.parse_node(node)
+            deadline = time.monotonic() + 10
+            while True:
+                try:
+                    Redis(host=host, port=port, password=password).ping()
+                    break
+                except RedisConnectionError:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.05)
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in cls.servers:
+            server.terminate()
+            server.wait()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.client = ShardedRedisClient(nodes=self.nodes, decode_responses=False)
+        self.storage = ShardedRedisStorage(client=self.client)
+        self.storage.flush()
+
+    def test_get_and_set_many_across_nodes(self):
+        mapping = {
+            f"cache:items:{number}": str(number).encode() for number in range(100)
+        }
+
+        self.storage.set_many(mapping, expire=60)
+
+        self.assertEqual(
+            {self.client.ring.get_node(key) for key in mapping}, set(self.nodes)
+        )
+        for key, value in mapping.items():
+            self.assertEqual(self.client.get_client(key).get(key), value)
+        self.assertEqual(
+            self.storage.get_many([*mapping, "cache:items:missing"]),
+            [*mapping.values(), None],
+        )
+
+    def test_tagged_keys_are_deleted_on_every_node(self):
+        keys = [f"cache:items:{number}" for number in range(30)]
+        self.storage.set_many(dict.fromkeys(keys, b"1"), expire=60)
+        self.storage.add_tags(keys, ["cache-tags:items"], expire=60)
+
+        deleted = self.storage.delete_tagged("cache-tags:items")
+
+        self.assertCountEqual(deleted, [key.encode() for key in keys])
+        self.assertEqual(self.storage.get_many(keys), [None] * len(keys))
+        self.assertFalse(self.storage.exists("cache-tags:items"))
+
+    def test_namespace_clear_scans_every_node(self):
+        products = [f"cache:products:{number}" for number in range(50)]
+        users = [f"cache:users:{number}" for number in range(50)]
+        self.storage.set_many(dict.fromkeys([*products, *users], b"1"), expire=60)
+
+        deleted = self.storage.delete_pattern("cache:products:*")
+
+        self.assertEqual(deleted, len(products))
+        self.assertEqual(self.storage.get_many(products), [None] * len(products))
+        self.assertEqual(self.storage.get_many(users), [b"1"] * len(users))
@@ -3,12 +3,13 @@ import logging
 import mimetypes
 import pathlib
 import posixpath
+import shutil
+import tempfile
 from mimetypes import guess_type
-from typing import BinaryIO, Optional, TypeVar, Union
+from typing import BinaryIO, Iterable, Iterator, Optional, TypeVar, Union
 from uuid import UUID
 
 from django.conf import settings
-from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from ninja import UploadedFile
 from PIL import Image
@@ -51,29 +52,83 @@ def path_file(
     return open(file_path, "rb")
 
 
+class IterStream(io.RawIOBase):
+    """Read-only file over an iterator of byte chunks, nothing is buffered."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk:
+            try:
+                self._chunk = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+StreamType = Union[BinaryIO, UploadedFile, bytes, Iterable[bytes]]
+
+
+def open_stream(
+    data: StreamType,
+    length: Optional[int] = None,
+) -> tuple[BinaryIO, int]:
+    """
+    Return a readable stream of ``data`` and its length in bytes.
+
+    Files are streamed as they are, a seekable file of unknown length is
+    measured without reading it. Iterators of chunks are wrapped, and only
+    when their length is unknown spooled to a temporary file, kept in memory
+    up to ``FILE_UPLOAD_MAX_MEMORY_SIZE``. The caller closes the returned
+    stream when it is not ``data`` itself.
+    """
+    if isinstance(data, UploadedFile):
+        data = data.file
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return io.BytesIO(data), len(data)
+
+    stream = data if hasattr(data, "read") else io.BufferedReader(IterStream(data))
+    if length is not None:
+        return stream, length
+
+    seekable = getattr(stream, "seekable", None)
+    if seekable and seekable():
+        position = stream.tell()
+        length = stream.seek(0, io.SEEK_END) - position
+        stream.seek(position)
+        return stream, length
+
+    spooled = tempfile.SpooledTemporaryFile(
+        max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+    )
+    shutil.copyfileobj(stream, spooled)
+    length = spooled.tell()
+    spooled.seek(0)
+    return spooled, length
+
+
 def upload_file(
     filename: str,
     file: UploadedFile | BinaryIO,
     content_type: Optional[str] = None,
 ) -> UploadedFile:
-    file_io = io.BytesIO()
-    if isinstance(file, UploadedFile):
-        contents = file.file.read()
-        file_io.write(contents)
-        file_size = len(contents)
-    else:
-        contents = file.read()
-        file_io.write(contents)
-        file_io.seek(0, io.SEEK_END)
-        file_size = file_io.tell()
-        file_io.seek(0)
+    """Wrap ``file`` for upload under its object name, without copying it."""
+    stream, file_size = open_stream(file)
 
     filename = clean_name(filename)
     if content_type:
         filename = filename.split(".")[0] + "." + content_type.split("/")[1]
 
     return UploadedFile(
-        file=file_io,
+        file=stream,
         name=filename,
         content_type=content_type or mimetypes.guess_type(filename)[0],
         size=file_size,
@@ -88,12 +143,9 @@ def get_content_type(file: UploadedFile) -> str:
     return guess_type(file.name)[0]
 
 
-def get_file_io(file: UploadedFile) -> io.BytesIO:
+def get_file_io(file: UploadedFile) -> BinaryIO:
     file.file.seek(0)
-    data = file.file.read()
-    file_io = io.BytesIO(data)
-    file_io.seek(0)
-    return file_io
+    return file.file
 
 
 def get_extension(content_type: str, custom_types: dict = None):
@@ -115,23 +167,23 @@ def get_extension(content_type: str, custom_types: dict = None):
 
 def resize_image(uploaded_file: UploadedFile, size=(200, 200)) -> UploadedFile:
     uploaded_file.file.seek(0)
-    original_data = uploaded_file.file.read()
 
-    with Image.open(io.BytesIO(original_data)) as image:
+    with Image.open(uploaded_file.file) as image:
         image.thumbnail(size, Image.Resampling.LANCZOS)
 
-        output = io.BytesIO()
+        output = tempfile.SpooledTemporaryFile(
+            max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+        )
         image.save(output, format=image.format)
-        output_data = output.getvalue()
-        logger.info("Resized image size: %s", len(output_data))
-
-        content_file = ContentFile(output_data)
+        output_size = output.tell()
+        output.seek(0)
+        logger.info("Resized image size: %s", output_size)
 
         new_file = UploadedFile(
-            file=content_file,
+            file=output,
             name=uploaded_file.name,
             content_type=uploaded_file.content_type,
-            size=len(output_data),
+            size=output_size,
         )
 
     return new_file
@@ -30,10 +30,7 @@ class FileService:
         )
 
     def get_avatar_url(self, avatar_key: str) -> Optional[str]:
-        avatar_url = self.avatar_handler.get_avatar(object_key=avatar_key)
-        if avatar_url:
-            return avatar_url.split("?")[0]
-        return None
+        return self.avatar_handler.get_avatar_url(object_key=avatar_key)
 
     def _delete_avatar(self, avatar_key: str) -> Optional[bool]:
         return self.avatar_handler.delete_avatar(object_key=avatar_key)
@@ -11,11 +11,14 @@ from ninja_extra.permissions.common import IsAuthenticated
 
 from src.common.responses import ORJSONResponse
 from src.common.schemas import MessageSchema
-from src.core.config import get_phone_handler, get_storage
+from src.core.config import (
+    get_cache_storage,
+    get_event_manager,
+    get_phone_handler,
+    get_storage,
+)
 from src.core.interceptors import AuthBearer
 from src.data.handlers import AvatarFileHandler, CacheHandler, EventHandler
-from src.data.managers import EventManager
-from src.data.storages import RedisStorage
 from src.files.services import FileService
 from src.users import errors as users_errors
 from src.users import schemas as users_schemas
@@ -35,8 +38,8 @@ class UsersController:
     user_repository = UserRepository()
     profile_repository = ProfileRepository()
     avatar_handler = AvatarFileHandler(storage=get_storage())
-    cache_handler = CacheHandler(pool_storage=RedisStorage())
-    event_handler = EventHandler(manager=EventManager())
+    cache_handler = CacheHandler(pool_storage=get_cache_storage(), namespace="users")
+    event_handler = EventHandler(manager=get_event_manager())
     phone_handler = get_phone_handler(
         cache=cache_handler,
         repository=profile_repository,
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from django.db import IntegrityError, transaction
 
+from src.data.handlers import RepositoryCache
 from src.users.interfaces import IProfileRepository
 from src.users.models import Profile
 
@@ -19,11 +20,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+profile_cache = RepositoryCache(Profile, key_field="user", pointer_fields=["id"])
+
 
 class ProfileRepository(IProfileRepository):
     def is_profile_exists(self, user_id: UUID) -> bool:
         return Profile.objects.filter(user__id=user_id).exists()
 
+    @profile_cache.lookup("user")
     def get_profile_by_user_id(
         self,
         user_id: UUID,
@@ -33,6 +37,7 @@ class ProfileRepository(IProfileRepository):
         except Profile.DoesNotExist:
             return None
 
+    @profile_cache.lookup("id")
     def get_profile_by_id(
         self,
         profile_id: UUID,
@@ -42,19 +47,31 @@ class ProfileRepository(IProfileRepository):
         except Profile.DoesNotExist:
             return None
 
+    @staticmethod
+    def _get_for_update(user_id: UUID) -> "ProfileType":
+        """Lock and return the fresh profile row, writes never use cached snapshots."""
+        return (
+            Profile.objects.select_for_update()
+            .select_related("user")
+            .get(user__id=user_id)
+        )
+
     def create_profile(
         self,
         user_id: UUID,
         profile_create: "ProfileCreateSchema",
     ) -> Optional["ProfileType"]:
         profile_data = profile_create.model_dump(exclude_none=True)
-        profile_data.update({"user_id": user_id})
 
         try:
-            profile_db = Profile(**profile_data)
-            profile_db.save()
+            # Idempotent, a redelivered or retried creation returns the profile
+            profile_db, created = Profile.objects.get_or_create(
+                user_id=user_id,
+                defaults=profile_data,
+            )
             logger.info(
-                "Profile created for user email: [blue]%s[/]",
+                "Profile %s for user email: [blue]%s[/]",
+                "created" if created else "already exists",
                 profile_db.user.email,
                 extra={"markup": True},
             )
@@ -74,12 +91,11 @@ class ProfileRepository(IProfileRepository):
     ) -> bool:
         try:
             with transaction.atomic():
-                profile_db = self.get_profile_by_user_id(user_id=user_id)
-                for field, value in profile_update.model_dump(
-                    exclude_unset=True
-                ).items():
+                profile_db = self._get_for_update(user_id=user_id)
+                update_data = profile_update.model_dump(exclude_unset=True)
+                for field, value in update_data.items():
                     setattr(profile_db, field, value)
-                profile_db.save()
+                profile_db.save(update_fields=[*update_data, "updated_at"])
             logger.info(
                 "Profile updated for user [blue]%s[/]",
                 profile_db.user.email,
@@ -99,7 +115,7 @@ class ProfileRepository(IProfileRepository):
         user_id: UUID,
     ) -> bool:
         try:
-            profile_db = self.get_profile_by_user_id(user_id=user_id)
+            profile_db = Profile.objects.select_related("user").get(user__id=user_id)
             profile_db_email = profile_db.user.email
             profile_db.delete()
             logger.info(
@@ -139,11 +155,12 @@ class ProfileRepository(IProfileRepository):
         phone_number: str,
     ) -> bool:
         try:
-            profile_db = self.get_profile_by_user_id(user_id=user_id)
-            if profile_db.phone is not None:
-                raise Exception("Phone already exists")
-            setattr(profile_db, "phone", phone_number)
-            profile_db.save()
+            with transaction.atomic():
+                profile_db = self._get_for_update(user_id=user_id)
+                if profile_db.phone is not None:
+                    raise Exception("Phone already exists")
+                setattr(profile_db, "phone", phone_number)
+                profile_db.save(update_fields=["phone", "updated_at"])
             logger.info(
                 "Profile phone created for user [blue]%s[/] with phone [blue]%s[/]",
                 profile_db.user.email,
@@ -165,13 +182,14 @@ class ProfileRepository(IProfileRepository):
         phone_number: str,
     ) -> bool:
         try:
-            profile_db = self.get_profile_by_user_id(user_id=user_id)
-            if profile_db.phone == phone_number:
-                raise Exception(f"This phone {phone_number} number already exists")
-            if profile_db.phone is None:
-                raise Exception("Phone does not exist, please create it first")
-            setattr(profile_db, "phone", phone_number)
-            profile_db.save()
+            with transaction.atomic():
+                profile_db = self._get_for_update(user_id=user_id)
+                if profile_db.phone == phone_number:
+                    raise Exception(f"This phone {phone_number} number already exists")
+                if profile_db.phone is None:
+                    raise Exception("Phone does not exist, please create it first")
+                setattr(profile_db, "phone", phone_number)
+                profile_db.save(update_fields=["phone", "updated_at"])
             logger.info(
                 "Profile phone updated for user [blue]%s[/], with new phone [blue]%s[/]",
                 profile_db.user.email,
@@ -192,12 +210,13 @@ class ProfileRepository(IProfileRepository):
         user_id: UUID,
     ) -> bool:
         try:
-            profile_db = self.get_profile_by_user_id(user_id=user_id)
-            if profile_db.phone is None:
-                raise Exception("Phone does not exist")
-            profile_delete_phone = profile_db.phone
-            setattr(profile_db, "phone", None)
-            profile_db.save()
+            with transaction.atomic():
+                profile_db = self._get_for_update(user_id=user_id)
+                if profile_db.phone is None:
+                    raise Exception("Phone does not exist")
+                profile_delete_phone = profile_db.phone
+                setattr(profile_db, "phone", None)
+                profile_db.save(update_fields=["phone", "updated_at"])
 
             logger.info(
                 "Profile phone: [blue]%s[/] deleted",
@@ -5,6 +5,7 @@ from uuid import UUID
 from django.contrib.auth import get_user_model
 from django.db import transaction
 
+from src.data.handlers import RepositoryCache
 from src.users.interfaces import IUserRepository
 
 if TYPE_CHECKING:
@@ -15,6 +16,13 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+user_cache = RepositoryCache(
+    User,
+    key_field="id",
+    pointer_fields=["email", "username"],
+    exclude_fields=["password"],
+)
+
 
 class UserRepository(IUserRepository):
     def is_user_exists(
@@ -26,6 +34,7 @@ class UserRepository(IUserRepository):
     def is_superuser_exists(self) -> bool:
         return User.objects.filter(is_superuser=True).exists()
 
+    @user_cache.lookup("id")
     def get_user_by_id(
         self,
         user_id: UUID,
@@ -35,6 +44,7 @@ class UserRepository(IUserRepository):
         except User.DoesNotExist:
             return None
 
+    @user_cache.lookup("email")
     def get_user_by_email(
         self,
         email: str,
@@ -44,6 +54,7 @@ class UserRepository(IUserRepository):
         except User.DoesNotExist:
             return None
 
+    @user_cache.lookup("username")
     def get_user_by_username(
         self,
         username: str,
@@ -105,10 +116,12 @@ class UserRepository(IUserRepository):
     ) -> Optional["UserType"]:
         try:
             with transaction.atomic():
-                user_db = self.get_user_by_id(user_id=user_id)
-                for field, value in user_update.model_dump(exclude_unset=True).items():
+                # Locked fresh row, cached snapshots would overwrite newer writes
+                user_db = User.objects.select_for_update().get(id=user_id)
+                update_data = user_update.model_dump(exclude_unset=True)
+                for field, value in update_data.items():
                     setattr(user_db, field, value)
-                user_db.save()
+                user_db.save(update_fields=list(update_data))
                 logger.info(
                     "User updated successfully with email [blue]%s[/]",
                     user_db.email,
@@ -1,3 +1,9 @@
+from src.users.schemas.event_schema import (
+    ProfileCreatedEventSchema,
+    ProfileUpdatedEventSchema,
+    UserCreatedEventSchema,
+    UserUpdatedEventSchema,
+)
 from src.users.schemas.profile_schema import (
     PhoneCodeSchema,
     PhoneNumberSchema,
@@ -40,4 +46,9 @@ __all__ = [
     "ProfileUpdateSchema",
     "PhoneNumberSchema",
     "PhoneCodeSchema",
+    # Event schemas
+    "UserCreatedEventSchema",
+    "ProfileCreatedEventSchema",
+    "UserUpdatedEventSchema",
+    "ProfileUpdatedEventSchema",
 ]
@@ -0,0 +1,25 @@
+from uuid import UUID
+
+from src.data.events import EventSchema
+from src.users.schemas.profile_schema import ProfileCreateSchema, ProfileUpdateSchema
+
+
+class UserCreatedEventSchema(EventSchema):
+    user_id: str
+    profile_create_schema: ProfileCreateSchema
+
+
+class ProfileCreatedEventSchema(EventSchema):
+    user_id: str
+    is_created: bool
+    profile_data: dict = {}
+
+
+class UserUpdatedEventSchema(EventSchema):
+    user_id: UUID
+    profile_update: ProfileUpdateSchema
+
+
+class ProfileUpdatedEventSchema(EventSchema):
+    user_id: UUID
+    is_updated: bool
@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING, Optional, cast
 from uuid import UUID
 
+from celery.exceptions import TimeoutError as TaskTimeoutError
+from django.conf import settings
 from ninja_extra.exceptions import APIException
 
 from src.common.responses import ORJSONResponse
@@ -10,8 +12,12 @@ from src.users import schemas as profile_schemas
 from src.users.schemas import (
     PhoneCodeSchema,
     PhoneNumberSchema,
+    ProfileCreatedEventSchema,
     ProfileCreateSchema,
+    ProfileUpdatedEventSchema,
     ProfileUpdateSchema,
+    UserCreatedEventSchema,
+    UserUpdatedEventSchema,
 )
 from src.users.tasks import create_profile_task, delete_profile_task
 from src.users.utils import generate_code
@@ -74,7 +80,12 @@ class ProfileService:
             user_id=user_id,
             profile_create_data=profile_create_schema.model_dump(),
         )
-        profile_id = task.get(timeout=timeout)
+        try:
+            profile_id = task.get(timeout=timeout)
+        except TaskTimeoutError:
+            # Not retried, the requester gives up after EVENT_REQUEST_TIMEOUT
+            logger.error("Profile creation timed out for user %s", user_id)
+            return None
         if not profile_id:
             logger.error("Profile creation failed")
         logger.info(
@@ -113,85 +124,68 @@ class ProfileService:
         )
         return is_deleted
 
-    def handle_user_created(self):
-        self.event.subscribe("user_created")
-        while True:
-            event_data = self.event.receive("user_created")
-            if event_data:
-                logger.info(
-                    "[green]%s[/] got data: [blue]%s[/]",
-                    self.handle_user_updated.__name__,
-                    event_data,
-                    extra={"markup": True},
-                )
-
-                if event_data["user_id"] and event_data["profile_create_schema"]:
-                    user_id = event_data["user_id"]
-                    profile_create_schema = ProfileCreateSchema(
-                        birth_date=event_data["profile_create_schema"]["birth_date"],
-                    )
-                    profile_id = self.create_profile(
-                        profile_create_schema=profile_create_schema,
-                        user_id=user_id,
-                    )
-                    profile_db = self.profile_repository.get_profile_by_id(
-                        profile_id=UUID(profile_id),
-                    )
-                    is_created = bool(profile_db)
-                    profile_data = (
-                        profile_db.to_dict(include=["id", "birth_date"])
-                        if profile_db
-                        else {}
-                    )
-
-                    if profile_db:
-                        logger.info(
-                            "[bold green]Profile created for user: [yellow]%s[/][/]",
-                            str(profile_db.user_id),
-                            extra={"markup": True},
-                        )
-                    else:
-                        logger.info(
-                            "[bold red]Profile not created for user:[yellow]%s[/][/]",
-                            user_id,
-                            extra={"markup": True},
-                        )
+    def handle_user_created(
+        self,
+        event: UserCreatedEventSchema,
+    ) -> ProfileCreatedEventSchema:
+        logger.info(
+            "[green]%s[/] got data: [blue]%s[/]",
+            self.handle_user_created.__name__,
+            event,
+            extra={"markup": True},
+        )
+        user_id = event.user_id
+        profile_id = self.create_profile(
+            profile_create_schema=event.profile_create_schema,
+            user_id=user_id,
+            timeout=settings.EVENT_TASK_TIMEOUT,
+        )
+        profile_db = (
+            self.profile_repository.get_profile_by_id(
+                profile_id=UUID(profile_id),
+            )
+            if profile_id
+            else None
+        )
+        is_created = bool(profile_db)
+        profile_data = (
+            profile_db.to_dict(include=["id", "birth_date"]) if profile_db else {}
+        )
 
-                    # Notify that the profile has been created
-                    self.event.publish(
-                        "profile_created",
-                        {
-                            "user_id": user_id,
-                            "is_created": is_created,
-                            "profile_data": profile_data,
-                        },
-                    )
-                    logger.info(
-                        "Publishing profile_created event for profile ID: %s",
-                        profile_id,
-                    )
+        if profile_db:
+            logger.info(
+                "[bold green]Profile created for user: [yellow]%s[/][/]",
+                str(profile_db.user_id),
+                extra={"markup": True},
+            )
+        else:
+            logger.info(
+                "[bold red]Profile not created for user:[yellow]%s[/][/]",
+                user_id,
+                extra={"markup": True},
+            )
 
-    def handle_user_updated(self):
-        self.event.subscribe("user_updated")
-        while True:
-            event_data = self.event.receive("user_updated")
-            if event_data:
-                if event_data["user_id"] and event_data["profile_update"]:
-                    user_id = event_data["user_id"]
-                    profile_update = event_data["profile_update"]
+        # Reply to the registration request waiting for the profile
+        logger.info(
+            "Replying profile_created for profile ID: %s",
+            profile_id,
+        )
+        return ProfileCreatedEventSchema(
+            user_id=user_id,
+            is_created=is_created,
+            profile_data=profile_data,
+        )
 
-                    if self.profile_repository.update_profile(
-                        profile_update=ProfileUpdateSchema(**profile_update),
-                        user_id=user_id,
-                    ):
-                        is_updated = True
-                    else:
-                        is_updated = False
+    def handle_user_updated(self, event: UserUpdatedEventSchema) -> None:
+        is_updated = self.profile_repository.update_profile(
+            profile_update=event.profile_update,
+            user_id=event.user_id,
+        )
 
-                    self.event.publish(
-                        "profile_updated",
-                        {"user_id": user_id, "is_updated": is_updated},
-                    )
+        self.event.publish(
+            "profile_updated",
+            ProfileUpdatedEventSchema(user_id=event.user_id, is_updated=is_updated),
+        )
 
     def register_phone(
         self,
@@ -152,10 +152,10 @@ class UserService:
             if user:
                 self.event.publish(
                     event_name="user_updated",
-                    event_data={
-                        "user_id": user_id,
-                        "profile_update": profile_update.model_dump(),
-                    },
+                    event_data=user_schemas.UserUpdatedEventSchema(
+                        user_id=user_id,
+                        profile_update=profile_update,
+                    ),
                 )
 
         except APIException: